@@ -0,0 +1,90 @@
+"""
+Benchmark de rotación de procesos (creación y terminación continuas).
+
+Mantiene una población fija de procesos vivos y, en cada paso, termina el
+más antiguo y crea uno nuevo. Con la cola FIFO de borrado perezoso y los
+índices de páginas por proceso, el coste por operación debe mantenerse
+constante al crecer la RAM; como referencia se incluye la cola FIFO
+original, que reconstruye la cola completa en cada terminación.
+
+    python benchmarks/churn.py [--operations N]
+"""
+
+import argparse
+import os
+import sys
+import time
+from collections import deque
+from typing import Iterable
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from config import Config  # noqa: E402
+from memory_manager import MemoryManager  # noqa: E402
+from replacement import FIFOReplacement, ReplacementAlgorithm  # noqa: E402
+
+PAGE_SIZE_KB = 4
+PAGES_PER_PROCESS = 8
+
+
+class RebuildFIFOReplacement(ReplacementAlgorithm):
+    """FIFO original: reconstruye la cola entera al terminar un proceso."""
+
+    name = "FIFO (reconstrucción)"
+
+    def __init__(self) -> None:
+        self.queue = deque()
+
+    def page_loaded(self, pid: int, page_number: int, entry) -> None:
+        self.queue.append((pid, page_number))
+
+    def page_removed(self, pid: int, page_number: int) -> None:
+        self.queue.remove((pid, page_number))
+
+    def remove_process(self, pid: int, pages: Iterable[int]) -> None:
+        self.queue = deque([(p, pg) for (p, pg) in self.queue if p != pid])
+
+    def select_victim(self):
+        return self.queue.popleft()
+
+    def __len__(self) -> int:
+        return len(self.queue)
+
+
+def run(ram_frames: int, operations: int, policy: ReplacementAlgorithm) -> float:
+    """Devuelve microsegundos por par terminar + crear."""
+    config = Config("")
+    config.values.page_size_kb = PAGE_SIZE_KB
+    config.values.ram_size_kb = ram_frames * PAGE_SIZE_KB
+    config.values.swap_size_kb = 2 * ram_frames * PAGE_SIZE_KB
+    manager = MemoryManager(config, policy)
+    size_kb = PAGES_PER_PROCESS * PAGE_SIZE_KB
+    live = deque()
+    # Población estable que llena la RAM
+    for _ in range(ram_frames // PAGES_PER_PROCESS):
+        process = manager.new_process(size_kb)
+        manager.load_process(process)
+        live.append(process.pid)
+    start = time.perf_counter()
+    for _ in range(operations):
+        manager.remove_process(live.popleft())
+        process = manager.new_process(size_kb)
+        manager.load_process(process)
+        live.append(process.pid)
+    return (time.perf_counter() - start) / operations * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--operations", type=int, default=2000, help="pares terminar+crear por tamaño")
+    args = parser.parse_args()
+
+    print(f"{'marcos RAM':>12} {'FIFO perezosa (µs/op)':>24} {'FIFO reconstrucción (µs/op)':>30}")
+    for ram_frames in (1_024, 4_096, 16_384, 65_536):
+        lazy = run(ram_frames, args.operations, FIFOReplacement())
+        rebuild = run(ram_frames, args.operations, RebuildFIFOReplacement())
+        print(f"{ram_frames:>12} {lazy:>24.1f} {rebuild:>30.1f}")
+
+
+if __name__ == "__main__":
+    main()
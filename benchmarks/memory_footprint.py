@@ -0,0 +1,109 @@
+"""
+Mide la memoria por página de las representaciones del simulador.
+
+Compara la representación original (tabla de páginas como diccionario de
+dataclasses sin ``__slots__`` y marcos sin ``__slots__``) con la actual
+(dataclasses con ``__slots__`` y tabla de páginas densa en una lista) y, si
+NumPy está instalado, con las columnas del motor ``arrays``.
+
+    python benchmarks/memory_footprint.py [--pages N]
+"""
+
+import argparse
+import os
+import sys
+import tracemalloc
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from memory_manager import Frame  # noqa: E402
+from process import Process  # noqa: E402
+
+
+@dataclass
+class LegacyPageTableEntry:
+    present: bool = False
+    frame_index: Optional[int] = None
+    swap_index: Optional[int] = None
+    referenced: bool = False
+
+
+@dataclass
+class LegacyFrame:
+    process_id: Optional[int] = None
+    page_number: Optional[int] = None
+
+
+def measure(build: Callable[[], object]) -> int:
+    """Bytes retenidos por el objeto que devuelve ``build``."""
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    obj = build()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del obj
+    return after - before
+
+
+def populated(entries, frames) -> None:
+    # Valores típicos de una página residente, para no medir solo entradas vacías
+    for i, entry in enumerate(entries):
+        entry.present = True
+        entry.frame_index = i
+    for i, frame in enumerate(frames):
+        frame.process_id = 1
+        frame.page_number = i
+
+
+def legacy(pages: int):
+    table = {i: LegacyPageTableEntry() for i in range(pages)}
+    frames = [LegacyFrame() for _ in range(pages)]
+    populated(table.values(), frames)
+    return table, frames
+
+
+def compact(pages: int):
+    process = Process(pages, 1)
+    frames = [Frame() for _ in range(pages)]
+    populated(process.page_table, frames)
+    return process, frames
+
+
+def arrays(pages: int):
+    from array_engine import FREE, PageColumns, np
+
+    columns = PageColumns(pages)
+    columns.present[:] = True
+    columns.frame[:] = np.arange(pages, dtype=np.int32)
+    owners = np.full(pages, FREE, dtype=np.int32)
+    frame_pages = np.arange(pages, dtype=np.int32)
+    return columns, owners, frame_pages
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pages", type=int, default=200_000, help="páginas (y marcos) a crear")
+    args = parser.parse_args()
+    pages = args.pages
+
+    results = [
+        ("original (dict + dataclass)", measure(lambda: legacy(pages))),
+        ("compacta (lista + __slots__)", measure(lambda: compact(pages))),
+    ]
+    try:
+        import array_engine  # noqa: F401  (importar fuera de la medición)
+
+        results.append(("arrays (NumPy)", measure(lambda: arrays(pages))))
+    except ImportError:
+        print("NumPy no está instalado; se omite el motor 'arrays'.")
+
+    base = results[0][1]
+    print(f"Páginas residentes: {pages} (tabla de páginas + marco de RAM por página)")
+    for name, total in results:
+        print(f"{name:30s} {total / pages:8.1f} bytes/página  ({base / total:4.1f}x menos que el original)")
+
+
+if __name__ == "__main__":
+    main()
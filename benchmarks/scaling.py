@@ -0,0 +1,183 @@
+"""
+Benchmark de escalado del modo multi-CPU (``[CPU]`` en config.ini).
+
+Para cada número de hilos se crea un ``ConcurrentMemoryManager`` con una
+CPU por hilo, un proceso compartido y un proceso privado por hilo que
+juntos ocupan el doble de la RAM. Cada hilo, ligado a su CPU, reproduce su
+propia traza de ``workloads.py``: una fracción ``--shared`` de los accesos
+va al proceso compartido (contención en su cerrojo y TLB shootdowns entre
+CPU) y el resto a su proceso privado.
+
+Se informa de los accesos por segundo (tiempo real, todos los hilos), la
+tasa de fallos, los shootdowns y las IPI, y por clase de cerrojo el
+porcentaje de adquisiciones que tuvieron que esperar y el tiempo esperado.
+Como referencia se mide también el gestor secuencial con un solo hilo, que
+no toma ningún cerrojo.
+
+Con el GIL de CPython los accesos no se ejecutan en paralelo, así que el
+rendimiento no crece con los hilos: lo que interesa es cómo evolucionan la
+contención y los shootdowns.
+
+    python benchmarks/scaling.py [--threads 1 2 4 8] [--frames N]
+        [--workload zipf] [--accesses N] [--shared 0.25] [--set CLAVE=VALOR ...]
+        [-o resultados.json]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import threading
+import time
+from typing import Any, Dict, List, Mapping, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from config import Config  # noqa: E402
+from memory_manager import MemoryManager  # noqa: E402
+from multicpu import LOCK_CLASSES, ConcurrentMemoryManager  # noqa: E402
+from workloads import WORKLOADS, generate  # noqa: E402
+
+PAGE_SIZE_KB = 4
+
+
+def make_config(frames: int, threads: int, overrides: Mapping[str, Any]) -> Config:
+    config = Config("")
+    config.apply_overrides({
+        "page_size_kb": PAGE_SIZE_KB,
+        "ram_size_kb": frames * PAGE_SIZE_KB,
+        "swap_size_kb": 2 * frames * PAGE_SIZE_KB,
+        "cpus": threads,
+    })
+    config.apply_overrides(overrides)
+    return config
+
+
+def build_traces(
+    manager: MemoryManager, frames: int, threads: int, args: argparse.Namespace
+) -> List[List[Tuple[int, int]]]:
+    """Crea los procesos y devuelve la traza (pid, página) de cada hilo."""
+    pages = max(1, 2 * frames // (threads + 1))
+    processes = [manager.new_process(pages * PAGE_SIZE_KB) for _ in range(threads + 1)]
+    for process in processes:
+        manager.load_process(process)
+    shared = processes[0].pid
+    traces = []
+    for index in range(threads):
+        private = processes[index + 1].pid
+        rng = random.Random(args.seed + index)
+        virtual = generate(args.workload, pages, args.accesses, args.seed + index)
+        traces.append([(shared if rng.random() < args.shared else private, page) for page in virtual])
+    return traces
+
+
+def run_threads(manager: MemoryManager, traces: List[List[Tuple[int, int]]]) -> float:
+    """Reproduce cada traza en su hilo y devuelve los segundos de tiempo real."""
+    barrier = threading.Barrier(len(traces) + 1)
+
+    def worker(index: int, trace: List[Tuple[int, int]]) -> None:
+        if isinstance(manager, ConcurrentMemoryManager):
+            manager.bind_cpu(index)
+        access = manager.access
+        barrier.wait()
+        for pid, page in trace:
+            access(pid, page)
+
+    threads = [threading.Thread(target=worker, args=(i, trace)) for i, trace in enumerate(traces)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def bench(frames: int, threads: int, args: argparse.Namespace, overrides: Mapping[str, Any], sequential: bool) -> Dict[str, Any]:
+    config = make_config(frames, threads, overrides)
+    manager = MemoryManager(config) if sequential else ConcurrentMemoryManager(config)
+    traces = build_traces(manager, frames, threads, args)
+    elapsed = run_threads(manager, traces)
+    metrics = manager.get_metrics_dict()
+    manager.close()
+    accesses = sum(len(trace) for trace in traces)
+    result: Dict[str, Any] = {
+        "threads": threads,
+        "sequential": sequential,
+        "accesses": accesses,
+        "seconds": elapsed,
+        "accesses_per_sec": accesses / elapsed if elapsed else 0.0,
+        "page_fault_rate": metrics["page_fault_rate"],
+        "tlb_hit_ratio": metrics["tlb_hit_ratio"],
+    }
+    if not sequential:
+        result["tlb_shootdowns"] = metrics["tlb_shootdowns"]
+        result["shootdown_ipis"] = metrics["shootdown_ipis"]
+        result["locks"] = metrics["locks"]
+    return result
+
+
+def contention(lock: Dict[str, int]) -> float:
+    return lock["contended"] / lock["acquisitions"] * 100 if lock["acquisitions"] else 0.0
+
+
+def parse_overrides(items: List[str]) -> Dict[str, str]:
+    overrides = {}
+    for item in items:
+        key, sep, value = item.partition("=")
+        if not sep:
+            raise SystemExit(f"--set espera CLAVE=VALOR: {item!r}")
+        overrides[key.strip()] = value
+    return overrides
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-o", "--output", help="archivo JSON de resultados")
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8], help="números de hilos (y CPU)")
+    parser.add_argument("--frames", type=int, default=4_096, help="tamaño de la RAM en marcos")
+    parser.add_argument("--workload", default="zipf", choices=list(WORKLOADS))
+    parser.add_argument("--accesses", type=int, default=50_000, help="accesos por hilo")
+    parser.add_argument("--shared", type=float, default=0.25, help="fracción de accesos al proceso compartido")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--set", dest="overrides", action="append", default=[], metavar="CLAVE=VALOR",
+                        help="sustituye un valor de configuración (p. ej. replacement_algorithm=lru)")
+    args = parser.parse_args()
+    overrides = parse_overrides(args.overrides)
+
+    runs = [bench(args.frames, 1, args, overrides, sequential=True)]
+    runs.extend(bench(args.frames, threads, args, overrides, sequential=False) for threads in args.threads)
+
+    header = f"{'hilos':>10} {'accesos/s':>12} {'fallos %':>9} {'shootdowns':>11} {'IPI':>8}"
+    header += "".join(f" {name + ' %':>15}" for name in LOCK_CLASSES)
+    print(header)
+    for run in runs:
+        label = "1 (sec.)" if run["sequential"] else str(run["threads"])
+        line = f"{label:>10} {run['accesses_per_sec']:>12,.0f} {run['page_fault_rate']:>9.2f}"
+        if run["sequential"]:
+            print(line)
+            continue
+        line += f" {run['tlb_shootdowns']:>11} {run['shootdown_ipis']:>8}"
+        line += "".join(f" {contention(run['locks'][name]):>15.3f}" for name in LOCK_CLASSES)
+        print(line)
+
+    if args.output:
+        results = {
+            "meta": {
+                "frames": args.frames,
+                "workload": args.workload,
+                "accesses": args.accesses,
+                "shared": args.shared,
+                "seed": args.seed,
+                "overrides": overrides,
+            },
+            "runs": runs,
+        }
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+            f.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Benchmark del arranque en frío de ``src/main.py``.
+
+Lanza el simulador como lo haría un trabajo por lotes, cada vez en un
+proceso nuevo y desde un directorio temporal (la configuración debe
+encontrarse igualmente), y mide el tiempo real hasta que termina:
+
+* ``python``: el intérprete sin hacer nada, como referencia;
+* ``menu``: el menú con un guion que solo sale (``--script`` con ``0``);
+* ``replay``: la reproducción de una traza mínima con ``--json``;
+* ``help``: ``--help`` (solo construye el analizador de argumentos).
+
+Se informa de la mediana y el mínimo de ``--runs`` ejecuciones y del coste
+por encima del intérprete. El programa termina con código 1 si la mediana
+de ``replay`` supera ``--target-ms``. Con ``--imports`` se muestran además
+los módulos que más tardan en importarse en ``replay`` (``-X importtime``).
+
+    python benchmarks/startup.py [--runs N] [--target-ms MS] [--imports] [-o resultados.json]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Tuple
+
+MAIN = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src", "main.py")
+TRACE = "C 1 512\nA 1 0\nA 1 1\nT 1\n"
+DEFAULT_TARGET_MS = 150.0
+
+
+def measure(command: List[str], cwd: str, runs: int) -> Tuple[float, float]:
+    """Mediana y mínimo en milisegundos de ``runs`` ejecuciones."""
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(command, cwd=cwd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times), min(times)
+
+
+def slowest_imports(command: List[str], cwd: str, count: int) -> List[Tuple[int, str]]:
+    """Módulos de primer nivel con mayor tiempo de importación acumulado (µs)."""
+    result = subprocess.run(
+        [command[0], "-X", "importtime", *command[1:]], cwd=cwd, capture_output=True, text=True, check=True
+    )
+    imports = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not name.startswith("  "):
+            imports.append((int(cumulative), name.strip()))
+    return sorted(imports, reverse=True)[:count]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20, help="ejecuciones por caso")
+    parser.add_argument("--target-ms", type=float, default=DEFAULT_TARGET_MS,
+                        help=f"mediana máxima de 'replay' en ms (por defecto {DEFAULT_TARGET_MS:g})")
+    parser.add_argument("--imports", action="store_true", help="muestra los módulos más lentos de importar")
+    parser.add_argument("-o", "--output", help="archivo JSON de resultados")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        trace = os.path.join(workdir, "traza.txt")
+        script = os.path.join(workdir, "guion.txt")
+        with open(trace, "w", encoding="utf-8") as f:
+            f.write(TRACE)
+        with open(script, "w", encoding="utf-8") as f:
+            f.write("0\n")
+        cases: Dict[str, List[str]] = {
+            "python": [sys.executable, "-c", "pass"],
+            "menu": [sys.executable, MAIN, "--script", script],
+            "replay": [sys.executable, MAIN, "replay", trace, "--json"],
+            "help": [sys.executable, MAIN, "--help"],
+        }
+        # Una ejecución previa genera los .pyc, como en cualquier uso repetido
+        measure(cases["replay"], workdir, 1)
+        results = {}
+        for name, command in cases.items():
+            median, best = measure(command, workdir, args.runs)
+            results[name] = {"median_ms": median, "min_ms": best}
+        imports = slowest_imports(cases["replay"], workdir, 10) if args.imports else []
+
+    baseline = results["python"]["median_ms"]
+    print(f"{'caso':8s} {'mediana ms':>11s} {'mínimo ms':>10s} {'sobre python':>13s}")
+    for name, result in results.items():
+        extra = result["median_ms"] - baseline
+        print(f"{name:8s} {result['median_ms']:>11.1f} {result['min_ms']:>10.1f} {extra:>13.1f}")
+    if imports:
+        print("\nImportaciones más lentas en 'replay' (acumulado):")
+        for micros, name in imports:
+            print(f"  {micros / 1000:>7.1f} ms  {name}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"runs": args.runs, "target_ms": args.target_ms, "results": results}, f, indent=2)
+            f.write("\n")
+    replay = results["replay"]["median_ms"]
+    if replay > args.target_ms:
+        print(f"La mediana de 'replay' ({replay:.1f} ms) supera el objetivo de {args.target_ms:g} ms", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
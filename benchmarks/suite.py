@@ -0,0 +1,297 @@
+"""
+Suite de benchmarks de las rutas críticas de MemoryManager.
+
+Para cada tamaño de RAM (de 8 a 10⁶ marcos por defecto) y cada carga de
+trabajo de ``workloads.py`` se crea un gestor con cuatro procesos que
+ocupan el doble de la RAM y se mide:
+
+* accesos por segundo de ``access_page`` (con mensajes) y, repitiendo la
+  traza sobre el mismo gestor, de ``access`` (ruta rápida), además de la
+  tasa de fallos y de aciertos de TLB de la primera pasada;
+* el tiempo de carga de los procesos con ``add_process``.
+
+Por tamaño se mide también la rotación de procesos (``remove_process`` +
+``add_process`` por segundo con la RAM llena de procesos pequeños) y la
+memoria máxima (tracemalloc) de crear el gestor, cargar los procesos y
+ejecutar la traza uniforme.
+
+Los tiempos son el mejor de ``--repeat`` repeticiones con gestores
+nuevos. Los resultados se escriben en JSON. Con ``--compare`` se comparan
+contra los de otra ejecución (por ejemplo, de otro commit) y el programa
+termina con código 1 si alguna métrica empeora más que ``--threshold`` por
+ciento; un cambio en la tasa de fallos o de aciertos de TLB se señala
+aparte, porque indica que ha cambiado el comportamiento y no solo el coste.
+
+    python benchmarks/suite.py [-o resultados.json] [--frames 8 1024 ...]
+        [--workloads uniform zipf ...] [--accesses N] [--set CLAVE=VALOR ...]
+        [--repeat N] [--compare base.json] [--no-memory]
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Any, Dict, List, Mapping, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from config import Config  # noqa: E402
+from memory_manager import MemoryManager, create_memory_manager  # noqa: E402
+from workloads import WORKLOADS, generate  # noqa: E402
+
+PAGE_SIZE_KB = 4
+PROCESSES = 4
+CHURN_PAGES = 8
+DEFAULT_FRAMES = (8, 64, 1_024, 16_384, 131_072, 1_000_000)
+
+# Métricas comparadas entre ejecuciones y si es mejor que suban o bajen
+HIGHER_IS_BETTER = ("access_page_per_sec", "access_per_sec", "create_teardown_per_sec")
+LOWER_IS_BETTER = ("load_seconds", "peak_memory_bytes")
+# Deterministas: cualquier diferencia es un cambio de comportamiento
+BEHAVIOR = ("page_fault_rate", "tlb_hit_ratio")
+# Por debajo de este tiempo la medida es ruido y no se compara
+MIN_SECONDS = 0.01
+
+
+def make_config(frames: int, overrides: Mapping[str, Any]) -> Config:
+    config = Config("")
+    config.apply_overrides({
+        "page_size_kb": PAGE_SIZE_KB,
+        "ram_size_kb": frames * PAGE_SIZE_KB,
+        "swap_size_kb": 2 * frames * PAGE_SIZE_KB,
+    })
+    config.apply_overrides(overrides)
+    return config
+
+
+def build(frames: int, overrides: Mapping[str, Any]) -> Tuple[MemoryManager, List[int], int, float]:
+    """Gestor con ``PROCESSES`` procesos iguales que suman el doble de la RAM.
+
+    Devuelve el gestor, los PID, las páginas por proceso y los segundos de
+    carga.
+    """
+    manager = create_memory_manager(make_config(frames, overrides))
+    pages = max(1, 2 * frames // PROCESSES)
+    processes = [manager.new_process(pages * PAGE_SIZE_KB) for _ in range(PROCESSES)]
+    start = time.perf_counter()
+    for process in processes:
+        manager.add_process(process)
+    return manager, [p.pid for p in processes], pages, time.perf_counter() - start
+
+
+def virtual_trace(workload: str, frames: int, accesses: int, seed: int) -> List[int]:
+    """Traza sobre el espacio virtual de todos los procesos; el bucle de
+    ``looping`` ocupa 1,25 veces la RAM."""
+    total = PROCESSES * max(1, 2 * frames // PROCESSES)
+    return generate(workload, total, accesses, seed, loop_pages=total * 5 // 8)
+
+
+def to_accesses(virtual: List[int], pids: List[int], pages: int) -> List[Tuple[int, int]]:
+    return [(pids[v // pages], v % pages) for v in virtual]
+
+
+def bench_workload(
+    frames: int,
+    workload: str,
+    accesses: int,
+    seed: int,
+    overrides: Mapping[str, Any],
+    repeat: int = 1,
+) -> Dict[str, Any]:
+    virtual = virtual_trace(workload, frames, accesses, seed)
+    load_seconds = slow = fast = float("inf")
+    for _ in range(repeat):
+        manager, pids, pages, load = build(frames, overrides)
+        # Los PID cambian en cada repetición
+        run = to_accesses(virtual, pids, pages)
+        load_seconds = min(load_seconds, load)
+
+        access_page = manager.access_page
+        start = time.perf_counter()
+        for pid, page in run:
+            access_page(pid, page)
+        slow = min(slow, time.perf_counter() - start)
+        metrics = manager.get_metrics_dict()
+
+        access = manager.access
+        start = time.perf_counter()
+        for pid, page in run:
+            access(pid, page)
+        fast = min(fast, time.perf_counter() - start)
+        manager.close()
+    return {
+        "load_seconds": load_seconds,
+        "access_page_per_sec": len(virtual) / slow if slow else 0.0,
+        "access_per_sec": len(virtual) / fast if fast else 0.0,
+        "page_fault_rate": metrics["page_fault_rate"],
+        "tlb_hit_ratio": metrics["tlb_hit_ratio"],
+    }
+
+
+def bench_churn(frames: int, operations: int, overrides: Mapping[str, Any], repeat: int = 1) -> float:
+    """Pares terminar + crear por segundo con la RAM llena de procesos pequeños."""
+    return max(churn_once(frames, operations, overrides) for _ in range(repeat))
+
+
+def churn_once(frames: int, operations: int, overrides: Mapping[str, Any]) -> float:
+    manager = create_memory_manager(make_config(frames, overrides))
+    pages = min(CHURN_PAGES, frames)
+    live = []
+    for _ in range(max(1, frames // pages)):
+        process = manager.new_process(pages * PAGE_SIZE_KB)
+        manager.add_process(process)
+        live.append(process.pid)
+    start = time.perf_counter()
+    for i in range(operations):
+        manager.remove_process(live[i % len(live)])
+        process = manager.new_process(pages * PAGE_SIZE_KB)
+        manager.add_process(process)
+        live[i % len(live)] = process.pid
+    elapsed = time.perf_counter() - start
+    manager.close()
+    return operations / elapsed if elapsed else 0.0
+
+
+def bench_memory(frames: int, accesses: int, seed: int, overrides: Mapping[str, Any]) -> int:
+    """Bytes máximos asignados al crear, cargar y ejecutar la traza uniforme."""
+    tracemalloc.start()
+    virtual = virtual_trace("uniform", frames, accesses, seed)
+    manager, pids, pages, _ = build(frames, overrides)
+    for pid, page in to_accesses(virtual, pids, pages):
+        manager.access(pid, page)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    manager.close()
+    return peak
+
+
+def git_commit() -> str:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+    return result.stdout.strip()
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """Imprime la variación de cada métrica y devuelve las regresiones."""
+    old_sizes = {entry["frames"]: entry for entry in baseline["sizes"]}
+    regressions: List[str] = []
+
+    def check(label: str, name: str, new: float, old: float) -> None:
+        if name in BEHAVIOR:
+            if new != old:
+                print(f"{label:32s} {name:24s} {old:>14.6g} {new:>14.6g}  CAMBIO DE COMPORTAMIENTO")
+            return
+        if not old or (name == "load_seconds" and max(new, old) < MIN_SECONDS):
+            return
+        change = (new - old) / old * 100
+        worse = change < -threshold if name in HIGHER_IS_BETTER else change > threshold
+        print(f"{label:32s} {name:24s} {old:>14.6g} {new:>14.6g} {change:>+8.1f}%{'  REGRESIÓN' if worse else ''}")
+        if worse:
+            regressions.append(f"{label} {name}: {change:+.1f}%")
+
+    print(f"{'caso':32s} {'métrica':24s} {'base':>14s} {'actual':>14s} {'cambio':>9s}")
+    for entry in current["sizes"]:
+        old = old_sizes.get(entry["frames"])
+        if old is None:
+            continue
+        frames = entry["frames"]
+        for name in ("create_teardown_per_sec", "peak_memory_bytes"):
+            if name in entry and name in old:
+                check(f"{frames} marcos", name, entry[name], old[name])
+        for workload, result in entry["workloads"].items():
+            previous = old["workloads"].get(workload)
+            if previous is None:
+                continue
+            for name in HIGHER_IS_BETTER + LOWER_IS_BETTER + BEHAVIOR:
+                if name in result and name in previous:
+                    check(f"{frames} marcos / {workload}", name, result[name], previous[name])
+    return regressions
+
+
+def parse_overrides(items: List[str]) -> Dict[str, str]:
+    overrides = {}
+    for item in items:
+        key, sep, value = item.partition("=")
+        if not sep:
+            raise SystemExit(f"--set espera CLAVE=VALOR: {item!r}")
+        overrides[key.strip()] = value
+    return overrides
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-o", "--output", help="archivo JSON de resultados (por defecto, salida estándar)")
+    parser.add_argument("--frames", type=int, nargs="+", default=list(DEFAULT_FRAMES), help="tamaños de RAM en marcos")
+    parser.add_argument("--workloads", nargs="+", default=list(WORKLOADS), choices=list(WORKLOADS))
+    parser.add_argument("--accesses", type=int, default=50_000, help="accesos por carga de trabajo")
+    parser.add_argument("--operations", type=int, default=2_000, help="pares terminar+crear por tamaño")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3, help="repeticiones por medida; se toma la mejor")
+    parser.add_argument("--set", dest="overrides", action="append", default=[], metavar="CLAVE=VALOR",
+                        help="sustituye un valor de configuración (p. ej. replacement_algorithm=lru)")
+    parser.add_argument("--no-memory", action="store_true", help="no medir la memoria máxima (más rápido)")
+    parser.add_argument("--compare", metavar="BASE", help="JSON de una ejecución anterior con el que comparar")
+    parser.add_argument("--threshold", type=float, default=10.0, help="empeoramiento tolerado en %% (por defecto 10)")
+    args = parser.parse_args()
+    overrides = parse_overrides(args.overrides)
+
+    sizes = []
+    for frames in args.frames:
+        entry: Dict[str, Any] = {"frames": frames, "workloads": {}}
+        for workload in args.workloads:
+            entry["workloads"][workload] = bench_workload(
+                frames, workload, args.accesses, args.seed, overrides, args.repeat
+            )
+        entry["create_teardown_per_sec"] = bench_churn(frames, args.operations, overrides, args.repeat)
+        if not args.no_memory:
+            entry["peak_memory_bytes"] = bench_memory(frames, args.accesses, args.seed, overrides)
+        sizes.append(entry)
+        rates = ", ".join(f"{w} {r['access_per_sec']:,.0f}/s" for w, r in entry["workloads"].items())
+        print(f"{frames:>9} marcos: {rates}; rotación {entry['create_teardown_per_sec']:,.0f}/s", file=sys.stderr)
+
+    results = {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "page_size_kb": PAGE_SIZE_KB,
+            "processes": PROCESSES,
+            "accesses": args.accesses,
+            "operations": args.operations,
+            "seed": args.seed,
+            "repeat": args.repeat,
+            "overrides": overrides,
+        },
+        "sizes": sizes,
+    }
+    text = json.dumps(results, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} regresiones por encima del {args.threshold:g}%", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Generadores de trazas sintéticas para los benchmarks.
+
+Cada generador devuelve ``count`` números de página virtual en el rango
+``[0, pages)`` de forma reproducible a partir de una semilla. El benchmark
+reparte ese espacio entre varios procesos del mismo tamaño.
+
+* ``uniform``: todas las páginas con la misma probabilidad.
+* ``zipf``: la página de rango ``k`` con probabilidad proporcional a
+  ``1 / k**s``; pocas páginas calientes y una cola larga.
+* ``sequential``: recorrido secuencial de todo el espacio, repetido.
+* ``looping``: bucle sobre las primeras ``loop_pages`` páginas (por
+  defecto algo más que la RAM, el peor caso de LRU y FIFO).
+* ``phases``: cada ``phase_length`` accesos cambia la región caliente, de
+  ``region_pages`` páginas, y dentro de ella el acceso es uniforme.
+"""
+
+import itertools
+import random
+from typing import Callable, Dict, List, Optional
+
+
+def uniform(pages: int, count: int, rng: random.Random, **_) -> List[int]:
+    return [rng.randrange(pages) for _ in range(count)]
+
+
+def zipf(pages: int, count: int, rng: random.Random, s: float = 1.0, **_) -> List[int]:
+    cumulative = list(itertools.accumulate(1.0 / (rank ** s) for rank in range(1, pages + 1)))
+    # Las páginas calientes se reparten por todo el espacio, no solo al principio
+    ranks = list(range(pages))
+    rng.shuffle(ranks)
+    return [ranks[k] for k in rng.choices(range(pages), cum_weights=cumulative, k=count)]
+
+
+def sequential(pages: int, count: int, rng: random.Random, **_) -> List[int]:
+    return [i % pages for i in range(count)]
+
+
+def looping(pages: int, count: int, rng: random.Random, loop_pages: Optional[int] = None, **_) -> List[int]:
+    loop = min(pages, loop_pages or pages)
+    return [i % loop for i in range(count)]
+
+
+def phases(
+    pages: int,
+    count: int,
+    rng: random.Random,
+    phase_length: int = 5000,
+    region_pages: Optional[int] = None,
+    **_,
+) -> List[int]:
+    region = max(1, min(pages, region_pages or pages // 8))
+    trace: List[int] = []
+    while len(trace) < count:
+        base = rng.randrange(pages - region + 1)
+        length = min(phase_length, count - len(trace))
+        trace.extend(base + rng.randrange(region) for _ in range(length))
+    return trace
+
+
+WORKLOADS: Dict[str, Callable[..., List[int]]] = {
+    "uniform": uniform,
+    "zipf": zipf,
+    "sequential": sequential,
+    "looping": looping,
+    "phases": phases,
+}
+
+
+def generate(name: str, pages: int, count: int, seed: int = 0, **params) -> List[int]:
+    """Genera la traza indicada por nombre."""
+    try:
+        generator = WORKLOADS[name]
+    except KeyError:
+        raise ValueError(f"Carga de trabajo desconocida: {name}") from None
+    return generator(pages, count, random.Random(seed), **params)
@@ -0,0 +1,315 @@
+"""
+Asignadores de marcos libres para RAM y Swap.
+
+Evitan recorrer la lista de marcos en cada asignación. Se ofrecen dos
+estrategias:
+
+* ``lowest``: devuelve siempre el marco libre de menor índice, igual que la
+  búsqueda lineal original, por lo que los mapas de memoria son
+  reproducibles. Los marcos nunca usados se entregan con un cursor y los
+  liberados se guardan en un montículo (O(log k) por operación, con k marcos
+  liberados por debajo del cursor).
+* ``stack``: lista libre LIFO, O(1) estricto por operación. El orden de
+  colocación difiere del original.
+
+Ambos admiten además reservar tramos contiguos y alineados
+(``allocate_run``) para las páginas enormes. El primer ``allocate_run``
+crea un índice con los marcos libres de cada tramo alineado y un montículo
+de tramos completamente libres, que ``allocate`` y ``release`` mantienen
+en O(1) (O(log n) al completarse un tramo); a partir de ahí reservar un
+tramo cuesta O(log n + tamaño). Los marcos del tramo que estaban en la
+lista de liberados no se buscan en ella: se apuntan en ``_claimed`` y se
+descartan al salir. Si uno de ellos se libera antes, recupera su entrada
+anterior en la lista.
+
+``export_state``/``restore_state`` copian el cursor, la lista de
+liberados tal cual (en orden de montículo o de pila) y los marcos
+apuntados, de modo que un asignador restaurado entrega los mismos marcos
+que el original.
+"""
+
+import heapq
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+
+class FrameAllocator:
+    """Interfaz base para asignadores de marcos.
+
+    Las subclases llevan un cursor (todos los marcos desde él están libres
+    y nunca se han entregado) y una lista ``_released`` de marcos
+    liberados, y, si existe el índice de tramos (``_run_free``), llaman a
+    ``_taken``/``_freed`` con cada marco que entregan o reciben.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self.used = 0
+        self._cursor = 0
+        self._released: List[int] = []
+        # Marcos de _released reservados por allocate_run (borrado perezoso)
+        self._claimed: Set[int] = set()
+        # Índice de tramos alineados, creado en el primer allocate_run:
+        # marcos libres por tramo, tramos completamente libres (montículo) y
+        # si cada tramo está ya en el montículo
+        self._run_size = 0
+        self._run_free: Optional[array] = None
+        self._free_runs: List[int] = []
+        self._queued_runs = bytearray()
+
+    def allocate(self) -> Optional[int]:
+        """Reserva un marco libre y devuelve su índice, o None si no hay."""
+        raise NotImplementedError
+
+    def release(self, index: int) -> None:
+        """Devuelve el marco ``index`` al conjunto de marcos libres."""
+        raise NotImplementedError
+
+    def allocate_many(self, count: int) -> List[int]:
+        """Reserva hasta ``count`` marcos, en el mismo orden que ``allocate``."""
+        frames: List[int] = []
+        while len(frames) < count:
+            index = self.allocate()
+            if index is None:
+                break
+            frames.append(index)
+        return frames
+
+    def release_many(self, indices: Iterable[int]) -> None:
+        """Libera varios marcos a la vez."""
+        for index in indices:
+            self.release(index)
+
+    def _pop_released(self) -> Optional[int]:
+        """Saca de ``_released`` el siguiente marco libre, saltando los
+        reservados por ``allocate_run``."""
+        raise NotImplementedError
+
+    def _push_released(self, index: int) -> None:
+        raise NotImplementedError
+
+    def _revive(self, index: int) -> bool:
+        """Si el marco liberado está apuntado como reservado, su entrada
+        en ``_released`` vuelve a ser válida y no hay que añadirlo."""
+        claimed = self._claimed
+        if claimed and index in claimed:
+            claimed.discard(index)
+            return True
+        return False
+
+    # -- índice de tramos alineados --------------------------------------
+    def _taken(self, index: int) -> None:
+        self._run_free[index // self._run_size] -= 1
+
+    def _freed(self, index: int) -> None:
+        runs = self._run_free
+        run = index // self._run_size
+        runs[run] += 1
+        if runs[run] == self._run_size and not self._queued_runs[run]:
+            self._queued_runs[run] = 1
+            heapq.heappush(self._free_runs, run)
+
+    def _build_run_index(self, size: int) -> None:
+        """Cuenta los marcos libres de cada tramo alineado de ``size`` (O(n))."""
+        count = -(-self.capacity // size)
+        runs = array("q", bytes(8 * count))
+        claimed = self._claimed
+        for index in set(self._released):
+            if index not in claimed:
+                runs[index // size] += 1
+        for index in range(self._cursor, self.capacity):
+            runs[index // size] += 1
+        # Un tramo final incompleto nunca llega a ``size`` libres
+        self._run_size = size
+        self._run_free = runs
+        self._free_runs = [run for run in range(count) if runs[run] == size]
+        self._queued_runs = bytearray(count)
+        for run in self._free_runs:
+            self._queued_runs[run] = 1
+
+    def allocate_run(self, size: int) -> Optional[int]:
+        """Reserva ``size`` marcos contiguos cuyo primer índice es múltiplo de
+        ``size`` y devuelve ese índice, o None si ningún tramo está libre.
+
+        Entrega el tramo libre de menor índice.
+        """
+        if self.free_count < size:
+            return None
+        if self._run_size != size:
+            self._build_run_index(size)
+        runs = self._run_free
+        free_runs = self._free_runs
+        while free_runs:
+            run = heapq.heappop(free_runs)
+            self._queued_runs[run] = 0
+            if runs[run] == size:
+                start = run * size
+                self._claim(start, size)
+                return start
+        return None
+
+    def _claim(self, start: int, size: int) -> None:
+        """Marca como usados los marcos ``start..start+size-1``, todos libres."""
+        end = start + size
+        cursor = self._cursor
+        # Los que están por debajo del cursor siguen en _released
+        self._claimed.update(range(start, min(end, cursor)))
+        if end > cursor:
+            # Los marcos saltados entre el cursor y el tramo pasan a liberados
+            for index in range(cursor, start):
+                self._push_released(index)
+            self._cursor = end
+        self._run_free[start // size] = 0
+        self.used += size
+
+    def export_state(self) -> Dict[str, Any]:
+        """Estado para las instantáneas (ver ``snapshot.py``)."""
+        return {
+            "cursor": self._cursor,
+            "used": self.used,
+            "released": array("q", self._released),
+            "claimed": array("q", sorted(self._claimed)),
+        }
+
+    def restore_state(self, state: Dict[str, Any]) -> None:
+        self._cursor = state["cursor"]
+        self.used = state["used"]
+        self._released = list(state["released"])
+        self._claimed = set(state.get("claimed", ()))
+        # El índice de tramos se reconstruye en el siguiente allocate_run
+        self._run_size = 0
+        self._run_free = None
+
+    @property
+    def free_count(self) -> int:
+        return self.capacity - self.used
+
+    def has_free(self) -> bool:
+        return self.used < self.capacity
+
+
+class LowestIndexAllocator(FrameAllocator):
+    """Entrega siempre el marco libre de menor índice."""
+
+    def allocate(self) -> Optional[int]:
+        released = self._released
+        if released and not self._claimed:
+            index = heapq.heappop(released)
+        else:
+            index = self._pop_released()
+        if index is None:
+            if self._cursor >= self.capacity:
+                return None
+            index = self._cursor
+            self._cursor += 1
+        self.used += 1
+        if self._run_free is not None:
+            self._taken(index)
+        return index
+
+    def release(self, index: int) -> None:
+        if not self._revive(index):
+            heapq.heappush(self._released, index)
+        self.used -= 1
+        if self._run_free is not None:
+            self._freed(index)
+
+    def _pop_released(self) -> Optional[int]:
+        released = self._released
+        claimed = self._claimed
+        while released:
+            index = heapq.heappop(released)
+            if claimed and index in claimed:
+                claimed.discard(index)
+                continue
+            return index
+        return None
+
+    def _push_released(self, index: int) -> None:
+        heapq.heappush(self._released, index)
+
+    def allocate_many(self, count: int) -> List[int]:
+        frames: List[int] = []
+        while self._released and len(frames) < count:
+            index = self._pop_released()
+            if index is not None:
+                frames.append(index)
+        # El resto sale del tramo nunca usado, ya ordenado
+        end = min(self.capacity, self._cursor + count - len(frames))
+        frames.extend(range(self._cursor, end))
+        self._cursor = end
+        self.used += len(frames)
+        if self._run_free is not None:
+            for index in frames:
+                self._taken(index)
+        return frames
+
+    def release_many(self, indices: Iterable[int]) -> None:
+        indices = list(indices)
+        fresh = [index for index in indices if not self._revive(index)] if self._claimed else indices
+        if len(fresh) > len(self._released):
+            self._released.extend(fresh)
+            heapq.heapify(self._released)
+        else:
+            for index in fresh:
+                heapq.heappush(self._released, index)
+        self.used -= len(indices)
+        if self._run_free is not None:
+            for index in indices:
+                self._freed(index)
+
+
+class StackAllocator(FrameAllocator):
+    """Lista libre LIFO: reutiliza primero el último marco liberado."""
+
+    def allocate(self) -> Optional[int]:
+        released = self._released
+        if released and not self._claimed:
+            index = released.pop()
+        else:
+            index = self._pop_released()
+        if index is None:
+            if self._cursor >= self.capacity:
+                return None
+            index = self._cursor
+            self._cursor += 1
+        self.used += 1
+        if self._run_free is not None:
+            self._taken(index)
+        return index
+
+    def release(self, index: int) -> None:
+        if not self._revive(index):
+            self._released.append(index)
+        self.used -= 1
+        if self._run_free is not None:
+            self._freed(index)
+
+    def _pop_released(self) -> Optional[int]:
+        released = self._released
+        claimed = self._claimed
+        while released:
+            index = released.pop()
+            if claimed and index in claimed:
+                claimed.discard(index)
+                continue
+            return index
+        return None
+
+    def _push_released(self, index: int) -> None:
+        self._released.append(index)
+
+
+ALLOCATORS = {
+    "lowest": LowestIndexAllocator,
+    "stack": StackAllocator,
+}
+
+
+def create_allocator(name: str, capacity: int) -> FrameAllocator:
+    """Crea el asignador indicado por nombre (``lowest`` o ``stack``)."""
+    try:
+        cls = ALLOCATORS[name.lower()]
+    except KeyError:
+        raise ValueError(f"Asignador de marcos desconocido: {name}") from None
+    return cls(capacity)
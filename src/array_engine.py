@@ -0,0 +1,278 @@
+"""
+Motor de estado basado en arreglos NumPy para el gestor de memoria.
+
+Sustituye las listas de ``Frame`` y las tablas de páginas de objetos
+``PageTableEntry`` por columnas compactas:
+
+* RAM y Swap: dos arreglos ``int32`` por región con el PID propietario y la
+  página de cada marco (-1 si está libre).
+* Cada proceso: columnas ``present``, ``frame``, ``swap`` y ``referenced``
+  indexadas por número de página (10 bytes por página).
+
+La creación de procesos reserva todos los marcos libres de una vez y la
+terminación libera todas sus páginas con operaciones sobre arreglos. Se
+activa con ``ENGINE = arrays`` en la sección ``[Memory]`` de config.ini y
+requiere NumPy.
+"""
+
+from typing import Dict, List, Optional
+
+try:
+    import numpy as np
+except ImportError as exc:  # pragma: no cover - depende del entorno
+    raise ImportError("El motor 'arrays' requiere NumPy (pip install numpy).") from exc
+
+from config import Config
+from memory_manager import (
+    ACCESS_FAULT,
+    ACCESS_HIT,
+    ACCESS_INVALID_PAGE,
+    ACCESS_NO_PROCESS,
+    ACCESS_TLB_HIT,
+    ACCESS_UNMAPPED,
+    Eviction,
+    MemoryManager,
+)
+from process import Process
+from replacement import ReplacementAlgorithm
+
+FREE = -1
+
+
+class PageColumns:
+    """Tabla de páginas de un proceso almacenada por columnas."""
+
+    __slots__ = ("present", "frame", "swap", "referenced")
+
+    def __init__(self, pages: int) -> None:
+        self.present = np.zeros(pages, dtype=bool)
+        self.frame = np.full(pages, FREE, dtype=np.int32)
+        self.swap = np.full(pages, FREE, dtype=np.int32)
+        self.referenced = np.zeros(pages, dtype=bool)
+
+    @property
+    def nbytes(self) -> int:
+        return self.present.nbytes + self.frame.nbytes + self.swap.nbytes + self.referenced.nbytes
+
+
+class ReferenceBit:
+    """Vista del bit de referencia de una página para Clock/Second-Chance."""
+
+    __slots__ = ("_column", "_page")
+
+    def __init__(self, column, page_number: int) -> None:
+        self._column = column
+        self._page = page_number
+
+    @property
+    def referenced(self) -> bool:
+        return bool(self._column[self._page])
+
+    @referenced.setter
+    def referenced(self, value: bool) -> None:
+        self._column[self._page] = value
+
+
+class ArrayMemoryManager(MemoryManager):
+    """Gestor de memoria con el estado de marcos y páginas en arreglos NumPy."""
+
+    def __init__(self, config: Config, replacement: Optional[ReplacementAlgorithm] = None) -> None:
+        self.columns: Dict[int, PageColumns] = {}
+        super().__init__(config, replacement)
+
+    def _init_frames(self, ram_frames: int, swap_frames: int) -> None:
+        self.ram_pid = np.full(ram_frames, FREE, dtype=np.int32)
+        self.ram_page = np.full(ram_frames, FREE, dtype=np.int32)
+        self.swap_pid = np.full(swap_frames, FREE, dtype=np.int32)
+        self.swap_page = np.full(swap_frames, FREE, dtype=np.int32)
+
+    def _entry(self, columns: PageColumns, page_number: int) -> Optional[ReferenceBit]:
+        if self.replacement.uses_reference_bit:
+            return ReferenceBit(columns.referenced, page_number)
+        return None
+
+    # CREAR PROCESO
+    def new_process(self, size_kb: int) -> Process:
+        return Process(size_kb, self.config.values.page_size_kb, build_page_table=False)
+
+    def _load_process(self, process: Process) -> List[Eviction]:
+        pid = process.pid
+        pages = process.pages_needed
+        columns = PageColumns(pages)
+        self.processes[pid] = process
+        self.columns[pid] = columns
+
+        # Asignación en bloque de todos los marcos libres disponibles
+        frames = self.ram_allocator.allocate_many(pages)
+        loaded = len(frames)
+        if loaded:
+            frame_idx = np.asarray(frames, dtype=np.int32)
+            self.ram_pid[frame_idx] = pid
+            self.ram_page[frame_idx] = np.arange(loaded, dtype=np.int32)
+            columns.frame[:loaded] = frame_idx
+            columns.present[:loaded] = True
+            columns.referenced[:loaded] = True
+            process.resident_pages = loaded
+            page_loaded = self.replacement.page_loaded
+            for page_number in range(loaded):
+                page_loaded(pid, page_number, self._entry(columns, page_number))
+            self.tlb.insert_many(pid, list(range(loaded)), frames)
+
+        # Las páginas restantes requieren expulsar víctimas una a una
+        evictions: List[Eviction] = []
+        for page_number in range(loaded, pages):
+            evictions.append(self._swap_and_assign(process, page_number))
+        return evictions
+
+    def _assign_frame(self, process: Process, page_number: int, frame_index: int):
+        pid = process.pid
+        self.ram_pid[frame_index] = pid
+        self.ram_page[frame_index] = page_number
+        columns = self.columns[pid]
+        columns.present[page_number] = True
+        columns.frame[page_number] = frame_index
+        columns.swap[page_number] = FREE
+        columns.referenced[page_number] = True
+        process.resident_pages += 1
+        self.replacement.page_loaded(pid, page_number, self._entry(columns, page_number))
+        self._update_tlb(pid, page_number, frame_index)
+
+    # SWAPPING
+    def _swap_and_assign(self, new_process: Process, new_page_number: int) -> Eviction:
+        # Comprobar la Swap antes de elegir víctima: select_victim la olvida
+        # y, si no cupiera, quedaría en RAM fuera del algoritmo de reemplazo
+        if not self.swap_allocator.has_free():
+            raise MemoryError("Swap lleno.")
+        victim_pid, victim_page = self.replacement.select_victim()
+        frame_index = int(self.columns[victim_pid].frame[victim_page])
+        swap_idx = self._move_to_swap(self.processes[victim_pid], victim_page, frame_index)
+        self.swaps_out += 1
+        self._assign_frame(new_process, new_page_number, frame_index)
+        return victim_pid, victim_page, swap_idx
+
+    def _move_to_swap(self, process: Process, page_number: int, frame_index: int) -> int:
+        idx = self.swap_allocator.allocate()
+        if idx is None:
+            raise MemoryError("Swap lleno.")
+        pid = process.pid
+        self.swap_pid[idx] = pid
+        self.swap_page[idx] = page_number
+        columns = self.columns[pid]
+        columns.present[page_number] = False
+        columns.swap[page_number] = idx
+        columns.frame[page_number] = FREE
+        columns.referenced[page_number] = False
+        process.resident_pages -= 1
+        process.swapped_pages += 1
+        self.ram_pid[frame_index] = FREE
+        self.ram_page[frame_index] = FREE
+        self._invalidate_tlb(pid, page_number)
+        if self.event_log is not None:
+            self.event_log.page_evicted(pid, page_number, idx, frame_index)
+        return idx
+
+    def set_replacement(self, replacement: ReplacementAlgorithm) -> None:
+        self.replacement = replacement
+        for frame_index, pid in enumerate(self.ram_pid.tolist()):
+            if pid != FREE:
+                page_number = int(self.ram_page[frame_index])
+                replacement.page_loaded(pid, page_number, self._entry(self.columns[pid], page_number))
+
+    # TERMINAR PROCESO
+    def _remove_process(self, pid: int):
+        if pid not in self.processes:
+            return
+        columns = self.columns.pop(pid)
+        resident = np.flatnonzero(columns.present)
+        frames = columns.frame[resident]
+        self.ram_pid[frames] = FREE
+        self.ram_page[frames] = FREE
+        self.ram_allocator.release_many(frames.tolist())
+        swapped = columns.swap[columns.swap != FREE]
+        self.swap_pid[swapped] = FREE
+        self.swap_page[swapped] = FREE
+        self.swap_allocator.release_many(swapped.tolist())
+        process = self.processes.pop(pid)
+        process.resident_pages = process.swapped_pages = 0
+        self.replacement.remove_process(pid, resident.tolist())
+        self.tlb.flush_pid(pid)
+
+    # MAPAS DE MEMORIA
+    @staticmethod
+    def _region_map(owners, pages) -> str:
+        return " | ".join(
+            f"[{i}] {'Libre' if pid == FREE else f'P{pid},Pag{page}'}"
+            for i, (pid, page) in enumerate(zip(owners.tolist(), pages.tolist()))
+        )
+
+    def get_ram_map(self):
+        return self._region_map(self.ram_pid, self.ram_page)
+
+    def get_swap_map(self):
+        return self._region_map(self.swap_pid, self.swap_page)
+
+    # TABLA DE PÁGINAS
+    def get_page_table(self, pid: int) -> str:
+        columns = self.columns.get(pid)
+        if columns is None:
+            return "Proceso no encontrado."
+        lines = [f"Tabla de páginas del Proceso {pid}:"]
+        for page_number, (present, frame, swap) in enumerate(
+            zip(columns.present.tolist(), columns.frame.tolist(), columns.swap.tolist())
+        ):
+            if present:
+                location = f"RAM[{frame}]"
+            elif swap != FREE:
+                location = f"Swap[{swap}]"
+            else:
+                location = "No asignada"
+            lines.append(f"Página {page_number} -> {location}")
+        return "\n".join(lines)
+
+    # MÉTRICAS
+    def state_nbytes(self) -> int:
+        """Bytes ocupados por los arreglos de estado (marcos y tablas)."""
+        frames = self.ram_pid.nbytes + self.ram_page.nbytes + self.swap_pid.nbytes + self.swap_page.nbytes
+        return frames + sum(columns.nbytes for columns in self.columns.values())
+
+    # ACCESO A PÁGINAS
+    def _frame_of(self, pid: int, page_number: int) -> Optional[int]:
+        frame = int(self.columns[pid].frame[page_number])
+        return None if frame == FREE else frame
+
+    def _access(self, pid: int, page_number: int) -> int:
+        self.total_accesses += 1
+        process = self.processes.get(pid)
+        if not process:
+            return ACCESS_NO_PROCESS
+        if not (0 <= page_number < process.pages_needed):
+            return ACCESS_INVALID_PAGE
+        columns = self.columns[pid]
+        if self.tlb.lookup(pid, page_number) is not None:
+            self.tlb_hits += 1
+            columns.referenced[page_number] = True
+            self.replacement.page_accessed(pid, page_number, None)
+            return ACCESS_TLB_HIT
+        self.tlb_misses += 1
+        frame_index = int(columns.frame[page_number])
+        if frame_index != FREE:
+            columns.referenced[page_number] = True
+            self.replacement.page_accessed(pid, page_number, None)
+            self._update_tlb(pid, page_number, frame_index)
+            return ACCESS_HIT
+        swap_idx = int(columns.swap[page_number])
+        if swap_idx != FREE:
+            self.page_faults += 1
+            self.swaps_in += 1
+            self.swap_pid[swap_idx] = FREE
+            self.swap_page[swap_idx] = FREE
+            self.swap_allocator.release(swap_idx)
+            process.swapped_pages -= 1
+            self.last_eviction = self._allocate_page(process, page_number)
+            frame_index = int(columns.frame[page_number])
+            if self.event_log is not None:
+                self.event_log.page_swapped_in(pid, page_number, None if frame_index == FREE else frame_index)
+            if frame_index != FREE:
+                self._update_tlb(pid, page_number, frame_index)
+            return ACCESS_FAULT
+        return ACCESS_UNMAPPED
@@ -1,22 +1,34 @@
 import random
-from typing import Optional
+from typing import Iterable, Optional
 
 # Importaciones absolutas para permitir ejecución directa del script
 from config import Config
-from process import Process
-from memory_manager import MemoryManager
-from logger import Logger
+from memory_manager import create_memory_manager
+from logger import create_event_log
+from replacement import REPLACEMENT_ALGORITHMS, create_replacement
 
 
 class CLI:
     """Clase que encapsula el ciclo de interacción con el usuario."""
 
-    def __init__(self, config_path: str = "config.ini") -> None:
-        # Cargar configuración
-        self.config = Config(config_path)
-        # Instanciar gestor de memoria y logger
-        self.memory_manager = MemoryManager(self.config)
-        self.logger = Logger()
+    def __init__(
+        self,
+        config_path: str = "config.ini",
+        config: Optional[Config] = None,
+        script: Optional[Iterable[str]] = None,
+    ) -> None:
+        # Cargar configuración (o usar la ya cargada, con sus sustituciones)
+        self.config = config if config is not None else Config(config_path)
+        # Respuestas leídas de un guion en lugar de preguntarlas; en ese
+        # modo no se muestra el menú y cada pregunta se imprime con su respuesta
+        self._script = iter(script) if script is not None else None
+        # Instanciar gestor de memoria y registro de eventos, que se
+        # engancha al gestor y registra sus eventos sin formatear mensajes
+        self.memory_manager = create_memory_manager(self.config)
+        self.logger = create_event_log(self.config)
+        self.logger.attach(self.memory_manager)
+        # Perfilador de las rutas críticas; solo se instala si se pide
+        self.profiler = None
 
     def _print_menu(self) -> None:
         print("\n=== Simulador de Gestor de Memoria ===")
@@ -28,40 +40,75 @@ class CLI:
         print("5. Mostrar tabla de páginas de un proceso")
         print("6. Mostrar métricas de rendimiento")
         print("7. Mostrar eventos registrados")
+        print("8. Cambiar algoritmo de reemplazo")
+        print("9. Perfil de rendimiento")
+        print("10. Guardar instantánea")
+        print("11. Restaurar instantánea")
         print("0. Salir")
 
+    def _input(self, prompt: str) -> str:
+        """Lee una respuesta del usuario o del guion. Al agotarse el guion
+        (o cerrarse la entrada estándar) lanza ``EOFError``."""
+        if self._script is None:
+            return input(prompt)
+        answer = next(self._script, None)
+        if answer is None:
+            raise EOFError
+        print(f"{prompt}{answer}")
+        return answer
+
     def run(self) -> None:
-        """Ejecuta el ciclo principal de la CLI."""
+        """Ejecuta el ciclo principal de la CLI. El fin de la entrada
+        equivale a elegir la opción 0."""
         print(self.config.summary())
         while True:
-            self._print_menu()
-            option = input("Opción: ").strip()
-            if option == "1":
-                self._create_process()
-            elif option == "2":
-                self._terminate_process()
-            elif option == "3":
-                self._access_page()
-            elif option == "4":
-                self._show_memory_map()
-            elif option == "5":
-                self._show_page_table()
-            elif option == "6":
-                self._show_metrics()
-            elif option == "7":
-                self._show_logs()
-            elif option == "0":
+            if self._script is None:
+                self._print_menu()
+            try:
+                option = self._input("Opción: ").strip()
+                option = self._dispatch(option)
+            except EOFError:
+                option = "0"
+            if option == "0":
                 print("Saliendo del simulador.")
+                self.memory_manager.close()
+                self.logger.close()
                 break
-            else:
-                print("Opción no válida. Intente de nuevo.")
+
+    def _dispatch(self, option: str) -> str:
+        """Ejecuta la opción del menú y la devuelve."""
+        if option == "1":
+            self._create_process()
+        elif option == "2":
+            self._terminate_process()
+        elif option == "3":
+            self._access_page()
+        elif option == "4":
+            self._show_memory_map()
+        elif option == "5":
+            self._show_page_table()
+        elif option == "6":
+            self._show_metrics()
+        elif option == "7":
+            self._show_logs()
+        elif option == "8":
+            self._change_replacement()
+        elif option == "9":
+            self._profile()
+        elif option == "10":
+            self._save_snapshot()
+        elif option == "11":
+            self._restore_snapshot()
+        elif option != "0":
+            print("Opción no válida. Intente de nuevo.")
+        return option
 
     # ------------------------------------------------------------------
     # Acciones de menú
     # ------------------------------------------------------------------
     def _create_process(self) -> None:
         """Crea un nuevo proceso solicitando tamaño al usuario."""
-        size_str = input("Tamaño del proceso en KB (o 'r' para aleatorio): ").strip()
+        size_str = self._input("Tamaño del proceso en KB (o 'r' para aleatorio): ").strip()
         if size_str.lower() == 'r':
             max_size = self.config.values.ram_size_kb // 2
             size_kb = random.randint(self.config.values.page_size_kb, max_size)
@@ -73,16 +120,15 @@ class CLI:
             except ValueError:
                 print("Tamaño inválido.")
                 return
-        process = Process(size_kb, self.config.values.page_size_kb)
+        process = self.memory_manager.new_process(size_kb)
         messages = self.memory_manager.add_process(process)
         print(f"Proceso {process.pid} creado con tamaño {process.size_kb} KB y {process.pages_needed} páginas.")
         for msg in messages:
-            self.logger.log(msg)
             print(msg)
 
     def _terminate_process(self) -> None:
         """Termina un proceso solicitando PID al usuario."""
-        pid_str = input("PID del proceso a terminar: ").strip()
+        pid_str = self._input("PID del proceso a terminar: ").strip()
         try:
             pid = int(pid_str)
         except ValueError:
@@ -92,23 +138,19 @@ class CLI:
             print("Proceso no encontrado.")
             return
         self.memory_manager.remove_process(pid)
-        msg = f"Proceso {pid} terminado y memoria liberada."
-        self.logger.log(msg)
-        print(msg)
+        print(f"Proceso {pid} terminado y memoria liberada.")
 
     def _access_page(self) -> None:
         """Solicita PID y número de página y realiza el acceso."""
-        pid_str = input("PID del proceso: ").strip()
-        page_str = input("Número de página a acceder: ").strip()
+        pid_str = self._input("PID del proceso: ").strip()
+        page_str = self._input("Número de página a acceder: ").strip()
         try:
             pid = int(pid_str)
             page = int(page_str)
         except ValueError:
             print("PID o número de página inválidos.")
             return
-        msg = self.memory_manager.access_page(pid, page)
-        self.logger.log(msg)
-        print(msg)
+        print(self.memory_manager.access_page(pid, page))
 
     def _show_memory_map(self) -> None:
         """Muestra el mapa de RAM y Swap."""
@@ -119,7 +161,7 @@ class CLI:
 
     def _show_page_table(self) -> None:
         """Muestra la tabla de páginas de un proceso."""
-        pid_str = input("PID del proceso: ").strip()
+        pid_str = self._input("PID del proceso: ").strip()
         try:
             pid = int(pid_str)
         except ValueError:
@@ -137,3 +179,72 @@ class CLI:
         print("\n--- Eventos ---")
         for event in self.logger.get_events():
             print(event)
+        print(f"({self.logger.summary()})")
+
+    def _change_replacement(self) -> None:
+        """Permite elegir el algoritmo de reemplazo de páginas."""
+        names = list(REPLACEMENT_ALGORITHMS)
+        print(f"Algoritmo actual: {self.memory_manager.replacement.name}")
+        for idx, name in enumerate(names, start=1):
+            print(f"{idx}. {REPLACEMENT_ALGORITHMS[name].name}")
+        choice = self._input("Algoritmo: ").strip()
+        try:
+            name = names[int(choice) - 1]
+        except (ValueError, IndexError):
+            print("Opción no válida.")
+            return
+        self.memory_manager.set_replacement(create_replacement(name, self.config.values.replacement_seed))
+        msg = f"Algoritmo de reemplazo cambiado a {self.memory_manager.replacement.name}."
+        self.logger.log(msg)
+        print(msg)
+
+    def _profile(self) -> None:
+        """Activa el perfilador o muestra su informe y permite desactivarlo."""
+        if self.profiler is None:
+            from profiling import Profiler
+
+            self.profiler = Profiler(self.memory_manager)
+            print("Perfilador activado: las operaciones siguientes se medirán.")
+            return
+        print("\n--- Perfil ---")
+        print(self.profiler.report())
+        if self._input("¿Desactivar el perfilador? (s/N): ").strip().lower() == "s":
+            self.profiler.detach()
+            self.profiler = None
+            print("Perfilador desactivado.")
+
+    def _save_snapshot(self) -> None:
+        """Guarda el estado completo del gestor en un archivo."""
+        from snapshot import save_snapshot
+
+        path = self._input("Archivo de la instantánea: ").strip()
+        if not path:
+            print("Ruta no válida.")
+            return
+        try:
+            size = save_snapshot(self.memory_manager, path)
+        except (OSError, ValueError) as exc:
+            print(f"No se pudo guardar la instantánea: {exc}")
+            return
+        print(f"Instantánea guardada en {path} ({size / 1024:.0f} KB).")
+
+    def _restore_snapshot(self) -> None:
+        """Sustituye el gestor por el guardado en una instantánea."""
+        from snapshot import load_snapshot
+
+        path = self._input("Archivo de la instantánea: ").strip()
+        try:
+            manager, _ = load_snapshot(path, self.config)
+        except (OSError, ValueError) as exc:
+            print(f"No se pudo restaurar la instantánea: {exc}")
+            return
+        if self.profiler is not None:
+            self.profiler.detach()
+            self.profiler = None
+            print("Perfilador desactivado.")
+        self.memory_manager.close()
+        self.memory_manager = manager
+        self.logger.attach(manager)
+        msg = f"Instantánea {path} restaurada ({len(manager.processes)} procesos)."
+        self.logger.log(msg)
+        print(msg)
@@ -9,8 +9,8 @@ atributos de la clase Config.
 
 import configparser
 import os
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, fields
+from typing import Any, Dict, Mapping, Optional
 
 
 @dataclass
@@ -20,6 +20,39 @@ class ConfigValues:
     ram_size_kb: int
     swap_size_kb: int
     page_size_kb: int
+    frame_allocator: str = "lowest"
+    tlb_size: int = 4
+    tlb_policy: str = "lru"
+    tlb_ways: int = 0
+    replacement_algorithm: str = "fifo"
+    replacement_seed: int = 0
+    engine: str = "objects"
+    paging: str = "eager"
+    swap_backend: str = "memory"
+    swap_file: str = ""
+    swap_writeback_batch: int = 32
+    prefetch: str = "none"
+    prefetch_depth: int = 4
+    page_table: str = "flat"
+    page_table_levels: int = 4
+    walk_cache_size: int = 16
+    memory_access_ns: int = 100
+    tlb_lookup_ns: int = 1
+    load_control: str = "none"
+    working_set_window: int = 1000
+    pff_window: int = 1000
+    pff_high_percent: int = 30
+    pff_low_percent: int = 5
+    huge_pages: str = "none"
+    huge_page_size_kb: int = 2048
+    huge_min_process_kb: int = 4096
+    log_capacity: int = 10000
+    log_level: str = "debug"
+    log_sample_every: int = 1
+    log_export: str = "none"
+    log_export_file: str = ""
+    cpus: int = 1
+    frame_lock_stripes: int = 16
 
 
 class Config:
@@ -28,11 +61,61 @@ class Config:
     DEFAULT_RAM_SIZE_KB = 2048
     DEFAULT_SWAP_SIZE_KB = 4096
     DEFAULT_PAGE_SIZE_KB = 256
+    DEFAULT_FRAME_ALLOCATOR = "lowest"
+    FRAME_ALLOCATORS = ("lowest", "stack")
+    DEFAULT_ENGINE = "objects"
+    ENGINES = ("objects", "arrays")
+    DEFAULT_PAGING = "eager"
+    PAGING_MODES = ("eager", "demand")
+    DEFAULT_TLB_SIZE = 4
+    DEFAULT_TLB_POLICY = "lru"
+    DEFAULT_TLB_WAYS = 0
+    TLB_POLICIES = ("lru", "fifo", "random")
+    DEFAULT_REPLACEMENT_ALGORITHM = "fifo"
+    REPLACEMENT_ALGORITHMS = ("fifo", "lru", "clock", "second_chance", "lfu", "random")
+    DEFAULT_REPLACEMENT_SEED = 0
+    DEFAULT_SWAP_BACKEND = "memory"
+    SWAP_BACKENDS = ("memory", "mmap")
+    DEFAULT_SWAP_WRITEBACK_BATCH = 32
+    DEFAULT_PREFETCH = "none"
+    PREFETCH_STRATEGIES = ("none", "sequential", "stride", "working_set")
+    DEFAULT_PREFETCH_DEPTH = 4
+    DEFAULT_PAGE_TABLE = "flat"
+    PAGE_TABLES = ("flat", "radix", "inverted")
+    DEFAULT_PAGE_TABLE_LEVELS = 4
+    PAGE_TABLE_LEVELS = (2, 3, 4)
+    DEFAULT_WALK_CACHE_SIZE = 16
+    DEFAULT_MEMORY_ACCESS_NS = 100
+    DEFAULT_TLB_LOOKUP_NS = 1
+    DEFAULT_LOAD_CONTROL = "none"
+    LOAD_CONTROL_POLICIES = ("none", "pff")
+    DEFAULT_WORKING_SET_WINDOW = 1000
+    DEFAULT_PFF_WINDOW = 1000
+    DEFAULT_PFF_HIGH_PERCENT = 30
+    DEFAULT_PFF_LOW_PERCENT = 5
+    DEFAULT_HUGE_PAGES = "none"
+    HUGE_PAGE_POLICIES = ("none", "always", "large")
+    DEFAULT_HUGE_PAGE_SIZE_KB = 2048
+    DEFAULT_HUGE_MIN_PROCESS_KB = 4096
+    DEFAULT_LOG_CAPACITY = 10000
+    DEFAULT_LOG_LEVEL = "debug"
+    LOG_LEVELS = ("debug", "info", "warning")
+    DEFAULT_LOG_SAMPLE_EVERY = 1
+    DEFAULT_LOG_EXPORT = "none"
+    LOG_EXPORT_FORMATS = ("none", "jsonl", "binary")
+    DEFAULT_CPUS = 1
+    DEFAULT_FRAME_LOCK_STRIPES = 16
 
-    def __init__(self, path: str) -> None:
+    # Parámetros enteros que admiten 0 (TLB totalmente asociativa, semilla,
+    # sin caché de recorridos, registro de eventos sin límite)
+    ZERO_ALLOWED = ("tlb_ways", "replacement_seed", "walk_cache_size", "log_capacity")
+
+    def __init__(self, path: str, overrides: Optional[Mapping[str, Any]] = None) -> None:
         self.path = path
         self.values: Optional[ConfigValues] = None
         self._load()
+        if overrides:
+            self.apply_overrides(overrides)
 
     def _load(self) -> None:
         """Carga el archivo INI y almacena los valores en ConfigValues."""
@@ -66,7 +149,244 @@ class Config:
         if swap <= 0:
             swap = self.DEFAULT_SWAP_SIZE_KB
 
-        self.values = ConfigValues(ram_size_kb=ram, swap_size_kb=swap, page_size_kb=page)
+        allocator = parser.get('Memory', 'FRAME_ALLOCATOR', fallback=self.DEFAULT_FRAME_ALLOCATOR).strip().lower()
+        if allocator not in self.FRAME_ALLOCATORS:
+            allocator = self.DEFAULT_FRAME_ALLOCATOR
+
+        engine = parser.get('Memory', 'ENGINE', fallback=self.DEFAULT_ENGINE).strip().lower()
+        if engine not in self.ENGINES:
+            engine = self.DEFAULT_ENGINE
+
+        paging = parser.get('Memory', 'PAGING', fallback=self.DEFAULT_PAGING).strip().lower()
+        if paging not in self.PAGING_MODES:
+            paging = self.DEFAULT_PAGING
+
+        # Sección opcional 'TLB' (se aceptan también los nombres antiguos
+        # TLB_SIZE, TLB_POLICY y TLB_WAYS)
+        def tlb_option(key: str, default: Any) -> str:
+            return parser.get('TLB', key, fallback=parser.get('TLB', 'TLB_' + key, fallback=default))
+
+        try:
+            tlb_size = int(tlb_option('SIZE', self.DEFAULT_TLB_SIZE))
+            tlb_ways = int(tlb_option('WAYS', self.DEFAULT_TLB_WAYS))
+        except ValueError:
+            tlb_size = self.DEFAULT_TLB_SIZE
+            tlb_ways = self.DEFAULT_TLB_WAYS
+        tlb_policy = str(tlb_option('POLICY', self.DEFAULT_TLB_POLICY)).strip().lower()
+        if tlb_size <= 0:
+            tlb_size = self.DEFAULT_TLB_SIZE
+        if tlb_ways < 0 or (0 < tlb_ways < tlb_size and tlb_size % tlb_ways):
+            tlb_ways = self.DEFAULT_TLB_WAYS
+        if tlb_policy not in self.TLB_POLICIES:
+            tlb_policy = self.DEFAULT_TLB_POLICY
+
+        # Sección opcional 'Replacement'
+        algorithm = parser.get('Replacement', 'ALGORITHM', fallback=self.DEFAULT_REPLACEMENT_ALGORITHM).strip().lower()
+        if algorithm not in self.REPLACEMENT_ALGORITHMS:
+            algorithm = self.DEFAULT_REPLACEMENT_ALGORITHM
+        try:
+            seed = int(parser.get('Replacement', 'SEED', fallback=self.DEFAULT_REPLACEMENT_SEED))
+        except ValueError:
+            seed = self.DEFAULT_REPLACEMENT_SEED
+        if seed < 0:
+            seed = self.DEFAULT_REPLACEMENT_SEED
+
+        # Sección opcional 'Swap'
+        swap_backend = parser.get('Swap', 'BACKEND', fallback=self.DEFAULT_SWAP_BACKEND).strip().lower()
+        if swap_backend not in self.SWAP_BACKENDS:
+            swap_backend = self.DEFAULT_SWAP_BACKEND
+        swap_file = parser.get('Swap', 'FILE', fallback="").strip()
+        try:
+            writeback_batch = int(parser.get('Swap', 'WRITEBACK_BATCH', fallback=self.DEFAULT_SWAP_WRITEBACK_BATCH))
+        except ValueError:
+            writeback_batch = self.DEFAULT_SWAP_WRITEBACK_BATCH
+        if writeback_batch <= 0:
+            writeback_batch = self.DEFAULT_SWAP_WRITEBACK_BATCH
+
+        # Sección opcional 'Prefetch'
+        prefetch = parser.get('Prefetch', 'STRATEGY', fallback=self.DEFAULT_PREFETCH).strip().lower()
+        if prefetch not in self.PREFETCH_STRATEGIES:
+            prefetch = self.DEFAULT_PREFETCH
+        try:
+            prefetch_depth = int(parser.get('Prefetch', 'DEPTH', fallback=self.DEFAULT_PREFETCH_DEPTH))
+        except ValueError:
+            prefetch_depth = self.DEFAULT_PREFETCH_DEPTH
+        if prefetch_depth <= 0:
+            prefetch_depth = self.DEFAULT_PREFETCH_DEPTH
+
+        # Sección opcional 'PageTable'
+        page_table = parser.get('PageTable', 'STRUCTURE', fallback=self.DEFAULT_PAGE_TABLE).strip().lower()
+        if page_table not in self.PAGE_TABLES:
+            page_table = self.DEFAULT_PAGE_TABLE
+        try:
+            levels = int(parser.get('PageTable', 'LEVELS', fallback=self.DEFAULT_PAGE_TABLE_LEVELS))
+            walk_cache_size = int(parser.get('PageTable', 'WALK_CACHE_SIZE', fallback=self.DEFAULT_WALK_CACHE_SIZE))
+            memory_ns = int(parser.get('PageTable', 'MEMORY_ACCESS_NS', fallback=self.DEFAULT_MEMORY_ACCESS_NS))
+            tlb_ns = int(parser.get('PageTable', 'TLB_LOOKUP_NS', fallback=self.DEFAULT_TLB_LOOKUP_NS))
+        except ValueError:
+            levels = self.DEFAULT_PAGE_TABLE_LEVELS
+            walk_cache_size = self.DEFAULT_WALK_CACHE_SIZE
+            memory_ns = self.DEFAULT_MEMORY_ACCESS_NS
+            tlb_ns = self.DEFAULT_TLB_LOOKUP_NS
+        if levels not in self.PAGE_TABLE_LEVELS:
+            levels = self.DEFAULT_PAGE_TABLE_LEVELS
+        if walk_cache_size < 0:
+            walk_cache_size = self.DEFAULT_WALK_CACHE_SIZE
+        if memory_ns <= 0:
+            memory_ns = self.DEFAULT_MEMORY_ACCESS_NS
+        if tlb_ns <= 0:
+            tlb_ns = self.DEFAULT_TLB_LOOKUP_NS
+
+        # Sección opcional 'LoadControl'
+        load_control = parser.get('LoadControl', 'POLICY', fallback=self.DEFAULT_LOAD_CONTROL).strip().lower()
+        if load_control not in self.LOAD_CONTROL_POLICIES:
+            load_control = self.DEFAULT_LOAD_CONTROL
+        load_values = {}
+        for key, default in (
+            ('WORKING_SET_WINDOW', self.DEFAULT_WORKING_SET_WINDOW),
+            ('PFF_WINDOW', self.DEFAULT_PFF_WINDOW),
+            ('PFF_HIGH_PERCENT', self.DEFAULT_PFF_HIGH_PERCENT),
+            ('PFF_LOW_PERCENT', self.DEFAULT_PFF_LOW_PERCENT),
+        ):
+            try:
+                value = int(parser.get('LoadControl', key, fallback=default))
+            except ValueError:
+                value = default
+            load_values[key.lower()] = value if value > 0 else default
+
+        # Sección opcional 'HugePages'
+        huge_pages = parser.get('HugePages', 'POLICY', fallback=self.DEFAULT_HUGE_PAGES).strip().lower()
+        if huge_pages not in self.HUGE_PAGE_POLICIES:
+            huge_pages = self.DEFAULT_HUGE_PAGES
+        try:
+            huge_size = int(parser.get('HugePages', 'SIZE_KB', fallback=self.DEFAULT_HUGE_PAGE_SIZE_KB))
+            huge_min = int(parser.get('HugePages', 'MIN_PROCESS_KB', fallback=self.DEFAULT_HUGE_MIN_PROCESS_KB))
+        except ValueError:
+            huge_size = self.DEFAULT_HUGE_PAGE_SIZE_KB
+            huge_min = self.DEFAULT_HUGE_MIN_PROCESS_KB
+        # La página enorme debe ser un múltiplo (de al menos 2) de la base
+        if huge_size <= page or huge_size % page:
+            huge_pages = self.DEFAULT_HUGE_PAGES
+            huge_size = self.DEFAULT_HUGE_PAGE_SIZE_KB
+        if huge_min <= 0:
+            huge_min = self.DEFAULT_HUGE_MIN_PROCESS_KB
+
+        # Sección opcional 'Logging'
+        try:
+            log_capacity = int(parser.get('Logging', 'CAPACITY', fallback=self.DEFAULT_LOG_CAPACITY))
+            log_sample_every = int(parser.get('Logging', 'SAMPLE_EVERY', fallback=self.DEFAULT_LOG_SAMPLE_EVERY))
+        except ValueError:
+            log_capacity = self.DEFAULT_LOG_CAPACITY
+            log_sample_every = self.DEFAULT_LOG_SAMPLE_EVERY
+        if log_capacity < 0:
+            log_capacity = self.DEFAULT_LOG_CAPACITY
+        if log_sample_every <= 0:
+            log_sample_every = self.DEFAULT_LOG_SAMPLE_EVERY
+        log_level = parser.get('Logging', 'LEVEL', fallback=self.DEFAULT_LOG_LEVEL).strip().lower()
+        if log_level not in self.LOG_LEVELS:
+            log_level = self.DEFAULT_LOG_LEVEL
+        log_export = parser.get('Logging', 'EXPORT', fallback=self.DEFAULT_LOG_EXPORT).strip().lower()
+        if log_export not in self.LOG_EXPORT_FORMATS:
+            log_export = self.DEFAULT_LOG_EXPORT
+        log_export_file = parser.get('Logging', 'EXPORT_FILE', fallback="").strip()
+
+        # Sección opcional 'CPU'
+        try:
+            cpus = int(parser.get('CPU', 'COUNT', fallback=self.DEFAULT_CPUS))
+            stripes = int(parser.get('CPU', 'FRAME_LOCK_STRIPES', fallback=self.DEFAULT_FRAME_LOCK_STRIPES))
+        except ValueError:
+            cpus = self.DEFAULT_CPUS
+            stripes = self.DEFAULT_FRAME_LOCK_STRIPES
+        if cpus <= 0:
+            cpus = self.DEFAULT_CPUS
+        if stripes <= 0:
+            stripes = self.DEFAULT_FRAME_LOCK_STRIPES
+
+        self.values = ConfigValues(
+            ram_size_kb=ram,
+            swap_size_kb=swap,
+            page_size_kb=page,
+            frame_allocator=allocator,
+            tlb_size=tlb_size,
+            tlb_policy=tlb_policy,
+            tlb_ways=tlb_ways,
+            replacement_algorithm=algorithm,
+            replacement_seed=seed,
+            engine=engine,
+            paging=paging,
+            swap_backend=swap_backend,
+            swap_file=swap_file,
+            swap_writeback_batch=writeback_batch,
+            prefetch=prefetch,
+            prefetch_depth=prefetch_depth,
+            page_table=page_table,
+            page_table_levels=levels,
+            walk_cache_size=walk_cache_size,
+            memory_access_ns=memory_ns,
+            tlb_lookup_ns=tlb_ns,
+            load_control=load_control,
+            **load_values,
+            huge_pages=huge_pages,
+            huge_page_size_kb=huge_size,
+            huge_min_process_kb=huge_min,
+            log_capacity=log_capacity,
+            log_level=log_level,
+            log_sample_every=log_sample_every,
+            log_export=log_export,
+            log_export_file=log_export_file,
+            cpus=cpus,
+            frame_lock_stripes=stripes,
+        )
+
+    def _choices(self) -> Dict[str, tuple]:
+        return {
+            "frame_allocator": self.FRAME_ALLOCATORS,
+            "engine": self.ENGINES,
+            "paging": self.PAGING_MODES,
+            "tlb_policy": self.TLB_POLICIES,
+            "replacement_algorithm": self.REPLACEMENT_ALGORITHMS,
+            "swap_backend": self.SWAP_BACKENDS,
+            "prefetch": self.PREFETCH_STRATEGIES,
+            "load_control": self.LOAD_CONTROL_POLICIES,
+            "page_table": self.PAGE_TABLES,
+            "page_table_levels": self.PAGE_TABLE_LEVELS,
+            "huge_pages": self.HUGE_PAGE_POLICIES,
+            "log_level": self.LOG_LEVELS,
+            "log_export": self.LOG_EXPORT_FORMATS,
+        }
+
+    def apply_overrides(self, overrides: Mapping[str, Any]) -> None:
+        """Sustituye valores cargados del INI (p. ej. desde la línea de
+        comandos o un barrido de parámetros).
+
+        A diferencia del archivo INI, un valor inválido no se reemplaza por
+        el predeterminado sino que lanza ``ValueError``.
+        """
+        assert self.values is not None
+        types = {f.name: f.type for f in fields(ConfigValues)}
+        choices = self._choices()
+        for name, raw in overrides.items():
+            if name not in types:
+                raise ValueError(f"Parámetro de configuración desconocido: {name}")
+            if types[name] in (int, "int"):
+                try:
+                    value: Any = int(raw)
+                except (TypeError, ValueError):
+                    raise ValueError(f"{name} debe ser un entero: {raw!r}") from None
+                if value < 0 or (value == 0 and name not in self.ZERO_ALLOWED):
+                    raise ValueError(f"{name} debe ser positivo: {raw!r}")
+                if name in choices and value not in choices[name]:
+                    raise ValueError(f"{name} debe ser uno de {', '.join(map(str, choices[name]))}: {raw!r}")
+            else:
+                value = str(raw).strip()
+                if name in choices:
+                    value = value.lower()
+                    if value not in choices[name]:
+                        raise ValueError(f"{name} debe ser uno de {', '.join(choices[name])}: {raw!r}")
+            setattr(self.values, name, value)
+        size, ways = self.values.tlb_size, self.values.tlb_ways
+        if 0 < ways < size and size % ways:
+            raise ValueError(f"tlb_ways ({ways}) debe dividir a tlb_size ({size}).")
 
     @property
     def ram_frames(self) -> int:
@@ -80,6 +400,93 @@ class Config:
         assert self.values is not None
         return self.values.swap_size_kb // self.values.page_size_kb
 
+    def replacement_description(self) -> str:
+        """Describe el algoritmo de reemplazo (y su semilla si es aleatorio)."""
+        assert self.values is not None
+        algorithm = self.values.replacement_algorithm
+        if algorithm == "random":
+            return f"RANDOM (semilla {self.values.replacement_seed})"
+        return algorithm.upper()
+
+    def tlb_description(self) -> str:
+        """Describe la asociatividad y política de la TLB."""
+        assert self.values is not None
+        ways = self.values.tlb_ways
+        if ways <= 0 or ways >= self.values.tlb_size:
+            layout = "totalmente asociativa"
+        else:
+            layout = f"asociativa de {ways} vías"
+        if self.values.tlb_policy == "random":
+            return f"{layout}, política RANDOM (semilla {self.values.replacement_seed})"
+        return f"{layout}, política {self.values.tlb_policy.upper()}"
+
+    def swap_description(self) -> str:
+        """Describe dónde se guarda el contenido de las páginas en Swap."""
+        assert self.values is not None
+        if self.values.swap_backend != "mmap":
+            return "solo metadatos"
+        target = self.values.swap_file or "archivo temporal"
+        # Mismo límite que aplica MmapSwapDevice
+        batch = max(1, min(self.values.swap_writeback_batch, self.swap_frames // 2))
+        return f"mmap ({target}), escritura diferida en lotes de {batch} páginas"
+
+    def prefetch_description(self) -> str:
+        """Describe la estrategia de prelectura en los fallos de página."""
+        assert self.values is not None
+        if self.values.prefetch == "none":
+            return "desactivada"
+        return f"{self.values.prefetch}, hasta {self.values.prefetch_depth} páginas"
+
+    def page_table_description(self) -> str:
+        """Describe la estructura de la tabla de páginas."""
+        assert self.values is not None
+        v = self.values
+        if v.page_table == "radix":
+            return f"jerárquica de {v.page_table_levels} niveles, caché de recorridos de {v.walk_cache_size} entradas"
+        if v.page_table == "inverted":
+            return "invertida"
+        return "lineal"
+
+    def load_control_description(self) -> str:
+        """Describe el control de carga por frecuencia de fallos."""
+        assert self.values is not None
+        v = self.values
+        if v.load_control == "none":
+            return "desactivado"
+        return (
+            f"PFF, ventana {v.pff_window} accesos, umbrales {v.pff_low_percent}%-{v.pff_high_percent}%, "
+            f"τ = {v.working_set_window}"
+        )
+
+    def huge_pages_description(self) -> str:
+        """Describe la política de páginas enormes."""
+        assert self.values is not None
+        v = self.values
+        if v.huge_pages == "none":
+            return "desactivadas"
+        who = "todos los procesos" if v.huge_pages == "always" else f"procesos de al menos {v.huge_min_process_kb} KB"
+        return f"{v.huge_page_size_kb} KB ({v.huge_page_size_kb // v.page_size_kb} páginas base) para {who}"
+
+    def logging_description(self) -> str:
+        """Describe el registro de eventos."""
+        assert self.values is not None
+        v = self.values
+        capacity = f"{v.log_capacity} eventos" if v.log_capacity else "sin límite"
+        text = f"nivel {v.log_level}, búfer de {capacity}"
+        if v.log_sample_every > 1:
+            text += f", 1 de cada {v.log_sample_every} eventos de depuración"
+        if v.log_export != "none":
+            text += f", exportación {v.log_export}"
+        return text
+
+    def cpu_description(self) -> str:
+        """Describe el modo multi-CPU."""
+        assert self.values is not None
+        v = self.values
+        if v.cpus == 1:
+            return "1 (sin cerrojos)"
+        return f"{v.cpus} con TLB propia, {v.frame_lock_stripes} cerrojos de marcos"
+
     def summary(self) -> str:
         """Devuelve un resumen legible de la configuración."""
         assert self.values is not None
@@ -88,5 +495,17 @@ class Config:
             f"Tamaño Swap: {self.values.swap_size_kb} KB\n"
             f"Tamaño de página: {self.values.page_size_kb} KB\n"
             f"Marcos en RAM: {self.ram_frames}\n"
-            f"Marcos en Swap: {self.swap_frames}"
+            f"Marcos en Swap: {self.swap_frames}\n"
+            f"Asignación de marcos: {self.values.frame_allocator}\n"
+            f"Motor de estado: {self.values.engine}\n"
+            f"Paginación: {'bajo demanda' if self.values.paging == 'demand' else 'completa al crear el proceso'}\n"
+            f"Respaldo de Swap: {self.swap_description()}\n"
+            f"TLB: {self.values.tlb_size} entradas, {self.tlb_description()}\n"
+            f"Algoritmo de reemplazo: {self.replacement_description()}\n"
+            f"Tabla de páginas: {self.page_table_description()}\n"
+            f"Páginas enormes: {self.huge_pages_description()}\n"
+            f"Prelectura: {self.prefetch_description()}\n"
+            f"Control de carga: {self.load_control_description()}\n"
+            f"CPU: {self.cpu_description()}\n"
+            f"Registro de eventos: {self.logging_description()}"
         )
\ No newline at end of file
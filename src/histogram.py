@@ -0,0 +1,144 @@
+"""
+Histogramas de latencias de memoria constante.
+
+``LatencyHistogram`` usa cubetas logarítmicas en base 2: la cubeta ``i``
+cuenta las muestras con duración en ``[2**i, 2**(i+1))`` microsegundos (la
+cubeta 0 incluye también las inferiores a 1 µs). Basta para operaciones de
+E/S.
+
+``HdrHistogram`` sigue el esquema de HdrHistogram para operaciones de
+nanosegundos: cada potencia de 2 se divide en ``2**precision_bits`` cubetas
+lineales, de modo que el error relativo de cualquier percentil es menor que
+``2**-precision_bits`` en todo el rango.
+
+En ambos registrar una muestra cuesta O(1) y la memoria no depende del
+número de muestras.
+"""
+
+from typing import Dict, List, Tuple
+
+
+class LatencyHistogram:
+    """Acumula duraciones (en segundos) en cubetas log2 de microsegundos."""
+
+    def __init__(self) -> None:
+        self.buckets: List[int] = []
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        micros = int(seconds * 1_000_000)
+        bucket = micros.bit_length() - 1 if micros > 1 else 0
+        buckets = self.buckets
+        if bucket >= len(buckets):
+            buckets.extend([0] * (bucket + 1 - len(buckets)))
+        buckets[bucket] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, fraction: float) -> float:
+        """Cota superior (en segundos) de la cubeta que contiene el percentil."""
+        if not self.count:
+            return 0.0
+        target = fraction * self.count
+        running = 0
+        for bucket, count in enumerate(self.buckets):
+            running += count
+            if running >= target:
+                return (2 ** (bucket + 1)) / 1_000_000
+        return self.max
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "count": self.count,
+            "mean_us": self.mean * 1_000_000,
+            "p50_us": self.percentile(0.5) * 1_000_000,
+            "p99_us": self.percentile(0.99) * 1_000_000,
+            "max_us": self.max * 1_000_000,
+            "buckets": list(self.buckets),
+        }
+
+    def summary(self) -> str:
+        """Una línea con media, percentiles y máximo en microsegundos."""
+        if not self.count:
+            return "sin muestras"
+        return (
+            f"{self.count} muestras, media {self.mean * 1e6:.1f} µs, "
+            f"p50 < {self.percentile(0.5) * 1e6:.0f} µs, "
+            f"p99 < {self.percentile(0.99) * 1e6:.0f} µs, "
+            f"máx {self.max * 1e6:.1f} µs"
+        )
+
+
+class HdrHistogram:
+    """Histograma de rango dinámico alto en nanosegundos."""
+
+    PERCENTILES = (0.5, 0.9, 0.99, 0.999)
+
+    def __init__(self, precision_bits: int = 4) -> None:
+        self.precision_bits = precision_bits
+        # (desplazamiento, mantisa) -> muestras
+        self.counts: Dict[Tuple[int, int], int] = {}
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = 0
+        self.max_ns = 0
+
+    def record_ns(self, nanoseconds: int) -> None:
+        shift = nanoseconds.bit_length() - self.precision_bits - 1
+        if shift < 0:
+            shift = 0
+        key = (shift, nanoseconds >> shift)
+        counts = self.counts
+        counts[key] = counts.get(key, 0) + 1
+        if not self.count or nanoseconds < self.min_ns:
+            self.min_ns = nanoseconds
+        if nanoseconds > self.max_ns:
+            self.max_ns = nanoseconds
+        self.count += 1
+        self.total_ns += nanoseconds
+
+    def record(self, seconds: float) -> None:
+        self.record_ns(int(seconds * 1_000_000_000))
+
+    @property
+    def mean_ns(self) -> float:
+        return self.total_ns / self.count if self.count else 0.0
+
+    def percentile_ns(self, fraction: float) -> int:
+        """Cota superior (en nanosegundos) de la cubeta que contiene el percentil."""
+        if not self.count:
+            return 0
+        target = fraction * self.count
+        running = 0
+        for shift, mantissa in sorted(self.counts):
+            running += self.counts[(shift, mantissa)]
+            if running >= target:
+                return min(((mantissa + 1) << shift) - 1, self.max_ns)
+        return self.max_ns
+
+    def to_dict(self) -> Dict[str, object]:
+        result: Dict[str, object] = {
+            "count": self.count,
+            "total_ns": self.total_ns,
+            "mean_ns": self.mean_ns,
+            "min_ns": self.min_ns,
+            "max_ns": self.max_ns,
+        }
+        for fraction in self.PERCENTILES:
+            result[f"p{fraction * 100:g}_ns"] = self.percentile_ns(fraction)
+        return result
+
+    def summary(self) -> str:
+        """Una línea con media, percentiles y máximo en nanosegundos."""
+        if not self.count:
+            return "sin muestras"
+        percentiles = ", ".join(f"p{f * 100:g} {self.percentile_ns(f)} ns" for f in self.PERCENTILES)
+        return f"{self.count} muestras, media {self.mean_ns:.0f} ns, {percentiles}, máx {self.max_ns} ns"
@@ -0,0 +1,265 @@
+"""
+Control de carga por conjunto de trabajo y frecuencia de fallos (PFF).
+
+Para cada proceso se mantiene su conjunto de trabajo W(t, τ): las páginas
+distintas referenciadas en sus últimas τ referencias (tiempo virtual del
+proceso), junto con sus accesos y fallos. Cada ``PFF_WINDOW`` accesos el
+controlador calcula la tasa de fallos del sistema en la ventana:
+
+* Si supera ``PFF_HIGH_PERCENT`` y la suma de los conjuntos de trabajo de
+  los procesos activos no cabe en la RAM, hay hiperpaginación (thrashing):
+  se suspende el proceso activo con más fallos en la ventana, moviendo
+  todas sus páginas residentes a Swap (``ProcessState.SWAPPED``).
+* Si baja de ``PFF_LOW_PERCENT`` y hay procesos suspendidos, se reanuda el
+  más antiguo cuando su conjunto de trabajo cabe junto al de los activos;
+  sus páginas del conjunto de trabajo vuelven a la RAM.
+
+Los accesos de un proceso suspendido no se ejecutan y devuelven
+``ACCESS_SUSPENDED``; si no queda ningún proceso activo se reanuda el
+suspendido más antiguo aunque su conjunto de trabajo no quepa.
+
+El controlador se activa con ``POLICY = pff`` en la sección
+``[LoadControl]``. El gestor lo guarda en ``load_controller``: su
+``access`` le pasa cada acceso y ``remove_process`` le avisa de los
+procesos terminados.
+"""
+
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+from config import Config
+from memory_manager import ACCESS_FAULT, ACCESS_MINOR_FAULT, ACCESS_SUSPENDED, MemoryManager
+from process import ProcessState
+
+
+class ProcessLoad:
+    """Conjunto de trabajo y fallos de un proceso."""
+
+    __slots__ = ("window", "refs", "counts", "accesses", "faults", "window_faults")
+
+    def __init__(self, window: int) -> None:
+        self.window = window
+        self.refs: Deque[int] = deque()
+        self.counts: Dict[int, int] = {}
+        self.accesses = 0
+        self.faults = 0
+        self.window_faults = 0
+
+    def reference(self, page_number: int) -> None:
+        """Registra una referencia en tiempo virtual del proceso (O(1))."""
+        self.accesses += 1
+        self.refs.append(page_number)
+        counts = self.counts
+        counts[page_number] = counts.get(page_number, 0) + 1
+        if len(self.refs) > self.window:
+            old = self.refs.popleft()
+            remaining = counts[old] - 1
+            if remaining:
+                counts[old] = remaining
+            else:
+                del counts[old]
+
+    @property
+    def working_set_size(self) -> int:
+        return len(self.counts)
+
+    @property
+    def fault_rate(self) -> float:
+        return self.faults / self.accesses * 100 if self.accesses else 0.0
+
+
+class PFFController:
+    """Controlador de carga por frecuencia de fallos de página."""
+
+    name = "pff"
+
+    def __init__(
+        self,
+        manager: MemoryManager,
+        working_set_window: int,
+        pff_window: int,
+        high_percent: int,
+        low_percent: int,
+    ) -> None:
+        self.manager = manager
+        self.working_set_window = working_set_window
+        self.pff_window = pff_window
+        self.high_percent = high_percent
+        self.low_percent = low_percent
+        self.loads: Dict[int, ProcessLoad] = {}
+        # PID suspendidos, en orden de suspensión
+        self.suspended: Deque[int] = deque()
+        # Accesos de la ventana (incluidos los bloqueados) y, de ellos, los
+        # ejecutados, sobre los que se calcula la tasa de fallos
+        self._window_accesses = 0
+        self._window_served = 0
+        self._window_faults = 0
+
+        # Métricas
+        self.thrashing_windows = 0
+        self.suspensions = 0
+        self.resumptions = 0
+        self.suspended_pages = 0
+        self.resumed_pages = 0
+        self.blocked_accesses = 0
+        self.last_fault_rate = 0.0
+        self.last_working_set = 0
+
+    def _load(self, pid: int) -> ProcessLoad:
+        load = self.loads.get(pid)
+        if load is None:
+            load = self.loads[pid] = ProcessLoad(self.working_set_window)
+        return load
+
+    def access(self, pid: int, page_number: int) -> int:
+        """Ejecuta el acceso en el gestor salvo que el proceso esté suspendido."""
+        process = self.manager.processes.get(pid)
+        if process is not None and process.state is ProcessState.SWAPPED:
+            self.manager.total_accesses += 1
+            self.blocked_accesses += 1
+            # También cuentan para la ventana, para que los suspendidos
+            # puedan reanudarse aunque no quede ningún proceso activo
+            self._tick()
+            return ACCESS_SUSPENDED
+        result = self.manager._access(pid, page_number)
+        if process is None or not (0 <= page_number < process.pages_needed):
+            return result
+        load = self._load(pid)
+        load.reference(page_number)
+        self._window_served += 1
+        if result == ACCESS_FAULT or result == ACCESS_MINOR_FAULT:
+            load.faults += 1
+            load.window_faults += 1
+            self._window_faults += 1
+        self._tick()
+        return result
+
+    def _tick(self) -> None:
+        self._window_accesses += 1
+        if self._window_accesses >= self.pff_window:
+            self._evaluate()
+
+    def process_removed(self, pid: int) -> None:
+        """Olvida un proceso que el gestor acaba de terminar."""
+        self.loads.pop(pid, None)
+        if pid in self.suspended:
+            self.suspended.remove(pid)
+
+    def _evaluate(self) -> None:
+        """Decide al final de cada ventana si suspender o reanudar."""
+        manager = self.manager
+        rate = self._window_faults / self._window_served * 100 if self._window_served else 0.0
+        active = [
+            pid for pid, process in manager.processes.items()
+            if process.state is not ProcessState.SWAPPED
+        ]
+        working_set = sum(self.loads[pid].working_set_size for pid in active if pid in self.loads)
+        frames = manager.ram_allocator.capacity
+        self.last_fault_rate = rate
+        self.last_working_set = working_set
+
+        if rate > self.high_percent and working_set > frames:
+            self.thrashing_windows += 1
+            if len(active) > 1:
+                victim = max(
+                    active,
+                    key=lambda pid: (
+                        self.loads[pid].window_faults if pid in self.loads else 0,
+                        manager.processes[pid].resident_pages,
+                    ),
+                )
+                self.suspend(victim)
+        elif self.suspended and (rate < self.low_percent or not active):
+            candidate = self.suspended[0]
+            load = self.loads.get(candidate)
+            needed = load.working_set_size if load else 0
+            if working_set + needed <= frames or not active:
+                self.resume(candidate)
+
+        self._window_accesses = 0
+        self._window_served = 0
+        self._window_faults = 0
+        for load in self.loads.values():
+            load.window_faults = 0
+
+    def suspend(self, pid: int) -> bool:
+        moved = self.manager.suspend_process(pid)
+        if moved is None:
+            return False
+        self.suspended.append(pid)
+        self.suspensions += 1
+        self.suspended_pages += moved
+        return True
+
+    def resume(self, pid: int) -> None:
+        load = self.loads.get(pid)
+        pages = sorted(load.counts) if load else []
+        self.resumed_pages += self.manager.resume_process(pid, pages)
+        self.suspended.remove(pid)
+        self.resumptions += 1
+
+    @property
+    def thrashing(self) -> bool:
+        """Indica si la última ventana evaluada mostró hiperpaginación."""
+        return (
+            self.last_fault_rate > self.high_percent
+            and self.last_working_set > self.manager.ram_allocator.capacity
+        )
+
+    def process_metrics(self, pid: int) -> Dict[str, Any]:
+        load = self.loads.get(pid)
+        process = self.manager.processes[pid]
+        return {
+            "state": process.state.name.lower(),
+            "accesses": load.accesses if load else 0,
+            "faults": load.faults if load else 0,
+            "fault_rate": load.fault_rate if load else 0.0,
+            "working_set_size": load.working_set_size if load else 0,
+        }
+
+    def metrics_dict(self) -> Dict[str, Any]:
+        return {
+            "load_control": self.name,
+            "thrashing": self.thrashing,
+            "thrashing_windows": self.thrashing_windows,
+            "system_fault_rate": self.last_fault_rate,
+            "total_working_set": self.last_working_set,
+            "suspensions": self.suspensions,
+            "resumptions": self.resumptions,
+            "suspended_processes": len(self.suspended),
+            "suspended_pages": self.suspended_pages,
+            "resumed_pages": self.resumed_pages,
+            "blocked_accesses": self.blocked_accesses,
+        }
+
+    def summary(self) -> str:
+        lines = [
+            f"Control de carga (PFF): {'hiperpaginación' if self.thrashing else 'normal'}",
+            f"Tasa de fallos en la última ventana: {self.last_fault_rate:.2f}%",
+            f"Conjunto de trabajo de los activos: {self.last_working_set} páginas",
+            f"Ventanas con hiperpaginación: {self.thrashing_windows}",
+            f"Suspensiones: {self.suspensions} ({self.suspended_pages} páginas)",
+            f"Reanudaciones: {self.resumptions} ({self.resumed_pages} páginas)",
+            f"Accesos bloqueados por suspensión: {self.blocked_accesses}",
+        ]
+        for pid in self.manager.processes:
+            m = self.process_metrics(pid)
+            lines.append(
+                f"  P{pid} [{m['state']}]: {m['faults']}/{m['accesses']} fallos "
+                f"({m['fault_rate']:.2f}%), conjunto de trabajo {m['working_set_size']}"
+            )
+        return "\n".join(lines) + "\n"
+
+
+def create_load_controller(manager: MemoryManager, config: Config) -> Optional[PFFController]:
+    """Crea el controlador indicado por ``POLICY`` en ``[LoadControl]``."""
+    values = config.values
+    if values.load_control != "pff":
+        return None
+    return PFFController(
+        manager,
+        values.working_set_window,
+        values.pff_window,
+        values.pff_high_percent,
+        values.pff_low_percent,
+    )
@@ -1,22 +1,402 @@
 """
-Registro de eventos para el simulador de memoria. Permite almacenar mensajes
-significativos y recuperar el historial completo.
+Registro estructurado de eventos del simulador de memoria.
+
+Cada evento es un registro con tipo y campos enteros (``LogEvent``) en
+lugar de un mensaje ya formateado; el texto solo se construye al mostrarlo
+(``render``). Los eventos se guardan en un búfer circular de ``CAPACITY``
+entradas (0 = sin límite) y, opcionalmente, se envían según se producen a
+un archivo JSON Lines o binario.
+
+El filtrado se decide antes de construir nada: los eventos por debajo del
+nivel mínimo se descartan y, de los de nivel ``DEBUG`` (aciertos y
+swaps de entrada, los más numerosos), se guarda uno de cada
+``SAMPLE_EVERY``.
+
+``attach`` conecta el registro al gestor a través de su atributo
+``event_log``: el gestor llama a ``page_accessed``, ``process_created``,
+``process_removed``, ``page_evicted`` y ``page_swapped_in``. Sin registro
+conectado el gestor solo comprueba que el atributo es ``None``; ``detach``
+lo desconecta.
+
+Formato binario: la cabecera ``BINARY_MAGIC`` seguida de registros
+``RECORD`` en little-endian (secuencia, tipo, pid, página, marco, detalle,
+longitud del texto) y el texto en UTF-8.
 """
 
-from typing import List
+import json
+import struct
+from collections import deque
+from enum import IntEnum
+from typing import IO, Any, Deque, Dict, Iterator, List, NamedTuple, Optional
 
+from config import Config
+from memory_manager import (
+    ACCESS_FAULT,
+    ACCESS_HIT,
+    ACCESS_INVALID_PAGE,
+    ACCESS_MINOR_FAULT,
+    ACCESS_NO_MEMORY,
+    ACCESS_NO_PROCESS,
+    ACCESS_SUSPENDED,
+    ACCESS_TLB_HIT,
+    ACCESS_UNMAPPED,
+    MemoryManager,
+)
 
-class Logger:
-    """Acumula mensajes de eventos."""
 
-    def __init__(self) -> None:
-        self._events: List[str] = []
+class EventType(IntEnum):
+    CREATE = 1
+    TLB_HIT = 2
+    HIT = 3
+    FAULT = 4
+    MINOR_FAULT = 5
+    EVICT = 6
+    SWAP_IN = 7
+    TERMINATE = 8
+    ERROR = 9
+    MESSAGE = 10
+
+
+class Level(IntEnum):
+    DEBUG = 10
+    INFO = 20
+    WARNING = 30
+
+
+EVENT_LEVELS: Dict[EventType, Level] = {
+    EventType.CREATE: Level.INFO,
+    EventType.TLB_HIT: Level.DEBUG,
+    EventType.HIT: Level.DEBUG,
+    EventType.FAULT: Level.INFO,
+    EventType.MINOR_FAULT: Level.INFO,
+    EventType.EVICT: Level.INFO,
+    EventType.SWAP_IN: Level.DEBUG,
+    EventType.TERMINATE: Level.INFO,
+    EventType.ERROR: Level.WARNING,
+    EventType.MESSAGE: Level.INFO,
+}
+
+
+class LogEvent(NamedTuple):
+    """Evento registrado.
+
+    ``page`` es el número de páginas en ``CREATE``; ``frame`` es la ranura
+    de Swap en ``EVICT`` y el marco de RAM en el resto; ``detail`` es el
+    código ``ACCESS_*`` en ``ERROR`` y el marco liberado en ``EVICT``. Los
+    campos sin valor valen -1.
+    """
+
+    seq: int
+    kind: EventType
+    pid: int = -1
+    page: int = -1
+    frame: int = -1
+    detail: int = 0
+    text: str = ""
+
+
+# Mensajes de los accesos fallidos por código ACCESS_*
+ERROR_MESSAGES = {
+    ACCESS_NO_PROCESS: "Proceso {pid} no encontrado.",
+    ACCESS_INVALID_PAGE: "Número de página {page} inválido para P{pid}.",
+    ACCESS_UNMAPPED: "La página {page} de P{pid} no está asignada en RAM ni Swap.",
+    ACCESS_NO_MEMORY: "Memoria insuficiente para la página {page} de P{pid}: RAM y Swap llenas.",
+    ACCESS_SUSPENDED: "Acceso a Pag{page} de P{pid} bloqueado: proceso suspendido por el control de carga.",
+}
+
+
+def render(event: LogEvent) -> str:
+    """Construye el mensaje legible de un evento."""
+    kind, pid, page, frame = event.kind, event.pid, event.page, event.frame
+    if kind == EventType.CREATE:
+        return f"Proceso {pid} creado con {page} páginas."
+    if kind == EventType.TLB_HIT:
+        return f"Acceso exitoso a P{pid} Pag{page} en RAM[{frame}] (TLB hit)."
+    if kind == EventType.HIT:
+        return f"Acceso exitoso a P{pid} Pag{page} en RAM[{frame}]."
+    if kind == EventType.FAULT:
+        return f"Fallo de página: página {page} de P{pid} traída desde Swap a RAM[{frame}]."
+    if kind == EventType.MINOR_FAULT:
+        return f"Fallo de página menor: página {page} de P{pid} asignada en RAM[{frame}]."
+    if kind == EventType.EVICT:
+        return f"Página {page} del Proceso {pid} movida a Swap[{frame}]"
+    if kind == EventType.SWAP_IN:
+        return f"Página {page} del Proceso {pid} cargada desde Swap en RAM[{frame}]."
+    if kind == EventType.TERMINATE:
+        return f"Proceso {pid} terminado y memoria liberada."
+    if kind == EventType.ERROR:
+        return ERROR_MESSAGES.get(event.detail, "Acceso inválido a Pag{page} de P{pid}.").format(pid=pid, page=page)
+    return event.text
+
+
+# ----------------------------------------------------------------------
+# Exportación
+# ----------------------------------------------------------------------
+BINARY_MAGIC = b"MEVB\x01\x00\x00\x00"
+RECORD = struct.Struct("<QBqqqqH")
+
+
+def event_to_dict(event: LogEvent) -> Dict[str, Any]:
+    record: Dict[str, Any] = {
+        "seq": event.seq,
+        "type": event.kind.name.lower(),
+        "level": EVENT_LEVELS[event.kind].name.lower(),
+        "pid": event.pid,
+        "page": event.page,
+        "frame": event.frame,
+        "detail": event.detail,
+    }
+    if event.text:
+        record["text"] = event.text
+    return record
+
+
+class JsonLinesSink:
+    """Escribe un objeto JSON por evento y línea."""
+
+    def __init__(self, path: str) -> None:
+        self._file: IO[str] = open(path, "w", encoding="utf-8")
+
+    def write(self, event: LogEvent) -> None:
+        self._file.write(json.dumps(event_to_dict(event), ensure_ascii=False) + "\n")
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class BinarySink:
+    """Escribe los eventos como registros binarios de ancho fijo."""
+
+    def __init__(self, path: str) -> None:
+        self._file: IO[bytes] = open(path, "wb")
+        self._file.write(BINARY_MAGIC)
+
+    def write(self, event: LogEvent) -> None:
+        text = event.text.encode("utf-8")
+        self._file.write(RECORD.pack(
+            event.seq, event.kind, event.pid, event.page, event.frame, event.detail, len(text)
+        ) + text)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+SINKS = {
+    "jsonl": JsonLinesSink,
+    "binary": BinarySink,
+}
+
+
+def create_sink(fmt: str, path: str):
+    """Crea el exportador indicado (``jsonl`` o ``binary``)."""
+    try:
+        cls = SINKS[fmt.lower()]
+    except KeyError:
+        raise ValueError(f"Formato de exportación de eventos desconocido: {fmt}") from None
+    return cls(path)
+
+
+def read_events(path: str) -> Iterator[LogEvent]:
+    """Lee un archivo exportado en cualquiera de los dos formatos."""
+    with open(path, "rb") as fh:
+        if fh.read(len(BINARY_MAGIC)) == BINARY_MAGIC:
+            while True:
+                header = fh.read(RECORD.size)
+                if len(header) < RECORD.size:
+                    return
+                seq, kind, pid, page, frame, detail, length = RECORD.unpack(header)
+                text = fh.read(length).decode("utf-8")
+                yield LogEvent(seq, EventType(kind), pid, page, frame, detail, text)
+    with open(path, "r", encoding="utf-8") as fh:
+        for line in fh:
+            if line.strip():
+                d = json.loads(line)
+                yield LogEvent(
+                    d["seq"], EventType[d["type"].upper()], d["pid"], d["page"], d["frame"], d["detail"], d.get("text", "")
+                )
+
+
+# ----------------------------------------------------------------------
+# Registro
+# ----------------------------------------------------------------------
+class EventLog:
+    """Búfer circular de eventos con filtrado por nivel y muestreo."""
+
+    def __init__(
+        self,
+        capacity: int = 0,
+        level: Level = Level.DEBUG,
+        sample_every: int = 1,
+        sink=None,
+    ) -> None:
+        self.capacity = capacity
+        self.min_level = level
+        self.sample_every = max(1, sample_every)
+        self.sink = sink
+        self._events: Deque[LogEvent] = deque(maxlen=capacity or None)
+        self._seq = 0
+        self._debug_seen = 0
+        # Gestor conectado con attach
+        self.manager: Optional[MemoryManager] = None
+
+        # Métricas del propio registro
+        self.recorded = 0
+        self.overwritten = 0
+        self.filtered = 0
+        self.sampled_out = 0
+
+    # -- filtrado y almacenamiento ------------------------------------
+    def wants(self, kind: EventType) -> bool:
+        """Decide si el evento se guarda, antes de construirlo."""
+        level = EVENT_LEVELS[kind]
+        if level < self.min_level:
+            self.filtered += 1
+            return False
+        if level == Level.DEBUG and self.sample_every > 1:
+            self._debug_seen += 1
+            if self._debug_seen % self.sample_every:
+                self.sampled_out += 1
+                return False
+        return True
+
+    def record(self, kind: EventType, pid: int = -1, page: int = -1, frame: int = -1, detail: int = 0, text: str = "") -> None:
+        """Guarda un evento si pasa el filtro."""
+        if self.wants(kind):
+            self._append(kind, pid, page, frame, detail, text)
+
+    def _append(self, kind: EventType, pid: int, page: int, frame: int, detail: int = 0, text: str = "") -> None:
+        event = LogEvent(self._seq, kind, pid, page, frame, detail, text)
+        self._seq += 1
+        if self.capacity and len(self._events) == self.capacity:
+            self.overwritten += 1
+        self._events.append(event)
+        self.recorded += 1
+        if self.sink is not None:
+            self.sink.write(event)
 
     def log(self, message: str) -> None:
-        self._events.append(message)
+        """Registra un mensaje libre (nivel INFO)."""
+        self.record(EventType.MESSAGE, text=message)
 
-    def get_events(self) -> List[str]:
+    # -- consulta ------------------------------------------------------
+    def events(self) -> List[LogEvent]:
         return list(self._events)
 
+    def get_events(self) -> List[str]:
+        """Mensajes de los eventos guardados, del más antiguo al más reciente."""
+        return [render(event) for event in self._events]
+
     def clear(self) -> None:
-        self._events.clear()
\ No newline at end of file
+        self._events.clear()
+
+    def export(self, path: str, fmt: str = "jsonl") -> int:
+        """Escribe los eventos del búfer en un archivo; devuelve cuántos."""
+        sink = create_sink(fmt, path)
+        try:
+            for event in self._events:
+                sink.write(event)
+        finally:
+            sink.close()
+        return len(self._events)
+
+    def close(self) -> None:
+        if self.sink is not None:
+            self.sink.close()
+            self.sink = None
+
+    def summary(self) -> str:
+        kept = len(self._events)
+        limit = self.capacity or "sin límite"
+        return (
+            f"{kept} eventos en el búfer ({limit}); {self.recorded} registrados, "
+            f"{self.overwritten} sobrescritos, {self.filtered} filtrados por nivel, "
+            f"{self.sampled_out} descartados por muestreo"
+        )
+
+    def metrics_dict(self) -> Dict[str, int]:
+        return {
+            "buffered": len(self._events),
+            "capacity": self.capacity,
+            "recorded": self.recorded,
+            "overwritten": self.overwritten,
+            "filtered": self.filtered,
+            "sampled_out": self.sampled_out,
+        }
+
+    # -- conexión con el gestor ----------------------------------------
+    def attach(self, manager: MemoryManager) -> None:
+        """Conecta el registro al gestor, que le notificará sus eventos."""
+        self.detach()
+        self.manager = manager
+        manager.event_log = self
+
+    def detach(self) -> None:
+        """Desconecta el registro del gestor al que estaba conectado."""
+        manager = self.manager
+        if manager is not None and manager.event_log is self:
+            manager.event_log = None
+        self.manager = None
+
+    def page_accessed(self, pid: int, page_number: int, result: int) -> None:
+        level = _ACCESS_LEVELS[result]
+        if level < self.min_level:
+            self.filtered += 1
+            return
+        if level == Level.DEBUG and self.sample_every > 1:
+            self._debug_seen += 1
+            if self._debug_seen % self.sample_every:
+                self.sampled_out += 1
+                return
+        kind = _ACCESS_KINDS[result]
+        if kind is EventType.ERROR:
+            self._append(kind, pid, page_number, -1, result)
+        else:
+            frame = self.manager._frame_of(pid, page_number)
+            self._append(kind, pid, page_number, -1 if frame is None else frame)
+
+    def process_created(self, process) -> None:
+        if self.wants(EventType.CREATE):
+            self._append(EventType.CREATE, process.pid, process.pages_needed, -1)
+
+    def process_removed(self, pid: int) -> None:
+        if self.wants(EventType.TERMINATE):
+            self._append(EventType.TERMINATE, pid, -1, -1)
+
+    def page_evicted(self, pid: int, page_number: int, slot: int, frame_index: int) -> None:
+        if self.wants(EventType.EVICT):
+            self._append(EventType.EVICT, pid, page_number, slot, frame_index)
+
+    def page_swapped_in(self, pid: int, page_number: int, frame_index: Optional[int]) -> None:
+        if self.wants(EventType.SWAP_IN):
+            self._append(EventType.SWAP_IN, pid, page_number, -1 if frame_index is None else frame_index)
+
+
+class Logger(EventLog):
+    """Interfaz anterior del registro (``log``, ``get_events`` y ``clear``):
+    un ``EventLog`` sin límite, sin filtrado ni muestreo."""
+
+    def __init__(self) -> None:
+        super().__init__()
+
+
+# Tipo y nivel de evento por código ACCESS_*, para decidir sin llamadas
+_ACCESS_RESULTS = {
+    ACCESS_TLB_HIT: EventType.TLB_HIT,
+    ACCESS_HIT: EventType.HIT,
+    ACCESS_FAULT: EventType.FAULT,
+    ACCESS_MINOR_FAULT: EventType.MINOR_FAULT,
+}
+_ACCESS_KINDS = [_ACCESS_RESULTS.get(code, EventType.ERROR) for code in range(max(ERROR_MESSAGES) + 1)]
+_ACCESS_LEVELS = [EVENT_LEVELS[kind] for kind in _ACCESS_KINDS]
+
+LEVELS = {level.name.lower(): level for level in Level}
+
+
+def create_event_log(config: Config) -> EventLog:
+    """Crea el registro según la sección ``[Logging]``."""
+    values = config.values
+    sink = None
+    if values.log_export != "none":
+        path = values.log_export_file or ("eventos.bin" if values.log_export == "binary" else "eventos.jsonl")
+        sink = create_sink(values.log_export, path)
+    return EventLog(values.log_capacity, LEVELS[values.log_level], values.log_sample_every, sink)
@@ -1,17 +1,339 @@
 """
-Punto de entrada del simulador de gestión de memoria. Crea la interfaz
-CLI y la pone en marcha. Este archivo permite ejecutar el simulador
-directamente con `python -m memory_simulator` o `python src/main.py`.
+Punto de entrada del simulador de gestión de memoria. Sin argumentos crea
+la interfaz CLI y la pone en marcha. Con el subcomando ``replay`` reproduce
+una traza de eventos (texto, texto gzip o binaria) sin interacción y
+muestra solo las métricas finales; ``convert`` pasa una traza de texto al
+formato binario para no volver a interpretarla en cada reproducción, y
+``sweep`` simula en paralelo todas las combinaciones de una rejilla de
+parámetros sobre la misma traza. ``curve`` calcula en una sola pasada la
+tasa de fallos con LRU para todos los tamaños de RAM y la tasa de aciertos
+de la TLB para todos sus tamaños. ``replay --profile`` mide además la
+latencia de las rutas críticas del gestor y ``--save``/``--restore``
+guardan el estado final en una instantánea o parten de una guardada.
+Con varias trazas, ``replay`` reproduce cada una en su propia CPU y hilo
+(requiere ``COUNT`` en ``[CPU]`` mayor o igual que el número de trazas).
+
+Por defecto se usa el config.ini del repositorio sea cual sea el
+directorio de trabajo. Cada valor de configuración puede sustituirse con
+una opción (``--ram-size-kb 4096``, ``--replacement-algorithm lru``...),
+antes o después del subcomando. ``--script`` ejecuta el menú leyendo las
+respuestas de un archivo (una por línea, ``#`` para comentarios, ``-``
+para la entrada estándar) en lugar de preguntarlas, y ``--json`` escribe
+los resultados en JSON por la salida estándar. Los módulos de cada
+subcomando se importan solo al usarlo, para que el arranque sea rápido
+(``benchmarks/startup.py`` lo mide). Este archivo permite ejecutar el
+simulador directamente con `python -m memory_simulator` o
+`python src/main.py`.
+
+    python src/main.py
+    python src/main.py --script sesion.txt --json
+    python src/main.py replay traza.txt
+    python src/main.py replay traza.bin --ram-size-kb 8192 --replacement-algorithm lru --json
+    python src/main.py replay traza.bin --profile --profile-json perfil.json
+    python src/main.py replay calentamiento.bin --save estado.snap
+    python src/main.py replay variante.bin --restore estado.snap --mmap
+    python src/main.py replay cpu0.bin cpu1.bin cpu2.bin cpu3.bin
+    python src/main.py convert traza.txt.gz traza.bin
+    python src/main.py sweep rejilla.json traza.bin -o resultados.csv
+    python src/main.py curve traza.bin -o curva.csv
 """
 
-# Importación absoluta para permitir ejecución directa
-from cli import CLI
+import argparse
+import os
+import sys
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# config.ini del repositorio, independiente del directorio de trabajo
+DEFAULT_CONFIG_PATH = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "config.ini"))
+
+
+def config_options() -> argparse.ArgumentParser:
+    """Opciones comunes al menú y a todos los subcomandos.
+
+    Los valores por omisión se suprimen para que una opción dada antes del
+    subcomando no se pierda al analizar el subcomando.
+    """
+    from dataclasses import fields
+
+    from config import ConfigValues
+
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--config", default=argparse.SUPPRESS, help="ruta de config.ini (por defecto, la del repositorio)")
+    parser.add_argument("--json", action="store_true", default=argparse.SUPPRESS, help="resultados en JSON por la salida estándar")
+    group = parser.add_argument_group("valores de configuración (sustituyen a los de config.ini)")
+    for field in fields(ConfigValues):
+        metavar = "N" if field.type in (int, "int") else "VALOR"
+        group.add_argument("--" + field.name.replace("_", "-"), dest=field.name, metavar=metavar, default=argparse.SUPPRESS)
+    return parser
+
+
+def build_parser() -> argparse.ArgumentParser:
+    common = config_options()
+    parser = argparse.ArgumentParser(description="Simulador de gestor de memoria", parents=[common])
+    parser.add_argument("--script", default=None, help="archivo con las respuestas del menú ('-' para la entrada estándar)")
+    subparsers = parser.add_subparsers(dest="command")
+    replay_parser = subparsers.add_parser("replay", help="reproduce una traza sin interacción", parents=[common])
+    replay_parser.add_argument("trace", nargs="+", help="archivo de traza (texto, gzip o binario); una por CPU")
+    replay_parser.add_argument("--profile", action="store_true", help="mide las rutas críticas del gestor")
+    replay_parser.add_argument("--profile-json", default=None, help="guarda el perfil en un archivo JSON")
+    replay_parser.add_argument("--restore", default=None, help="parte del estado de una instantánea")
+    replay_parser.add_argument("--mmap", action="store_true", help="lee la instantánea con mmap")
+    replay_parser.add_argument("--save", default=None, help="guarda el estado final en una instantánea")
+    convert_parser = subparsers.add_parser("convert", help="convierte una traza de texto a binario", parents=[common])
+    convert_parser.add_argument("source", help="traza de texto (plana o gzip)")
+    convert_parser.add_argument("destination", help="archivo binario de salida")
+    sweep_parser = subparsers.add_parser("sweep", help="barrido de parámetros en paralelo", parents=[common])
+    sweep_parser.add_argument("grid", help="rejilla JSON {parámetro: [valores]}")
+    sweep_parser.add_argument("trace", help="archivo de traza (texto, gzip o binario)")
+    sweep_parser.add_argument("-o", "--output", default="sweep.csv", help="resultados .csv o .json")
+    sweep_parser.add_argument("-j", "--workers", type=int, default=None, help="procesos (por defecto, todos los núcleos)")
+    curve_parser = subparsers.add_parser(
+        "curve", help="curvas de fallos y TLB para todos los tamaños en una pasada", parents=[common]
+    )
+    curve_parser.add_argument("trace", help="archivo de traza (texto, gzip o binario)")
+    curve_parser.add_argument("-o", "--output", default="curve.csv", help="archivo CSV de salida")
+    curve_parser.add_argument("--sizes", type=int, nargs="+", default=None, help="tamaños en marcos (por defecto, todos)")
+    return parser
+
+
+def load_config(args: argparse.Namespace) -> Tuple[Any, str, Dict[str, str]]:
+    """Carga la configuración indicada y aplica las opciones de la línea de
+    comandos. Devuelve la configuración, la ruta usada y las sustituciones."""
+    from dataclasses import fields
+
+    from config import Config, ConfigValues
+
+    path = getattr(args, "config", None)
+    if path is not None and not os.path.exists(path):
+        raise SystemExit(f"No existe el archivo de configuración: {path}")
+    path = path or DEFAULT_CONFIG_PATH
+    overrides = {field.name: getattr(args, field.name) for field in fields(ConfigValues) if hasattr(args, field.name)}
+    config = Config(path)
+    try:
+        config.apply_overrides(overrides)
+    except ValueError as exc:
+        raise SystemExit(f"Configuración inválida: {exc}") from None
+    return config, path, overrides
+
+
+def invalid_combination(exc: ValueError) -> SystemExit:
+    """Error de salida para valores válidos por separado que el gestor no
+    admite juntos (motor ``arrays`` con varias CPU, páginas enormes que no
+    son múltiplo de la página...)."""
+    return SystemExit(f"Configuración inválida: {exc}")
+
+
+def print_json(data: Dict[str, Any]) -> None:
+    import json
+
+    json.dump(data, sys.stdout, indent=2, ensure_ascii=False)
+    sys.stdout.write("\n")
+
+
+def read_script(path: str) -> Iterator[str]:
+    """Respuestas del menú, una por línea; las líneas que empiezan por ``#``
+    son comentarios. Las líneas vacías cuentan como respuesta (Intro)."""
+    handle = sys.stdin if path == "-" else open(path, encoding="utf-8")
+    try:
+        for line in handle:
+            if not line.lstrip().startswith("#"):
+                yield line.rstrip("\n")
+    finally:
+        if handle is not sys.stdin:
+            handle.close()
+
+
+def run_menu(config, script_path: Optional[str] = None, as_json: bool = False) -> None:
+    from cli import CLI
+
+    script = read_script(script_path) if script_path else None
+    try:
+        cli = CLI(config=config, script=script)
+    except ValueError as exc:
+        raise invalid_combination(exc) from None
+    if not as_json:
+        cli.run()
+        return
+    # La sesión va a la salida de error y el JSON final a la estándar
+    from contextlib import redirect_stdout
+    from dataclasses import asdict
+
+    with redirect_stdout(sys.stderr):
+        cli.run()
+    print_json({
+        "config": asdict(config.values),
+        "metrics": cli.memory_manager.get_metrics_dict(),
+        "events": cli.logger.metrics_dict(),
+    })
+
+
+def run_replay(
+    config,
+    trace_paths: List[str],
+    profile: bool = False,
+    profile_json=None,
+    restore=None,
+    use_mmap: bool = False,
+    save=None,
+    as_json: bool = False,
+) -> None:
+    import time
+
+    from memory_manager import create_memory_manager
+    from replay import replay, replay_concurrent
+    from trace_reader import read_trace
+
+    if len(trace_paths) > config.values.cpus:
+        raise SystemExit(f"Hay {len(trace_paths)} trazas y COUNT = {config.values.cpus} en [CPU].")
+    # Traducción de PID de la traza; se guarda en la instantánea para que
+    # otra traza pueda continuar con los mismos procesos
+    pids = {}
+    restored = None
+    if restore:
+        from snapshot import load_snapshot
+
+        start = time.perf_counter()
+        try:
+            manager, metadata = load_snapshot(restore, config, use_mmap)
+        except ValueError as exc:
+            raise SystemExit(f"No se puede restaurar {restore}: {exc}") from None
+        restored = time.perf_counter() - start
+        pids = {int(trace_pid): pid for trace_pid, pid in metadata.get("trace_pids", {}).items()}
+    else:
+        try:
+            manager = create_memory_manager(config)
+        except ValueError as exc:
+            raise invalid_combination(exc) from None
+    # Los eventos solo se registran si se van a exportar
+    event_log = None
+    if config.values.log_export != "none":
+        from logger import create_event_log
+
+        event_log = create_event_log(config)
+        event_log.attach(manager)
+    # El perfilador envuelve al registro de eventos, así que lo incluye
+    profiler = None
+    if profile or profile_json:
+        from profiling import Profiler
+
+        profiler = Profiler(manager)
+    if len(trace_paths) > 1:
+        stats = replay_concurrent(manager, [read_trace(path) for path in trace_paths], pids)
+    else:
+        stats = replay(manager, read_trace(trace_paths[0]), pids)
+    if save:
+        from snapshot import save_snapshot
+
+        size = save_snapshot(manager, save, {"trace_pids": pids})
+    manager.close()
+    if event_log is not None:
+        event_log.close()
+    if profile_json:
+        import json
+
+        with open(profile_json, "w", encoding="utf-8") as handle:
+            json.dump(profiler.to_dict(), handle, indent=2)
+    if as_json:
+        from dataclasses import asdict
+
+        report: Dict[str, Any] = {
+            "config": asdict(config.values),
+            "replay": asdict(stats) | {"accesses_per_second": stats.accesses_per_second},
+            "metrics": manager.get_metrics_dict(),
+        }
+        if restored is not None:
+            report["restore"] = {"path": restore, "seconds": restored}
+        if event_log is not None:
+            report["events"] = event_log.metrics_dict()
+        if profiler is not None:
+            report["profile"] = profiler.to_dict()
+        if save:
+            report["snapshot"] = {"path": save, "bytes": size}
+        print_json(report)
+        return
+    print(config.summary())
+    if restored is not None:
+        print(f"Instantánea {restore} restaurada en {restored * 1000:.1f} ms.")
+    print("\n--- Reproducción ---")
+    print(stats.summary())
+    if event_log is not None:
+        print(f"Eventos: {event_log.summary()}")
+    print("\n--- Métricas ---")
+    print(manager.get_metrics())
+    if profiler is not None:
+        print("\n--- Perfil ---")
+        print(profiler.report())
+        if profile_json:
+            print(f"Perfil guardado en {profile_json}.")
+    if save:
+        print(f"Instantánea guardada en {save} ({size / 1024:.0f} KB).")
+
+
+def run_convert(source: str, destination: str, as_json: bool = False) -> None:
+    from trace_reader import convert_text_to_binary
+
+    count = convert_text_to_binary(source, destination)
+    if as_json:
+        print_json({"events": count, "output": destination})
+        return
+    print(f"{count} eventos escritos en {destination}.")
+
+
+def run_sweep(
+    config_path: str,
+    overrides: Dict[str, str],
+    grid_path: str,
+    trace_path: str,
+    output: str,
+    workers,
+    as_json: bool = False,
+) -> None:
+    from sweep import load_grid, sweep, write_results
+
+    # Las opciones de la línea de comandos son parámetros fijos de la
+    # rejilla; los de la rejilla tienen prioridad
+    grid = {name: [value] for name, value in overrides.items()} | load_grid(grid_path)
+    rows = sweep(config_path, grid, trace_path, workers)
+    write_results(rows, output)
+    if as_json:
+        print_json({"configurations": len(rows), "output": output})
+        return
+    print(f"{len(rows)} configuraciones simuladas; resultados en {output}.")
+
+
+def run_curve(config, trace_path: str, output: str, sizes, as_json: bool = False) -> None:
+    from stack_distance import StackDistanceAnalyzer, write_curve
+    from trace_reader import read_trace
+
+    analyzer = StackDistanceAnalyzer(config.values.page_size_kb, config.values.paging == "demand")
+    analyzer.process(read_trace(trace_path))
+    count = write_curve(analyzer.curve(sizes), output)
+    if as_json:
+        print_json({"accesses": analyzer.accesses, "sizes": count, "output": output})
+        return
+    print(f"{analyzer.accesses} accesos analizados; {count} tamaños escritos en {output}.")
 
 
-def main() -> None:
-    cli = CLI(config_path="../config.ini")
-    cli.run()
+def main(argv: Optional[List[str]] = None) -> None:
+    args = build_parser().parse_args(argv)
+    as_json = getattr(args, "json", False)
+    if args.command == "convert":
+        run_convert(args.source, args.destination, as_json)
+        return
+    config, config_path, overrides = load_config(args)
+    if args.command == "replay":
+        run_replay(
+            config, args.trace, args.profile, args.profile_json, args.restore, args.mmap, args.save, as_json
+        )
+        return
+    if args.command == "sweep":
+        run_sweep(config_path, overrides, args.grid, args.trace, args.output, args.workers, as_json)
+        return
+    if args.command == "curve":
+        run_curve(config, args.trace, args.output, args.sizes, as_json)
+        return
+    run_menu(config, args.script, as_json)
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -1,14 +1,43 @@
 from __future__ import annotations
 
+import struct
 from dataclasses import dataclass
-from typing import List, Optional, Tuple, Dict
-from collections import deque
+from typing import TYPE_CHECKING, Any, Iterable, List, Optional, Dict, Set, Tuple
 
+from allocator import FrameAllocator, create_allocator
 from config import Config
-from process import Process
+from prefetch import PrefetchStrategy, create_prefetcher
+from process import PageTableEntry, Process, ProcessState
+from replacement import ReplacementAlgorithm, create_replacement
+from tlb import TLB
 
+if TYPE_CHECKING:
+    from load_control import PFFController
+    from logger import EventLog
+    from page_walk import PageWalker
+    from swap_device import MmapSwapDevice
 
-@dataclass
+
+# Resultados de MemoryManager.access (ruta rápida sin mensajes)
+ACCESS_TLB_HIT = 0
+ACCESS_HIT = 1
+ACCESS_FAULT = 2
+ACCESS_NO_PROCESS = 3
+ACCESS_INVALID_PAGE = 4
+ACCESS_UNMAPPED = 5
+ACCESS_MINOR_FAULT = 6
+ACCESS_NO_MEMORY = 7
+ACCESS_SUSPENDED = 8
+
+# Expulsión realizada durante una asignación: (pid víctima, página, índice en Swap)
+Eviction = Tuple[int, int, int]
+
+# Cabecera con la que se marca el contenido de cada página al crearla
+# (pid, número de página) cuando la Swap tiene respaldo en disco
+PAGE_HEADER = struct.Struct("<II")
+
+
+@dataclass(slots=True)
 class Frame:
     process_id: Optional[int] = None
     page_number: Optional[int] = None
@@ -19,15 +48,21 @@ class Frame:
 
 
 class MemoryManager:
-    """Gestor de memoria con RAM, Swap, FIFO, TLB y métricas completas."""
+    """Gestor de memoria con RAM, Swap, reemplazo configurable, TLB y métricas."""
 
-    def __init__(self, config: Config) -> None:
+    def __init__(self, config: Config, replacement: Optional[ReplacementAlgorithm] = None) -> None:
         # Inicializar marcos de RAM y Swap
-        self.ram: List[Frame] = [Frame() for _ in range(config.ram_frames)]
-        self.swap: List[Frame] = [Frame() for _ in range(config.swap_frames)]
+        self._init_frames(config.ram_frames, config.swap_frames)
+
+        # Asignadores de marcos libres (evitan recorrer las listas completas)
+        allocator = config.values.frame_allocator
+        self.ram_allocator: FrameAllocator = create_allocator(allocator, config.ram_frames)
+        self.swap_allocator: FrameAllocator = create_allocator(allocator, config.swap_frames)
 
-        # FIFO para reemplazo de páginas
-        self.page_queue: deque[Tuple[int, int]] = deque()
+        # Algoritmo de reemplazo de páginas (FIFO por defecto)
+        if replacement is None:
+            replacement = create_replacement(config.values.replacement_algorithm, config.values.replacement_seed)
+        self.replacement: ReplacementAlgorithm = replacement
 
         # Procesos activos
         self.processes: Dict[int, Process] = {}
@@ -42,27 +77,135 @@ class MemoryManager:
         self.swaps_out = 0
         self.tlb_hits = 0
         self.tlb_misses = 0
+        self.minor_faults = 0
+
+        # TLB de capacidad y política configurables
+        values = config.values
+        # Paginación bajo demanda: las páginas reciben marco en su primer acceso
+        self.demand_paging = values.paging == "demand"
+
+        # Estructura de la tabla de páginas y modelo de coste del recorrido
+        # en los fallos de TLB (None para la tabla lineal, sin importar el módulo)
+        self.page_walker: Optional[PageWalker] = None
+        if values.page_table != "flat":
+            from page_walk import create_page_walker
+
+            self.page_walker = create_page_walker(config)
+        self.page_table_levels = values.page_table_levels if values.page_table == "radix" else 1
+        # La política random de la TLB usa la semilla del reemplazo
+        self.tlb = TLB(values.tlb_size, values.tlb_policy, values.tlb_ways, seed=values.replacement_seed)
+
+        # Páginas enormes: páginas base por página enorme (0 si están
+        # desactivadas). Una región alineada de ese tamaño ocupa un tramo
+        # contiguo y alineado de marcos y una sola entrada de la TLB.
+        self.huge_pages = 0
+        if values.huge_pages != "none":
+            if values.huge_page_size_kb <= values.page_size_kb or values.huge_page_size_kb % values.page_size_kb:
+                raise ValueError("SIZE_KB en [HugePages] debe ser un múltiplo de PAGE_SIZE_KB mayor que él.")
+            self.huge_pages = values.huge_page_size_kb // values.page_size_kb
+        self.huge_pages_mapped = 0
+        self.huge_allocations = 0
+        self.promotions = 0
+        self.demotions = 0
+        self.huge_fallbacks = 0
+        self.promotion_swaps_in = 0
+        self.migrated_pages = 0
+
+        # Última expulsión provocada por access(), para construir mensajes
+        self.last_eviction: Optional[Eviction] = None
+
+        # Contenido de las páginas: solo existe si la Swap tiene respaldo real.
+        # El dispositivo (mmap e hilos de escritura) solo se importa si se usa.
+        self.swap_device: Optional[MmapSwapDevice] = None
+        if values.swap_backend != "memory":
+            from swap_device import create_swap_device
 
-        # TLB con política LRU
-        self.tlb_capacity: int = 4
-        self.tlb: List[Dict[str, int]] = []
+            self.swap_device = create_swap_device(config)
+        self.page_bytes = values.page_size_kb * 1024
+        self.ram_data: Optional[bytearray] = None
+        if self.swap_device is not None:
+            self.ram_data = bytearray(config.ram_frames * self.page_bytes)
+
+        # Prelectura en los fallos de página. La profundidad se limita para
+        # que las páginas precargadas no se expulsen entre sí.
+        depth = min(values.prefetch_depth, max(0, config.ram_frames - 1))
+        self.prefetcher: PrefetchStrategy = create_prefetcher(values.prefetch, depth)
+        # Páginas precargadas que aún no se han referenciado
+        self._prefetched: Set[Tuple[int, int]] = set()
+        self.prefetched_pages = 0
+        self.prefetch_hits = 0
+        self.useless_prefetches = 0
+
+        # Registro de eventos opcional (EventLog.attach): el gestor le
+        # notifica accesos, creaciones, terminaciones, expulsiones y swap-ins
+        self.event_log: Optional[EventLog] = None
+
+        # Control de carga opcional: access y remove_process le pasan los
+        # accesos y los procesos terminados
+        self.load_controller: Optional[PFFController] = None
+        if values.load_control != "none":
+            from load_control import create_load_controller
+
+            self.load_controller = create_load_controller(self, config)
+
+    def _init_frames(self, ram_frames: int, swap_frames: int) -> None:
+        self.ram: List[Frame] = [Frame() for _ in range(ram_frames)]
+        self.swap: List[Frame] = [Frame() for _ in range(swap_frames)]
 
     # CREAR PROCESO
+    def new_process(self, size_kb: int) -> Process:
+        """Crea un proceso con el tamaño de página configurado (sin cargarlo)."""
+        return Process(
+            size_kb,
+            self.config.values.page_size_kb,
+            lazy_page_table=self.demand_paging,
+            page_table_levels=self.page_table_levels,
+        )
+
     def add_process(self, process: Process) -> List[str]:
-        messages: List[str] = []
+        return [self._eviction_message(e) for e in self.load_process(process)]
+
+    def load_process(self, process: Process) -> List[Eviction]:
+        """Registra el proceso y asigna sus páginas sin construir mensajes.
+
+        Con paginación bajo demanda solo se registra: las páginas reciben
+        marco en su primer acceso.
+        """
+        if self.event_log is not None:
+            self.event_log.process_created(process)
+        return self._load_process(process)
+
+    def _load_process(self, process: Process) -> List[Eviction]:
+        evictions: List[Eviction] = []
         self.processes[process.pid] = process
-        for page_number in range(process.pages_needed):
-            msg = self._allocate_page(process, page_number)
-            if msg:
-                messages.append(msg)
-        return messages
-
-    def _allocate_page(self, process: Process, page_number: int):
-        # Buscar marco libre en RAM
-        for idx, frame in enumerate(self.ram):
-            if frame.free:
-                self._assign_frame(process, page_number, idx)
-                return None
+        process.huge_pages = self._huge_eligible(process)
+        if self.demand_paging:
+            return evictions
+        size = self.huge_pages
+        page_number = 0
+        while page_number < process.pages_needed:
+            # Cada región alineada completa se intenta asignar como página enorme
+            if process.huge_pages and page_number % size == 0 and self._promote_region(process, page_number // size):
+                page_number += size
+                continue
+            eviction = self._allocate_page(process, page_number)
+            if eviction:
+                evictions.append(eviction)
+            self._init_page_data(process, page_number)
+            page_number += 1
+        return evictions
+
+    @staticmethod
+    def _eviction_message(eviction: Eviction) -> str:
+        victim_pid, victim_page, swap_idx = eviction
+        return f"Página {victim_page} del Proceso {victim_pid} movida a Swap[{swap_idx}]"
+
+    def _allocate_page(self, process: Process, page_number: int) -> Optional[Eviction]:
+        # Pedir un marco libre de RAM al asignador
+        idx = self.ram_allocator.allocate()
+        if idx is not None:
+            self._assign_frame(process, page_number, idx)
+            return None
         return self._swap_and_assign(process, page_number)
 
     def _assign_frame(self, process: Process, page_number: int, frame_index: int):
@@ -73,59 +216,166 @@ class MemoryManager:
         entry.present = True
         entry.frame_index = frame_index
         entry.swap_index = None
-        self.page_queue.append((process.pid, page_number))
+        entry.referenced = True
+        process.resident_pages += 1
+        process.resident.add(page_number)
+        self.replacement.page_loaded(process.pid, page_number, entry)
+        if self.page_walker is not None:
+            self.page_walker.page_mapped(process.pid, page_number, frame_index)
         self._update_tlb(process.pid, page_number, frame_index)
 
     # SWAPPING
-    def _swap_and_assign(self, new_process: Process, new_page_number: int):
-        while self.page_queue:
-            victim_pid, victim_page = self.page_queue.popleft()
-            victim_proc = self.processes.get(victim_pid)
-            if not victim_proc:
-                continue
-            entry = victim_proc.page_table[victim_page]
-            if entry.present and entry.frame_index is not None:
-                frame_index = entry.frame_index
-                break
+    def _swap_and_assign(self, new_process: Process, new_page_number: int) -> Eviction:
+        # Comprobar la Swap antes de elegir víctima: select_victim la olvida
+        # y, si no cupiera, quedaría en RAM fuera del algoritmo de reemplazo
+        if not self.swap_allocator.has_free():
+            raise MemoryError("Swap lleno.")
+        victim_pid, victim_page = self.replacement.select_victim()
+        victim_proc = self.processes[victim_pid]
+        frame_index = victim_proc.page_table[victim_page].frame_index
         swap_idx = self._move_to_swap(victim_proc, victim_page, frame_index)
         self.swaps_out += 1
-        msg = f"Página {victim_page} del Proceso {victim_proc.pid} movida a Swap[{swap_idx}]"
         self._assign_frame(new_process, new_page_number, frame_index)
-        return msg
+        return victim_pid, victim_page, swap_idx
 
     def _move_to_swap(self, process: Process, page_number: int, frame_index: int) -> int:
-        for idx, frame in enumerate(self.swap):
-            if frame.free:
-                frame.process_id = process.pid
-                frame.page_number = page_number
-                entry = process.page_table[page_number]
-                entry.present = False
-                entry.swap_index = idx
-                entry.frame_index = None
-                ram_f = self.ram[frame_index]
-                ram_f.process_id = None
-                ram_f.page_number = None
-                self._invalidate_tlb(process.pid, page_number)
-                return idx
-        raise MemoryError("Swap lleno.")
+        idx = self.swap_allocator.allocate()
+        if idx is None:
+            raise MemoryError("Swap lleno.")
+        if process.huge_regions:
+            # Expulsar una página base rompe la página enorme que la contiene
+            region = page_number // self.huge_pages
+            if region in process.huge_regions:
+                self._demote_region(process, region)
+        if self.swap_device is not None:
+            self.swap_device.write(idx, self._frame_data(frame_index))
+        frame = self.swap[idx]
+        frame.process_id = process.pid
+        frame.page_number = page_number
+        entry = process.page_table[page_number]
+        entry.present = False
+        entry.swap_index = idx
+        entry.frame_index = None
+        entry.referenced = False
+        process.resident_pages -= 1
+        process.swapped_pages += 1
+        process.resident.discard(page_number)
+        process.swapped.add(page_number)
+        if self._prefetched and (process.pid, page_number) in self._prefetched:
+            self._prefetched.discard((process.pid, page_number))
+            self.useless_prefetches += 1
+        self.prefetcher.page_evicted(process.pid, page_number)
+        if self.page_walker is not None:
+            self.page_walker.page_unmapped(process.pid, page_number, frame_index)
+        # El marco de RAM se reutiliza de inmediato en _swap_and_assign,
+        # por lo que no se devuelve al asignador.
+        ram_f = self.ram[frame_index]
+        ram_f.process_id = None
+        ram_f.page_number = None
+        self._invalidate_tlb(process.pid, page_number)
+        if self.event_log is not None:
+            self.event_log.page_evicted(process.pid, page_number, idx, frame_index)
+        return idx
+
+    def set_replacement(self, replacement: ReplacementAlgorithm) -> None:
+        """Cambia el algoritmo de reemplazo conservando las páginas residentes.
+
+        Las páginas se registran en el nuevo algoritmo en orden de marco.
+        """
+        for frame in self.ram:
+            if not frame.free:
+                entry = self.processes[frame.process_id].page_table[frame.page_number]
+                replacement.page_loaded(frame.process_id, frame.page_number, entry)
+        self.replacement = replacement
 
     # TERMINAR PROCESO
     def remove_process(self, pid: int):
+        known = pid in self.processes
+        self._remove_process(pid)
+        if self.load_controller is not None:
+            self.load_controller.process_removed(pid)
+        if known and self.event_log is not None:
+            self.event_log.process_removed(pid)
+
+    def _remove_process(self, pid: int):
         process = self.processes.get(pid)
         if not process:
             return
-        for entry in process.page_table.values():
-            if entry.present and entry.frame_index is not None:
-                ram_f = self.ram[entry.frame_index]
-                ram_f.process_id = None
-                ram_f.page_number = None
-            if not entry.present and entry.swap_index is not None:
-                swap_f = self.swap[entry.swap_index]
-                swap_f.process_id = None
-                swap_f.page_number = None
+        # Solo se recorren las páginas que ocupan un marco, no toda la tabla.
+        # Se ordenan para que el resultado (orden de liberación de marcos y
+        # ranuras del reemplazo) no dependa del orden interno del conjunto.
+        page_table = process.page_table
+        resident = sorted(process.resident)
+        prefetched = self._prefetched
+        walker = self.page_walker
+        for page_number in resident:
+            frame_index = page_table[page_number].frame_index
+            if walker is not None:
+                walker.page_unmapped(pid, page_number, frame_index)
+            if prefetched and (pid, page_number) in prefetched:
+                prefetched.discard((pid, page_number))
+                self.useless_prefetches += 1
+            ram_f = self.ram[frame_index]
+            ram_f.process_id = None
+            ram_f.page_number = None
+            self.ram_allocator.release(frame_index)
+        for page_number in sorted(process.swapped):
+            swap_index = page_table[page_number].swap_index
+            swap_f = self.swap[swap_index]
+            swap_f.process_id = None
+            swap_f.page_number = None
+            self.swap_allocator.release(swap_index)
+            if self.swap_device is not None:
+                self.swap_device.discard(swap_index)
         del self.processes[pid]
-        self.page_queue = deque([(p, pg) for (p, pg) in self.page_queue if p != pid])
-        self.tlb = [e for e in self.tlb if e["pid"] != pid]
+        self.replacement.remove_process(pid, resident)
+        self.prefetcher.forget(pid)
+        self.tlb.flush_pid(pid)
+        self.huge_pages_mapped -= len(process.huge_regions)
+        process.huge_regions.clear()
+        process.resident_pages = process.swapped_pages = 0
+        process.resident.clear()
+        process.swapped.clear()
+
+    # SUSPENSIÓN DE PROCESOS (control de carga)
+    def suspend_process(self, pid: int) -> Optional[int]:
+        """Mueve todas las páginas residentes del proceso a Swap y lo marca
+        como suspendido. Devuelve las páginas movidas, o None si el proceso
+        no existe, ya está suspendido o no cabe en la Swap."""
+        process = self.processes.get(pid)
+        if not process or process.state is ProcessState.SWAPPED:
+            return None
+        resident = sorted(process.resident)
+        if self.swap_allocator.free_count < len(resident):
+            return None
+        page_table = process.page_table
+        self.replacement.remove_process(pid, resident)
+        for page_number in resident:
+            frame_index = page_table[page_number].frame_index
+            self._move_to_swap(process, page_number, frame_index)
+            self.ram_allocator.release(frame_index)
+        self.swaps_out += len(resident)
+        process.swap_out()
+        return len(resident)
+
+    def resume_process(self, pid: int, pages: Iterable[int] = ()) -> int:
+        """Reactiva un proceso suspendido y trae de Swap las páginas dadas
+        mientras queden marcos libres. Devuelve las páginas traídas."""
+        process = self.processes.get(pid)
+        if not process or process.state is not ProcessState.SWAPPED:
+            return 0
+        process.swap_in()
+        loaded = 0
+        page_table = process.page_table
+        for page_number in pages:
+            if not self.ram_allocator.has_free():
+                break
+            entry = page_table[page_number]
+            if entry is not None and entry.swap_index is not None:
+                self._swap_in(process, page_number)
+                loaded += 1
+        self.swaps_in += loaded
+        return loaded
 
     # MAPAS DE MEMORIA
     def get_ram_map(self):
@@ -146,13 +396,19 @@ class MemoryManager:
         if not process:
             return "Proceso no encontrado."
         lines = [f"Tabla de páginas del Proceso {pid}:"]
-        for page_number, entry in process.page_table.items():
-            if entry.present and entry.frame_index is not None:
+        page_table = process.page_table
+        for page_number in range(process.pages_needed):
+            entry = page_table[page_number]
+            if entry is None:
+                location = "No asignada"
+            elif entry.present and entry.frame_index is not None:
                 location = f"RAM[{entry.frame_index}]"
             elif entry.swap_index is not None:
                 location = f"Swap[{entry.swap_index}]"
             else:
                 location = "No asignada"
+            if process.huge_regions and page_number // self.huge_pages in process.huge_regions:
+                location += " (página enorme)"
             lines.append(f"Página {page_number} -> {location}")
         return "\n".join(lines)
 
@@ -160,65 +416,482 @@ class MemoryManager:
     def get_page_fault_rate(self):
         return (self.page_faults / self.total_accesses * 100) if self.total_accesses > 0 else 0.0
 
+    # Los asignadores llevan la cuenta de marcos usados, así que la
+    # ocupación se obtiene en O(1) sin recorrer los marcos.
+    @property
+    def ram_used(self) -> int:
+        return self.ram_allocator.used
+
+    @property
+    def swap_used(self) -> int:
+        return self.swap_allocator.used
+
     def get_ram_occupancy(self):
-        used = sum(not f.free for f in self.ram)
-        return used / len(self.ram) * 100
+        capacity = self.ram_allocator.capacity
+        return self.ram_allocator.used / capacity * 100 if capacity else 0.0
 
     def get_swap_occupancy(self):
-        used = sum(not f.free for f in self.swap)
-        return used / len(self.swap) * 100
+        capacity = self.swap_allocator.capacity
+        return self.swap_allocator.used / capacity * 100 if capacity else 0.0
+
+    def get_tlb_hit_ratio(self):
+        lookups = self.tlb_hits + self.tlb_misses
+        return self.tlb_hits / lookups * 100 if lookups else 0.0
+
+    def get_walk_metrics(self) -> Dict[str, Any]:
+        """Accesos a memoria de los recorridos de la tabla de páginas y
+        tiempo efectivo de acceso (EAT).
+
+        EAT = t_TLB + t_mem * (1 + accesos de recorrido / consultas a la TLB);
+        no incluye el servicio de los fallos de página. Con la tabla lineal
+        cada fallo de TLB cuesta un acceso. El tamaño de las tablas solo se
+        calcula para las estructuras jerárquica e invertida (recorre los
+        procesos, no las páginas).
+        """
+        walker = self.page_walker
+        level_accesses = walker.level_accesses if walker is not None else [self.tlb_misses]
+        walk_accesses = sum(level_accesses)
+        lookups = self.tlb_hits + self.tlb_misses
+        values = self.config.values
+        eat = values.tlb_lookup_ns + values.memory_access_ns * (1 + walk_accesses / lookups) if lookups else 0.0
+        metrics: Dict[str, Any] = {
+            "page_table": walker.name if walker is not None else "flat",
+            "walk_memory_accesses": walk_accesses,
+            "walk_accesses_by_level": list(level_accesses),
+            "effective_access_time_ns": eat,
+        }
+        if walker is not None:
+            metrics.update(walker.metrics_dict())
+            metrics["page_table_bytes"] = walker.table_bytes(p.page_table for p in self.processes.values())
+        return metrics
+
+    def get_metrics_dict(self) -> Dict[str, Any]:
+        """Instantánea numérica de las métricas, en O(1)."""
+        metrics: Dict[str, Any] = {
+            "total_accesses": self.total_accesses,
+            "page_faults": self.page_faults,
+            "page_fault_rate": self.get_page_fault_rate(),
+            "swaps_out": self.swaps_out,
+            "swaps_in": self.swaps_in,
+            "ram_frames": self.ram_allocator.capacity,
+            "ram_used": self.ram_allocator.used,
+            "ram_occupancy": self.get_ram_occupancy(),
+            "swap_frames": self.swap_allocator.capacity,
+            "swap_used": self.swap_allocator.used,
+            "swap_occupancy": self.get_swap_occupancy(),
+            "tlb_hits": self.tlb_hits,
+            "tlb_misses": self.tlb_misses,
+            "tlb_hit_ratio": self.get_tlb_hit_ratio(),
+            "minor_faults": self.minor_faults,
+            "processes": len(self.processes),
+            "replacement": self.replacement.name,
+            "prefetch": self.prefetcher.name,
+            "prefetched_pages": self.prefetched_pages,
+            "prefetch_hits": self.prefetch_hits,
+            "useless_prefetches": self.useless_prefetches,
+            # Cada acierto de prelectura es un fallo con swap-in que no ocurrió
+            "swaps_in_saved": self.prefetch_hits,
+        }
+        metrics.update(self.get_walk_metrics())
+        if self.huge_pages:
+            metrics.update(self.get_huge_page_metrics())
+        if self.swap_device is not None:
+            metrics.update(self.swap_device.metrics_dict())
+        if self.load_controller is not None:
+            metrics.update(self.load_controller.metrics_dict())
+        return metrics
+
+    def get_process_metrics(self, pid: int) -> Optional[Dict[str, Any]]:
+        """Páginas residentes y en Swap de un proceso, o None si no existe."""
+        process = self.processes.get(pid)
+        if not process:
+            return None
+        metrics: Dict[str, Any] = {
+            "pages": process.pages_needed,
+            "resident_pages": process.resident_pages,
+            "swapped_pages": process.swapped_pages,
+        }
+        if self.load_controller is not None:
+            metrics.update(self.load_controller.process_metrics(pid))
+        return metrics
 
     def get_metrics(self):
+        m = self.get_metrics_dict()
+        swap_io = self.swap_device.summary() if self.swap_device is not None else ""
+        load = self.load_controller.summary() if self.load_controller is not None else ""
+        walk = ""
+        if self.page_walker is not None:
+            levels = ", ".join(f"N{i}: {n}" for i, n in enumerate(m["walk_accesses_by_level"]))
+            walk = (
+                f"Tabla de páginas ({m['page_table']}): {m['page_table_bytes']} bytes\n"
+                f"Accesos de recorrido: {m['walk_memory_accesses']} ({levels})\n"
+            )
+            if "walk_cache_hits" in m:
+                walk += f"Caché de recorridos: {m['walk_cache_hits']} aciertos ({m['walk_cache_hit_ratio']:.2f}%)\n"
+            walk += f"Tiempo efectivo de acceso: {m['effective_access_time_ns']:.2f} ns\n"
+        huge = ""
+        if self.huge_pages:
+            huge = (
+                f"Páginas enormes ({m['huge_page_size_kb']} KB): {m['huge_pages_mapped']} mapeadas, "
+                f"{m['huge_page_allocations']} asignadas directamente\n"
+                f"Promociones: {m['huge_page_promotions']} ({m['migrated_pages']} páginas migradas, "
+                f"{m['promotion_swaps_in']} traídas de Swap)\n"
+                f"Degradaciones: {m['huge_page_demotions']}\n"
+                f"Sin tramo contiguo por fragmentación: {m['huge_page_fallbacks']}\n"
+                f"Alcance de la TLB: {m['tlb_reach_kb']} KB\n"
+            )
+        minor = f"Fallos menores (primer acceso): {m['minor_faults']}\n" if self.demand_paging else ""
+        prefetch = ""
+        if m["prefetch"] != "none":
+            prefetch = (
+                f"Prelectura ({m['prefetch']}): {m['prefetched_pages']} páginas precargadas (incluidas en los swaps IN)\n"
+                f"Aciertos de prelectura (swaps IN ahorrados): {m['prefetch_hits']}\n"
+                f"Prelecturas inútiles: {m['useless_prefetches']}\n"
+            )
         return (
-            f"Accesos totales: {self.total_accesses}\n"
-            f"Fallos de página: {self.page_faults}\n"
-            f"Tasa de fallos: {self.get_page_fault_rate():.2f}%\n"
-            f"Swaps OUT (RAM→Swap): {self.swaps_out}\n"
-            f"Swaps IN (Swap→RAM): {self.swaps_in}\n"
-            f"Ocupación RAM: {self.get_ram_occupancy():.2f}%\n"
-            f"Ocupación Swap: {self.get_swap_occupancy():.2f}%\n"
-            f"TLB hits: {self.tlb_hits}\n"
-            f"TLB misses: {self.tlb_misses}\n"
+            f"Accesos totales: {m['total_accesses']}\n"
+            f"Fallos de página: {m['page_faults']}\n"
+            f"{minor}"
+            f"Tasa de fallos: {m['page_fault_rate']:.2f}%\n"
+            f"Swaps OUT (RAM→Swap): {m['swaps_out']}\n"
+            f"Swaps IN (Swap→RAM): {m['swaps_in']}\n"
+            f"Ocupación RAM: {m['ram_occupancy']:.2f}%\n"
+            f"Ocupación Swap: {m['swap_occupancy']:.2f}%\n"
+            f"TLB hits: {m['tlb_hits']}\n"
+            f"TLB misses: {m['tlb_misses']}\n"
+            f"Algoritmo de reemplazo: {m['replacement']}\n"
+            f"{walk}"
+            f"{huge}"
+            f"{prefetch}"
+            f"{swap_io}"
+            f"{load}"
         )
 
     # ACCESO A PÁGINAS
     def access_page(self, pid: int, page_number: int) -> str:
+        result = self.access(pid, page_number)
+        if result == ACCESS_NO_PROCESS:
+            return "Proceso no encontrado."
+        if result == ACCESS_INVALID_PAGE:
+            return "Número de página inválido."
+        if result == ACCESS_UNMAPPED:
+            return "La página no está asignada en RAM ni Swap."
+        if result == ACCESS_NO_MEMORY:
+            return "Memoria insuficiente: RAM y Swap llenas."
+        if result == ACCESS_SUSPENDED:
+            return f"Proceso {pid} suspendido por el control de carga."
+        frame_index = self._frame_of(pid, page_number)
+        if result == ACCESS_TLB_HIT:
+            return f"Acceso exitoso a P{pid} Pag{page_number} en RAM[{frame_index}] (TLB hit)."
+        if result == ACCESS_HIT:
+            return f"Acceso exitoso a P{pid} Pag{page_number} en RAM[{frame_index}]."
+        msg = self._eviction_message(self.last_eviction) if self.last_eviction else ""
+        if result == ACCESS_MINOR_FAULT:
+            return f"Fallo de página menor: página {page_number} de P{pid} asignada en RAM[{frame_index}]. {msg}"
+        return f"Fallo de página: página {page_number} de P{pid} traída desde Swap. {msg}"
+
+    def _frame_of(self, pid: int, page_number: int) -> Optional[int]:
+        entry = self.processes[pid].page_table[page_number]
+        return entry.frame_index if entry is not None else None
+
+    def access(self, pid: int, page_number: int) -> int:
+        """Ruta rápida de acceso: actualiza estado y métricas sin formatear
+        mensajes. Devuelve una de las constantes ``ACCESS_*``.
+
+        Con control de carga el acceso pasa por él, que decide si se
+        ejecuta, y con registro de eventos se le notifica el resultado; los
+        motores redefinen ``_access``.
+        """
+        controller = self.load_controller
+        if controller is None and self.event_log is None:
+            return self._access(pid, page_number)
+        result = controller.access(pid, page_number) if controller is not None else self._access(pid, page_number)
+        if self.event_log is not None:
+            self.event_log.page_accessed(pid, page_number, result)
+        return result
+
+    def _access(self, pid: int, page_number: int) -> int:
         self.total_accesses += 1
         process = self.processes.get(pid)
         if not process:
-            return "Proceso no encontrado."
+            return ACCESS_NO_PROCESS
         if not (0 <= page_number < process.pages_needed):
-            return "Número de página inválido."
-        for i, entry in enumerate(self.tlb):
-            if entry["pid"] == pid and entry["page_number"] == page_number:
-                self.tlb_hits += 1
-                e = self.tlb.pop(i)
-                self.tlb.append(e)
-                return f"Acceso exitoso a P{pid} Pag{page_number} en RAM[{e['frame_index']}] (TLB hit)."
-        self.tlb_misses += 1
+            return ACCESS_INVALID_PAGE
         pte = process.page_table[page_number]
+        if self._prefetched:
+            self._check_prefetched(pid, page_number)
+        tlb_page = page_number
+        if process.huge_regions:
+            region = page_number // self.huge_pages
+            if region in process.huge_regions:
+                tlb_page = -1 - region
+        if self.tlb.lookup(pid, tlb_page) is not None:
+            self.tlb_hits += 1
+            pte.referenced = True
+            self.replacement.page_accessed(pid, page_number, pte)
+            return ACCESS_TLB_HIT
+        self.tlb_misses += 1
+        # Con la tabla invertida la traducción sale del recorrido; con las
+        # demás, de la tabla del proceso
+        frame_index = None
+        if self.page_walker is not None:
+            frame_index = self.page_walker.walk(pid, page_number)
+        if pte is None:
+            return self._minor_fault(process, page_number)
         if pte.present and pte.frame_index is not None:
-            self._update_tlb(pid, page_number, pte.frame_index)
-            return f"Acceso exitoso a P{pid} Pag{page_number} en RAM[{pte.frame_index}]."
+            pte.referenced = True
+            self.replacement.page_accessed(pid, page_number, pte)
+            self._update_tlb(pid, page_number, pte.frame_index if frame_index is None else frame_index)
+            return ACCESS_HIT
         if pte.swap_index is not None:
             self.page_faults += 1
             self.swaps_in += 1
-            swap_idx = pte.swap_index
-            self.swap[swap_idx].process_id = None
-            self.swap[swap_idx].page_number = None
-            msg = self._allocate_page(process, page_number)
-            pte = process.page_table[page_number]
+            if process.huge_pages and self._promote_region(process, page_number // self.huge_pages, page_number):
+                self.last_eviction = None
+                return ACCESS_FAULT
+            # Las páginas precargadas entran antes que la que falla para que
+            # esta quede como la más reciente y no pueda ser su víctima.
+            page_table = process.page_table
+            pages = process.pages_needed
+            for candidate in self.prefetcher.on_fault(pid, page_number):
+                if 0 <= candidate < pages:
+                    entry = page_table[candidate]
+                    if entry is not None and entry.swap_index is not None:
+                        self._prefetch_page(process, candidate)
+            self.last_eviction = self._swap_in(process, page_number)
             if pte.present:
                 self._update_tlb(pid, page_number, pte.frame_index)
-            return f"Fallo de página: página {page_number} de P{pid} traída desde Swap. {msg or ''}"
-        return "La página no está asignada en RAM ni Swap."
+            return ACCESS_FAULT
+        return ACCESS_UNMAPPED
+
+    def _minor_fault(self, process: Process, page_number: int) -> int:
+        """Primer acceso a una página con paginación bajo demanda: se le
+        asigna un marco sin leer nada de Swap."""
+        if not self.ram_allocator.has_free() and not self.swap_allocator.has_free():
+            return ACCESS_NO_MEMORY
+        self.minor_faults += 1
+        if process.huge_pages and self._promote_region(process, page_number // self.huge_pages, page_number):
+            self.last_eviction = None
+            return ACCESS_MINOR_FAULT
+        process.page_table[page_number] = PageTableEntry()
+        self.last_eviction = self._allocate_page(process, page_number)
+        self._init_page_data(process, page_number)
+        return ACCESS_MINOR_FAULT
+
+    def _swap_in(self, process: Process, page_number: int, frame_index: Optional[int] = None) -> Optional[Eviction]:
+        """Trae una página desde Swap a un marco de RAM (a ``frame_index`` si
+        ya está reservado)."""
+        entry = process.page_table[page_number]
+        swap_idx = entry.swap_index
+        data = self.swap_device.read(swap_idx) if self.swap_device is not None else None
+        self.swap[swap_idx].process_id = None
+        self.swap[swap_idx].page_number = None
+        self.swap_allocator.release(swap_idx)
+        process.swapped_pages -= 1
+        process.swapped.discard(page_number)
+        if frame_index is None:
+            eviction = self._allocate_page(process, page_number)
+        else:
+            eviction = None
+            self._assign_frame(process, page_number, frame_index)
+        if data is not None and entry.present:
+            self._store_frame_data(entry.frame_index, data)
+        if self.event_log is not None:
+            self.event_log.page_swapped_in(process.pid, page_number, entry.frame_index)
+        return eviction
+
+    # PÁGINAS ENORMES
+    def _huge_eligible(self, process: Process) -> bool:
+        """Política por proceso: ``always`` para todos, ``large`` solo para
+        los de al menos ``MIN_PROCESS_KB``."""
+        policy = self.config.values.huge_pages
+        if not self.huge_pages or policy == "none":
+            return False
+        return policy == "always" or process.size_kb >= self.config.values.huge_min_process_kb
+
+    def _promote_region(self, process: Process, region: int, trigger: Optional[int] = None) -> bool:
+        """Mapea la región ``region`` del proceso como una página enorme.
+
+        Solo las regiones completas pueden serlo. Se reserva un tramo de
+        marcos contiguo y alineado; las páginas de la región sin marco lo
+        reciben, las residentes se migran a él y las que están en Swap se
+        traen (la que provoca el fallo, ``trigger``, ya está contada como
+        swap-in). Si la región no tenía páginas previas cuenta como
+        asignación directa y, si no, como promoción. Devuelve False sin
+        modificar nada si no hay un tramo libre.
+        """
+        size = self.huge_pages
+        first = region * size
+        if first + size > process.pages_needed or region in process.huge_regions:
+            return False
+        start = self.ram_allocator.allocate_run(size)
+        if start is None:
+            # Hay marcos suficientes pero no contiguos: fragmentación
+            if self.ram_allocator.free_count >= size:
+                self.huge_fallbacks += 1
+            return False
+        # Se marca antes de asignar para que la TLB reciba la entrada enorme
+        process.huge_regions.add(region)
+        self.huge_pages_mapped += 1
+        page_table = process.page_table
+        collapsed = False
+        for offset in range(size):
+            page_number = first + offset
+            frame_index = start + offset
+            entry = page_table[page_number]
+            if entry is None:
+                entry = page_table[page_number] = PageTableEntry()
+            if entry.present:
+                self._migrate_page(process, page_number, frame_index)
+                collapsed = True
+            elif entry.swap_index is not None:
+                self._swap_in(process, page_number, frame_index)
+                collapsed = True
+                if page_number != trigger:
+                    self.promotion_swaps_in += 1
+            else:
+                self._assign_frame(process, page_number, frame_index)
+                self._init_page_data(process, page_number)
+        if collapsed:
+            self.promotions += 1
+        else:
+            self.huge_allocations += 1
+        self.tlb.insert(process.pid, -1 - region, start)
+        return True
+
+    def _demote_region(self, process: Process, region: int) -> None:
+        """Rompe una página enorme en páginas base; siguen en sus marcos."""
+        process.huge_regions.discard(region)
+        self.huge_pages_mapped -= 1
+        self.demotions += 1
+        self.tlb.invalidate(process.pid, -1 - region)
+
+    def _migrate_page(self, process: Process, page_number: int, frame_index: int) -> None:
+        """Mueve una página residente a otro marco (ya reservado) y libera el
+        anterior."""
+        entry = process.page_table[page_number]
+        old_index = entry.frame_index
+        if self.ram_data is not None:
+            self._store_frame_data(frame_index, self._frame_data(old_index))
+        old = self.ram[old_index]
+        old.process_id = None
+        old.page_number = None
+        self.ram_allocator.release(old_index)
+        frame = self.ram[frame_index]
+        frame.process_id = process.pid
+        frame.page_number = page_number
+        entry.frame_index = frame_index
+        if self.page_walker is not None:
+            self.page_walker.page_unmapped(process.pid, page_number, old_index)
+            self.page_walker.page_mapped(process.pid, page_number, frame_index)
+        self._invalidate_tlb(process.pid, page_number)
+        self.migrated_pages += 1
+
+    def get_huge_page_metrics(self) -> Dict[str, Any]:
+        """Páginas enormes mapeadas, promociones y degradaciones, y alcance
+        de la TLB (memoria cubierta por sus entradas)."""
+        values = self.config.values
+        huge_kb = values.huge_page_size_kb
+        reach = sum(huge_kb if page < 0 else values.page_size_kb for _, page, _ in self.tlb.entries())
+        return {
+            "huge_pages": values.huge_pages,
+            "huge_page_size_kb": huge_kb,
+            "huge_pages_mapped": self.huge_pages_mapped,
+            "huge_page_allocations": self.huge_allocations,
+            "huge_page_promotions": self.promotions,
+            "huge_page_demotions": self.demotions,
+            "huge_page_fallbacks": self.huge_fallbacks,
+            "promotion_swaps_in": self.promotion_swaps_in,
+            "migrated_pages": self.migrated_pages,
+            "tlb_reach_kb": reach,
+        }
+
+    # PRELECTURA
+    def _prefetch_page(self, process: Process, page_number: int) -> None:
+        self._swap_in(process, page_number)
+        self.swaps_in += 1
+        # Precargada pero aún no referenciada
+        process.page_table[page_number].referenced = False
+        self._prefetched.add((process.pid, page_number))
+        self.prefetched_pages += 1
+
+    def _check_prefetched(self, pid: int, page_number: int) -> None:
+        key = (pid, page_number)
+        if key in self._prefetched:
+            self._prefetched.discard(key)
+            self.prefetch_hits += 1
+
+    # CONTENIDO DE LAS PÁGINAS
+    def _init_page_data(self, process: Process, page_number: int) -> None:
+        """Marca el contenido de una página nueva con su pid y número."""
+        if self.ram_data is not None:
+            frame_index = process.page_table[page_number].frame_index
+            PAGE_HEADER.pack_into(self.ram_data, frame_index * self.page_bytes, process.pid, page_number)
+
+    def _frame_data(self, frame_index: int) -> bytes:
+        start = frame_index * self.page_bytes
+        return bytes(self.ram_data[start:start + self.page_bytes])
+
+    def _store_frame_data(self, frame_index: int, data: bytes) -> None:
+        start = frame_index * self.page_bytes
+        self.ram_data[start:start + self.page_bytes] = data
+
+    def close(self) -> None:
+        """Completa las escrituras pendientes y cierra el archivo de Swap."""
+        if self.swap_device is not None:
+            self.swap_device.close()
 
     # TLB
     def _update_tlb(self, pid: int, page_number: int, frame_index: int):
-        self.tlb = [e for e in self.tlb if not (e["pid"] == pid and e["page_number"] == page_number)]
-        if len(self.tlb) >= self.tlb_capacity:
-            self.tlb.pop(0)
-        self.tlb.append({"pid": pid, "page_number": page_number, "frame_index": frame_index})
+        if self.huge_pages:
+            # Las páginas de una región enorme comparten una entrada con el
+            # marco inicial del tramo
+            region = page_number // self.huge_pages
+            if region in self.processes[pid].huge_regions:
+                self.tlb.insert(pid, -1 - region, frame_index - page_number % self.huge_pages)
+                return
+        self.tlb.insert(pid, page_number, frame_index)
 
     def _invalidate_tlb(self, pid: int, page_number: int):
-        self.tlb = [e for e in self.tlb if not (e["pid"] == pid and e["page_number"] == page_number)]
+        self.tlb.invalidate(pid, page_number)
+
+
+def create_memory_manager(config: Config, replacement: Optional[ReplacementAlgorithm] = None) -> MemoryManager:
+    """Crea el gestor según ``ENGINE`` en config.ini.
+
+    El motor ``arrays`` (NumPy) y el modo multi-CPU (``COUNT`` > 1 en
+    [CPU]) se importan solo cuando se solicitan.
+    """
+    if config.values.engine == "arrays":
+        if config.values.cpus > 1:
+            raise ValueError("El motor 'arrays' no admite varias CPU (COUNT = 1 en [CPU]).")
+        if config.values.swap_backend != "memory":
+            raise ValueError("El motor 'arrays' solo admite BACKEND = memory en [Swap].")
+        if config.values.paging != "eager":
+            raise ValueError("El motor 'arrays' solo admite PAGING = eager en [Memory].")
+        if config.values.prefetch != "none":
+            raise ValueError("El motor 'arrays' no admite prelectura (STRATEGY = none en [Prefetch]).")
+        if config.values.page_table != "flat":
+            raise ValueError("El motor 'arrays' solo admite STRUCTURE = flat en [PageTable].")
+        if config.values.load_control != "none":
+            raise ValueError("El motor 'arrays' no admite control de carga (POLICY = none en [LoadControl]).")
+        if config.values.huge_pages != "none":
+            raise ValueError("El motor 'arrays' no admite páginas enormes (POLICY = none en [HugePages]).")
+        from array_engine import ArrayMemoryManager
+
+        return ArrayMemoryManager(config, replacement)
+    if config.values.cpus > 1:
+        if config.values.swap_backend != "memory":
+            raise ValueError("El modo multi-CPU solo admite BACKEND = memory en [Swap].")
+        if config.values.prefetch != "none":
+            raise ValueError("El modo multi-CPU no admite prelectura (STRATEGY = none en [Prefetch]).")
+        if config.values.page_table != "flat":
+            raise ValueError("El modo multi-CPU solo admite STRUCTURE = flat en [PageTable].")
+        if config.values.load_control != "none":
+            raise ValueError("El modo multi-CPU no admite control de carga (POLICY = none en [LoadControl]).")
+        if config.values.huge_pages != "none":
+            raise ValueError("El modo multi-CPU no admite páginas enormes (POLICY = none en [HugePages]).")
+        from multicpu import ConcurrentMemoryManager
+
+        return ConcurrentMemoryManager(config, replacement)
+    return MemoryManager(config, replacement)
@@ -0,0 +1,450 @@
+"""
+Modo multi-CPU del gestor de memoria con cerrojos de grano fino.
+
+``ConcurrentMemoryManager`` permite que varios hilos, cada uno ligado a una
+CPU simulada con ``bind_cpu``, accedan a la vez al mismo gestor:
+
+* Cada CPU tiene su propia TLB. Invalidar una traducción
+  (``_invalidate_tlb``) la borra también de las TLB de las demás CPU que la
+  tengan (TLB shootdown) y cuenta una interrupción entre procesadores (IPI)
+  por cada CPU remota afectada.
+* Cada proceso tiene un cerrojo que protege su tabla de páginas. Los marcos
+  de RAM se reparten en ``FRAME_LOCK_STRIPES`` grupos (marco módulo número
+  de grupos) con un cerrojo cada uno, y el algoritmo de reemplazo, el
+  asignador de RAM y la Swap (asignador y marcos) tienen uno propio.
+* Los cerrojos se toman siempre en el orden proceso, reemplazo, asignador
+  de RAM, Swap, grupo de marcos, TLB, y nunca se tienen los de dos procesos
+  a la vez: un fallo suelta el cerrojo de su proceso mientras consigue un
+  marco (expulsando la víctima con el cerrojo del proceso víctima) y al
+  volver comprueba si otra CPU ya ha resuelto el mismo fallo. Así no puede
+  haber interbloqueos.
+* Los contadores son por CPU y las métricas del gestor son su suma. Cada
+  cerrojo cuenta sus adquisiciones, las que tuvieron que esperar y el
+  tiempo de espera.
+
+Los aciertos solo toman el cerrojo del reemplazo si el algoritmo actualiza
+su estado en cada referencia (LRU, LFU); con FIFO, Second-Chance, Clock o
+Random un acierto solo toma el cerrojo de su proceso y el de la TLB.
+
+Con el GIL de CPython los hilos no ejecutan Python en paralelo: el modo
+sirve para modelar la concurrencia (shootdowns, contención, intercalado de
+las trazas de cada CPU), no para acelerar la simulación.
+
+Solo se admite con el motor de objetos, la tabla de páginas lineal, sin
+prelectura, sin páginas enormes, sin control de carga y con la Swap en
+memoria. A diferencia del gestor secuencial, un fallo con la Swap llena
+devuelve ``ACCESS_NO_MEMORY`` en lugar de intercambiar directamente la
+página que entra por la víctima.
+"""
+
+import threading
+import time
+from contextlib import ExitStack
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from config import Config
+from memory_manager import (
+    ACCESS_FAULT,
+    ACCESS_HIT,
+    ACCESS_INVALID_PAGE,
+    ACCESS_MINOR_FAULT,
+    ACCESS_NO_MEMORY,
+    ACCESS_NO_PROCESS,
+    ACCESS_TLB_HIT,
+    ACCESS_UNMAPPED,
+    Eviction,
+    MemoryManager,
+)
+from process import PageTableEntry, Process
+from replacement import ReplacementAlgorithm
+from tlb import TLB
+
+# Grupos de cerrojos en el orden en que se adquieren
+LOCK_CLASSES = ("process", "replacement", "ram_allocator", "swap", "frames", "tlb")
+
+
+class CountingLock:
+    """Cerrojo que cuenta adquisiciones, esperas y tiempo de espera.
+
+    Primero se intenta tomar sin bloquear; solo si está ocupado se mide la
+    espera. Los contadores se actualizan con el cerrojo tomado.
+    """
+
+    __slots__ = ("_lock", "acquisitions", "contended", "wait_ns")
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.acquisitions = 0
+        self.contended = 0
+        self.wait_ns = 0
+
+    def __enter__(self) -> "CountingLock":
+        lock = self._lock
+        if not lock.acquire(False):
+            start = time.perf_counter_ns()
+            lock.acquire()
+            self.contended += 1
+            self.wait_ns += time.perf_counter_ns() - start
+        self.acquisitions += 1
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._lock.release()
+
+
+class CPU:
+    """TLB y contadores de una CPU simulada."""
+
+    __slots__ = (
+        "index", "tlb", "tlb_lock", "total_accesses", "page_faults", "swaps_in", "swaps_out",
+        "tlb_hits", "tlb_misses", "minor_faults", "tlb_shootdowns", "shootdown_ipis",
+    )
+
+    def __init__(self, index: int, tlb: TLB) -> None:
+        self.index = index
+        self.tlb = tlb
+        self.tlb_lock = CountingLock()
+        self.total_accesses = 0
+        self.page_faults = 0
+        self.swaps_in = 0
+        self.swaps_out = 0
+        self.tlb_hits = 0
+        self.tlb_misses = 0
+        self.minor_faults = 0
+        # Invalidaciones que alcanzaron otras CPU e IPI enviadas por esta
+        self.tlb_shootdowns = 0
+        self.shootdown_ipis = 0
+
+    def metrics_dict(self) -> Dict[str, int]:
+        return {name: getattr(self, name) for name in self.__slots__[3:]}
+
+
+class _PerCPUCounter:
+    """Contador del gestor repartido entre las CPU.
+
+    Leerlo suma los de todas las CPU. Solo puede asignarse durante la
+    inicialización de ``MemoryManager``: un ``manager.page_faults += 1``
+    leería la suma y escribiría sin cerrojo, así que los incrementos se
+    hacen sobre la CPU del hilo (``self._cpu().page_faults += 1``).
+    """
+
+    def __set_name__(self, owner, name: str) -> None:
+        self.name = name
+
+    def __get__(self, manager, owner=None):
+        if manager is None:
+            return self
+        name = self.name
+        return sum(getattr(cpu, name) for cpu in manager.cpus)
+
+    def __set__(self, manager, value: int) -> None:
+        if "cpus" not in vars(manager):
+            # Inicialización de MemoryManager, antes de crear las CPU
+            return
+        raise AttributeError(f"{self.name} es la suma de los contadores por CPU: incrementa el de self._cpu().")
+
+
+class ConcurrentMemoryManager(MemoryManager):
+    """Gestor de memoria compartido por varias CPU (un hilo por CPU)."""
+
+    total_accesses = _PerCPUCounter()
+    page_faults = _PerCPUCounter()
+    swaps_in = _PerCPUCounter()
+    swaps_out = _PerCPUCounter()
+    tlb_hits = _PerCPUCounter()
+    tlb_misses = _PerCPUCounter()
+    minor_faults = _PerCPUCounter()
+
+    def __init__(self, config: Config, replacement: Optional[ReplacementAlgorithm] = None) -> None:
+        # Estado por hilo: CPU ligada y última expulsión (para access_page)
+        self._local = threading.local()
+        super().__init__(config, replacement)
+        values = config.values
+        self.cpus: List[CPU] = [
+            # Cada CPU deriva su propia semilla de la del reemplazo
+            CPU(index, TLB(values.tlb_size, values.tlb_policy, values.tlb_ways, seed=values.replacement_seed + index))
+            for index in range(values.cpus)
+        ]
+        # La TLB del gestor base (mapa de TLB, instantáneas) es la de la CPU 0
+        self.tlb = self.cpus[0].tlb
+        self._pid_lock = threading.Lock()
+        self._process_locks: Dict[int, CountingLock] = {}
+        # Contadores de los cerrojos de procesos ya terminados
+        self._retired_process_locks = [0, 0, 0]
+        self._replacement_lock = CountingLock()
+        self._ram_lock = CountingLock()
+        self._swap_lock = CountingLock()
+        self._frame_locks = [CountingLock() for _ in range(values.frame_lock_stripes)]
+        # Víctimas elegidas cuya expulsión aún no ha terminado: ya no están en
+        # el algoritmo de reemplazo y no deben notificarse sus referencias
+        self._evicting: Set[Tuple[int, int]] = set()
+        self._tracks_accesses = self._needs_access_updates(self.replacement)
+
+    @staticmethod
+    def _needs_access_updates(replacement: ReplacementAlgorithm) -> bool:
+        return type(replacement).page_accessed is not ReplacementAlgorithm.page_accessed
+
+    # CPU DEL HILO ACTUAL
+    def bind_cpu(self, index: int) -> None:
+        """Liga el hilo actual a la CPU ``index``. Los hilos sin ligar usan
+        la CPU 0; cada hilo debe usar una CPU distinta."""
+        if not 0 <= index < len(self.cpus):
+            raise ValueError(f"CPU inexistente: {index} (hay {len(self.cpus)}).")
+        self._local.cpu = self.cpus[index]
+
+    def _cpu(self) -> CPU:
+        return getattr(self._local, "cpu", None) or self.cpus[0]
+
+    @property
+    def last_eviction(self) -> Optional[Eviction]:
+        return getattr(self._local, "last_eviction", None)
+
+    @last_eviction.setter
+    def last_eviction(self, value: Optional[Eviction]) -> None:
+        self._local.last_eviction = value
+
+    def _frame_lock(self, frame_index: int) -> CountingLock:
+        return self._frame_locks[frame_index % len(self._frame_locks)]
+
+    # PROCESOS
+    def new_process(self, size_kb: int) -> Process:
+        # El contador de PID de Process es compartido
+        with self._pid_lock:
+            return super().new_process(size_kb)
+
+    def _load_process(self, process: Process) -> List[Eviction]:
+        evictions: List[Eviction] = []
+        lock = self._process_locks[process.pid] = CountingLock()
+        self.processes[process.pid] = process
+        if self.demand_paging:
+            return evictions
+        for page_number in range(process.pages_needed):
+            frame_index, eviction = self._obtain_frame()
+            if frame_index is None:
+                raise MemoryError("Swap lleno.")
+            with lock, self._replacement_lock, self._frame_lock(frame_index):
+                self._assign_frame(process, page_number, frame_index)
+            if eviction:
+                evictions.append(eviction)
+        return evictions
+
+    def _remove_process(self, pid: int):
+        lock = self._process_locks.get(pid)
+        if lock is None:
+            return
+        with ExitStack() as stack:
+            for held in (lock, self._replacement_lock, self._ram_lock, self._swap_lock, *self._frame_locks):
+                stack.enter_context(held)
+            for cpu in self.cpus:
+                stack.enter_context(cpu.tlb_lock)
+            if self.processes.get(pid) is None:
+                return
+            # Vaciar la TLB de todas las CPU antes de liberar los marcos
+            self._shootdown(lambda tlb: tlb.flush_pid(pid) > 0)
+            super()._remove_process(pid)
+            del self._process_locks[pid]
+            retired = self._retired_process_locks
+            retired[0] += lock.acquisitions
+            retired[1] += lock.contended
+            retired[2] += lock.wait_ns
+
+    def set_replacement(self, replacement: ReplacementAlgorithm) -> None:
+        with self._replacement_lock:
+            super().set_replacement(replacement)
+            self._tracks_accesses = self._needs_access_updates(replacement)
+
+    # ACCESO A PÁGINAS
+    def _access(self, pid: int, page_number: int) -> int:
+        cpu = self._cpu()
+        cpu.total_accesses += 1
+        process = self.processes.get(pid)
+        lock = self._process_locks.get(pid)
+        if process is None or lock is None:
+            return ACCESS_NO_PROCESS
+        if not (0 <= page_number < process.pages_needed):
+            return ACCESS_INVALID_PAGE
+        with lock:
+            if self.processes.get(pid) is not process:
+                return ACCESS_NO_PROCESS
+            pte = process.page_table[page_number]
+            with cpu.tlb_lock:
+                hit = cpu.tlb.lookup(pid, page_number) is not None
+            if hit:
+                cpu.tlb_hits += 1
+                self._referenced(pid, page_number, pte)
+                return ACCESS_TLB_HIT
+            cpu.tlb_misses += 1
+            if pte is not None:
+                if pte.present:
+                    self._referenced(pid, page_number, pte)
+                    self._update_tlb(pid, page_number, pte.frame_index)
+                    return ACCESS_HIT
+                if pte.swap_index is None:
+                    return ACCESS_UNMAPPED
+        # Fallo: el marco se consigue sin el cerrojo del proceso, porque
+        # expulsar la víctima requiere el del proceso víctima
+        frame_index, eviction = self._obtain_frame()
+        if frame_index is None:
+            return ACCESS_NO_MEMORY
+        with lock:
+            if self.processes.get(pid) is not process:
+                self._release_frame(frame_index)
+                return ACCESS_NO_PROCESS
+            pte = process.page_table[page_number]
+            if pte is not None and pte.present:
+                # Otra CPU ha resuelto el mismo fallo mientras tanto
+                self._release_frame(frame_index)
+                self._referenced(pid, page_number, pte)
+                self._update_tlb(pid, page_number, pte.frame_index)
+                return ACCESS_HIT
+            with self._replacement_lock, self._swap_lock, self._frame_lock(frame_index):
+                if pte is None:
+                    process.page_table[page_number] = PageTableEntry()
+                    self._assign_frame(process, page_number, frame_index)
+                    cpu.minor_faults += 1
+                    result = ACCESS_MINOR_FAULT
+                else:
+                    self._swap_in(process, page_number, frame_index)
+                    cpu.page_faults += 1
+                    cpu.swaps_in += 1
+                    result = ACCESS_FAULT
+        self.last_eviction = eviction
+        return result
+
+    def _referenced(self, pid: int, page_number: int, pte: PageTableEntry) -> None:
+        pte.referenced = True
+        if self._tracks_accesses:
+            with self._replacement_lock:
+                if (pid, page_number) not in self._evicting:
+                    self.replacement.page_accessed(pid, page_number, pte)
+
+    def _release_frame(self, frame_index: int) -> None:
+        with self._ram_lock:
+            self.ram_allocator.release(frame_index)
+
+    def _obtain_frame(self) -> Tuple[Optional[int], Optional[Eviction]]:
+        """Reserva un marco de RAM, expulsando una página si no hay libres.
+
+        Devuelve el marco y la expulsión realizada, o (None, None) si hacía
+        falta expulsar y la Swap está llena.
+        """
+        while True:
+            with self._ram_lock:
+                frame_index = self.ram_allocator.allocate()
+            if frame_index is not None:
+                return frame_index, None
+            with self._replacement_lock:
+                victim = self.replacement.select_victim() if len(self.replacement) else None
+                if victim is not None:
+                    self._evicting.add(victim)
+            if victim is None:
+                # Todos los marcos están reservados por fallos en curso
+                time.sleep(0)
+                continue
+            try:
+                result = self._evict(*victim)
+            finally:
+                with self._replacement_lock:
+                    self._evicting.discard(victim)
+            if result is not None:
+                return result
+
+    def _evict(self, victim_pid: int, victim_page: int) -> Optional[Tuple[Optional[int], Optional[Eviction]]]:
+        """Mueve la víctima a Swap y devuelve su marco, o None si el proceso
+        víctima terminó entretanto (y hay que buscar otro marco)."""
+        lock = self._process_locks.get(victim_pid)
+        if lock is None:
+            return None
+        with lock:
+            process = self.processes.get(victim_pid)
+            entry = process.page_table[victim_page] if process is not None else None
+            if entry is None or not entry.present:
+                return None
+            frame_index = entry.frame_index
+            with self._swap_lock, self._frame_lock(frame_index):
+                swap_full = not self.swap_allocator.has_free()
+                if not swap_full:
+                    swap_idx = self._move_to_swap(process, victim_page, frame_index)
+            if swap_full:
+                with self._replacement_lock:
+                    self.replacement.page_loaded(victim_pid, victim_page, entry)
+                return None, None
+        self._cpu().swaps_out += 1
+        return frame_index, (victim_pid, victim_page, swap_idx)
+
+    # TLB
+    def _update_tlb(self, pid: int, page_number: int, frame_index: int):
+        cpu = self._cpu()
+        with cpu.tlb_lock:
+            cpu.tlb.insert(pid, page_number, frame_index)
+
+    def _invalidate_tlb(self, pid: int, page_number: int):
+        local = self._cpu()
+        remote = 0
+        for cpu in self.cpus:
+            with cpu.tlb_lock:
+                removed = cpu.tlb.invalidate(pid, page_number)
+            if removed and cpu is not local:
+                remote += 1
+        if remote:
+            local.tlb_shootdowns += 1
+            local.shootdown_ipis += remote
+
+    def _shootdown(self, invalidate) -> None:
+        """Aplica ``invalidate`` a la TLB de cada CPU (con sus cerrojos ya
+        tomados) y cuenta las IPI a las CPU remotas en las que tuvo efecto."""
+        local = self._cpu()
+        remote = sum(1 for cpu in self.cpus if invalidate(cpu.tlb) and cpu is not local)
+        if remote:
+            local.tlb_shootdowns += 1
+            local.shootdown_ipis += remote
+
+    # MÉTRICAS
+    def get_lock_metrics(self) -> Dict[str, Dict[str, int]]:
+        """Adquisiciones, esperas y nanosegundos esperados por clase de cerrojo."""
+        groups = {
+            "process": list(self._process_locks.values()),
+            "replacement": [self._replacement_lock],
+            "ram_allocator": [self._ram_lock],
+            "swap": [self._swap_lock],
+            "frames": self._frame_locks,
+            "tlb": [cpu.tlb_lock for cpu in self.cpus],
+        }
+        metrics = {}
+        for name in LOCK_CLASSES:
+            locks = groups[name]
+            acquisitions, contended, wait_ns = self._retired_process_locks if name == "process" else (0, 0, 0)
+            metrics[name] = {
+                "acquisitions": acquisitions + sum(lock.acquisitions for lock in locks),
+                "contended": contended + sum(lock.contended for lock in locks),
+                "wait_ns": wait_ns + sum(lock.wait_ns for lock in locks),
+            }
+        return metrics
+
+    def get_metrics_dict(self) -> Dict[str, Any]:
+        metrics = super().get_metrics_dict()
+        metrics["cpus"] = len(self.cpus)
+        metrics["tlb_shootdowns"] = sum(cpu.tlb_shootdowns for cpu in self.cpus)
+        metrics["shootdown_ipis"] = sum(cpu.shootdown_ipis for cpu in self.cpus)
+        metrics["per_cpu"] = [cpu.metrics_dict() for cpu in self.cpus]
+        metrics["locks"] = self.get_lock_metrics()
+        return metrics
+
+    def get_metrics(self):
+        m = self.get_metrics_dict()
+        lines = [f"CPU: {m['cpus']} (TLB shootdowns: {m['tlb_shootdowns']}, IPI: {m['shootdown_ipis']})"]
+        for index, cpu in enumerate(m["per_cpu"]):
+            lookups = cpu["tlb_hits"] + cpu["tlb_misses"]
+            ratio = cpu["tlb_hits"] / lookups * 100 if lookups else 0.0
+            lines.append(
+                f"  CPU{index}: {cpu['total_accesses']} accesos, TLB hits {ratio:.2f}%, "
+                f"{cpu['page_faults']} fallos, {cpu['minor_faults']} fallos menores"
+            )
+        lines.append("Contención de cerrojos:")
+        for name, lock in m["locks"].items():
+            share = lock["contended"] / lock["acquisitions"] * 100 if lock["acquisitions"] else 0.0
+            lines.append(
+                f"  {name}: {lock['acquisitions']} adquisiciones, {lock['contended']} con espera "
+                f"({share:.2f}%), {lock['wait_ns'] / 1e6:.2f} ms esperando"
+            )
+        return super().get_metrics() + "\n".join(lines) + "\n"
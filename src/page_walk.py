@@ -0,0 +1,256 @@
+"""
+Modelo de coste del recorrido de la tabla de páginas en los fallos de TLB.
+
+Cada fallo de TLB obliga a recorrer la tabla de páginas en memoria. El
+gestor llama a ``walk`` y el modelo cuenta los accesos a memoria de cada
+nivel; si la estructura traduce por sí misma, ``walk`` devuelve además el
+marco encontrado:
+
+* ``flat``: tabla lineal, un acceso por recorrido. Es la estructura por
+  defecto y no necesita modelo: sus accesos son los fallos de TLB.
+* ``radix``: tabla jerárquica de 2, 3 o 4 niveles (``RadixPageTable``). Una
+  caché de recorridos (page-walk cache) LRU guarda las entradas de los
+  niveles superiores, de modo que un acierto en el nivel ``i`` evita leer
+  los niveles ``0..i``. Se cobra el recorrido completo hasta la hoja.
+* ``inverted``: tabla invertida real (``InvertedWalker``), indexada por
+  marco de RAM: cada entrada guarda el pid y la página que ocupan el marco
+  y el siguiente marco de su cadena, y una tabla hash de anclas apunta al
+  primero de cada cadena. Un recorrido lee el ancla y sigue la cadena hasta
+  encontrar la página (o hasta el final si no está en RAM), y el marco
+  encontrado es la traducción que el gestor carga en la TLB. La tabla de
+  cada proceso se conserva solo para lo que la invertida no guarda: la
+  ranura de Swap de las páginas no residentes y sus bits.
+
+Con los contadores y los tiempos de ``[PageTable]`` el gestor calcula el
+tiempo efectivo de acceso (EAT).
+"""
+
+from array import array
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from config import Config
+from process import RadixPageTable
+
+PageKey = Tuple[int, int]
+
+
+class PageWalker:
+    """Interfaz base de los modelos de recorrido."""
+
+    name = "flat"
+    levels = 1
+
+    def __init__(self) -> None:
+        self.walks = 0
+        self.level_accesses: List[int] = [0] * self.levels
+
+    def walk(self, pid: int, page_number: int) -> Optional[int]:
+        """Cuenta los accesos a memoria de un recorrido tras un fallo de TLB.
+
+        Devuelve el marco de la página si la estructura lo encuentra por sí
+        misma, o None si la traducción está en la tabla del proceso.
+        """
+        raise NotImplementedError
+
+    def page_mapped(self, pid: int, page_number: int, frame_index: int) -> None:
+        """La página ha ocupado el marco ``frame_index``."""
+
+    def page_unmapped(self, pid: int, page_number: int, frame_index: int) -> None:
+        """La página ha dejado el marco ``frame_index``."""
+
+    def table_bytes(self, page_tables) -> int:
+        """Memoria ocupada por las tablas de páginas de los procesos dados."""
+        raise NotImplementedError
+
+    def metrics_dict(self) -> Dict[str, object]:
+        return {}
+
+    def export_state(self) -> Dict[str, Any]:
+        """Contadores (y estructuras internas) para las instantáneas."""
+        return {"walks": self.walks, "level_accesses": array("q", self.level_accesses)}
+
+    def restore_state(self, state: Dict[str, Any]) -> None:
+        self.walks = state["walks"]
+        self.level_accesses = list(state["level_accesses"])
+
+
+class RadixWalker(PageWalker):
+    """Recorrido de una tabla jerárquica con caché de recorridos LRU."""
+
+    name = "radix"
+
+    def __init__(self, levels: int, cache_size: int) -> None:
+        self.levels = levels
+        super().__init__()
+        self.cache_size = cache_size
+        # Claves (pid, nivel, prefijo del número de página hasta ese nivel)
+        self._cache: "OrderedDict[Tuple[int, int, int], None]" = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def walk(self, pid: int, page_number: int) -> Optional[int]:
+        self.walks += 1
+        levels = self.levels
+        bits = RadixPageTable.BITS_PER_LEVEL
+        cache = self._cache
+        start = 0
+        if self.cache_size:
+            # Buscar el nivel superior más profundo presente en la caché
+            for level in range(levels - 2, -1, -1):
+                key = (pid, level, page_number >> (bits * (levels - 1 - level)))
+                if key in cache:
+                    cache.move_to_end(key)
+                    start = level + 1
+                    self.cache_hits += 1
+                    break
+            else:
+                self.cache_misses += 1
+        level_accesses = self.level_accesses
+        for level in range(start, levels):
+            level_accesses[level] += 1
+        if self.cache_size:
+            for level in range(start, levels - 1):
+                cache[(pid, level, page_number >> (bits * (levels - 1 - level)))] = None
+            while len(cache) > self.cache_size:
+                cache.popitem(last=False)
+        # La hoja está en la tabla del proceso (RadixPageTable)
+        return None
+
+    def table_bytes(self, page_tables) -> int:
+        return sum(table.nbytes for table in page_tables)
+
+    def export_state(self) -> Dict[str, Any]:
+        state = super().export_state()
+        state["cache_hits"] = self.cache_hits
+        state["cache_misses"] = self.cache_misses
+        pids, levels, prefixes = array("q"), array("q"), array("q")
+        for pid, level, prefix in self._cache:
+            pids.append(pid)
+            levels.append(level)
+            prefixes.append(prefix)
+        state.update(cache_pids=pids, cache_levels=levels, cache_prefixes=prefixes)
+        return state
+
+    def restore_state(self, state: Dict[str, Any]) -> None:
+        super().restore_state(state)
+        self.cache_hits = state["cache_hits"]
+        self.cache_misses = state["cache_misses"]
+        cache = self._cache
+        cache.clear()
+        for key in zip(state["cache_pids"], state["cache_levels"], state["cache_prefixes"]):
+            cache[key] = None
+        # Con una caché más pequeña que la guardada se conservan las más recientes
+        while len(cache) > self.cache_size:
+            cache.popitem(last=False)
+
+    def metrics_dict(self) -> Dict[str, object]:
+        lookups = self.cache_hits + self.cache_misses
+        return {
+            "walk_cache_hits": self.cache_hits,
+            "walk_cache_misses": self.cache_misses,
+            "walk_cache_hit_ratio": self.cache_hits / lookups * 100 if lookups else 0.0,
+        }
+
+
+class InvertedWalker(PageWalker):
+    """Tabla de páginas invertida indexada por marco, con anclas hash.
+
+    La entrada ``i`` describe el marco ``i``: ``pids[i]`` y ``pages[i]``
+    (-1 si está libre) y ``next[i]``, el siguiente marco de la misma cadena
+    (-1 al final). ``anchors[h]`` es el primer marco de la cadena de las
+    páginas cuyo hash es ``h``; las páginas nuevas entran al principio.
+
+    Los accesos del nivel 0 son lecturas del ancla y los del nivel 1,
+    entradas de la tabla invertida recorridas en la cadena.
+    """
+
+    name = "inverted"
+    levels = 2
+
+    # pid, página y siguiente de la cadena por entrada; un puntero por ancla
+    ENTRY_BYTES = 16
+    ANCHOR_BYTES = 8
+
+    def __init__(self, frames: int) -> None:
+        super().__init__()
+        self.frames = frames
+        self.anchors = 1 << max(0, frames - 1).bit_length()
+        self._mask = self.anchors - 1
+        self.pids = array("q", [-1]) * frames
+        self.pages = array("q", [-1]) * frames
+        self.next = array("q", [-1]) * frames
+        self.anchor = array("q", [-1]) * self.anchors
+
+    def _bucket(self, pid: int, page_number: int) -> int:
+        return hash((pid, page_number)) & self._mask
+
+    def lookup(self, pid: int, page_number: int) -> Optional[int]:
+        """Marco de la página según la tabla, sin contar accesos."""
+        pids, pages, following = self.pids, self.pages, self.next
+        frame = self.anchor[self._bucket(pid, page_number)]
+        while frame != -1 and (pids[frame] != pid or pages[frame] != page_number):
+            frame = following[frame]
+        return None if frame == -1 else frame
+
+    def walk(self, pid: int, page_number: int) -> Optional[int]:
+        self.walks += 1
+        pids, pages, following = self.pids, self.pages, self.next
+        frame = self.anchor[self._bucket(pid, page_number)]
+        probes = 0
+        while frame != -1:
+            probes += 1
+            if pids[frame] == pid and pages[frame] == page_number:
+                break
+            frame = following[frame]
+        self.level_accesses[0] += 1
+        self.level_accesses[1] += probes
+        return None if frame == -1 else frame
+
+    def page_mapped(self, pid: int, page_number: int, frame_index: int) -> None:
+        bucket = self._bucket(pid, page_number)
+        self.pids[frame_index] = pid
+        self.pages[frame_index] = page_number
+        self.next[frame_index] = self.anchor[bucket]
+        self.anchor[bucket] = frame_index
+
+    def page_unmapped(self, pid: int, page_number: int, frame_index: int) -> None:
+        bucket = self._bucket(pid, page_number)
+        following = self.next
+        frame = self.anchor[bucket]
+        if frame == frame_index:
+            self.anchor[bucket] = following[frame_index]
+        else:
+            while following[frame] != frame_index:
+                frame = following[frame]
+            following[frame] = following[frame_index]
+        self.pids[frame_index] = -1
+        self.pages[frame_index] = -1
+        following[frame_index] = -1
+
+    def export_state(self) -> Dict[str, Any]:
+        state = super().export_state()
+        state.update(entry_pids=self.pids, entry_pages=self.pages, entry_next=self.next, anchors=self.anchor)
+        return state
+
+    def restore_state(self, state: Dict[str, Any]) -> None:
+        super().restore_state(state)
+        self.pids = array("q", state["entry_pids"])
+        self.pages = array("q", state["entry_pages"])
+        self.next = array("q", state["entry_next"])
+        self.anchor = array("q", state["anchors"])
+
+    def table_bytes(self, page_tables) -> int:
+        # Una sola tabla para todo el sistema, proporcional a la RAM
+        return self.frames * self.ENTRY_BYTES + self.anchors * self.ANCHOR_BYTES
+
+
+def create_page_walker(config: Config) -> Optional[PageWalker]:
+    """Crea el modelo indicado por ``STRUCTURE`` en ``[PageTable]``, o None
+    para la tabla lineal."""
+    values = config.values
+    if values.page_table == "radix":
+        return RadixWalker(values.page_table_levels, values.walk_cache_size)
+    if values.page_table == "inverted":
+        return InvertedWalker(config.ram_frames)
+    return None
@@ -0,0 +1,169 @@
+"""
+Estrategias de prelectura (read-ahead) para los fallos de página.
+
+Cuando una página se trae desde Swap, el gestor pregunta a la estrategia
+qué otras páginas del mismo proceso conviene traer con ella
+(``on_fault``). Solo se precargan las que están en Swap; las demás se
+ignoran. Las estrategias reciben además las expulsiones
+(``page_evicted``) y la terminación de procesos (``forget``) para mantener
+su estado por PID.
+
+Estrategias disponibles:
+
+* ``none``: sin prelectura.
+* ``sequential``: las ``depth`` páginas siguientes a la que falla.
+* ``stride``: detecta por PID un paso constante entre fallos consecutivos y,
+  cuando se repite, precarga ``depth`` páginas siguiendo ese paso.
+* ``working_set``: trae las páginas del proceso expulsadas más
+  recientemente, que formaban parte de su conjunto de trabajo.
+"""
+
+from array import array
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, List, Tuple
+
+
+class PrefetchStrategy:
+    """Interfaz base para estrategias de prelectura."""
+
+    name = "none"
+
+    def __init__(self, depth: int = 0) -> None:
+        self.depth = depth
+
+    def on_fault(self, pid: int, page_number: int) -> Iterable[int]:
+        """Páginas candidatas a precargar junto con ``page_number``."""
+        return ()
+
+    def page_evicted(self, pid: int, page_number: int) -> None:
+        """La página ha sido expulsada de la RAM a Swap."""
+
+    def forget(self, pid: int) -> None:
+        """Olvida el estado del proceso que termina."""
+
+    def export_state(self) -> Dict[str, Any]:
+        """Estado por PID para las instantáneas (vacío si no tiene)."""
+        return {}
+
+    def restore_state(self, state: Dict[str, Any]) -> None:
+        pass
+
+
+class SequentialPrefetch(PrefetchStrategy):
+    """Lectura anticipada secuencial de las ``depth`` páginas siguientes."""
+
+    name = "sequential"
+
+    def on_fault(self, pid: int, page_number: int) -> Iterable[int]:
+        return range(page_number + 1, page_number + 1 + self.depth)
+
+
+class StridePrefetch(PrefetchStrategy):
+    """Detección de paso constante por proceso.
+
+    Guarda para cada PID la última página que falló y el último paso; si
+    dos fallos consecutivos repiten un paso no nulo se precargan las
+    ``depth`` páginas siguientes con ese paso.
+    """
+
+    name = "stride"
+
+    def __init__(self, depth: int = 0) -> None:
+        super().__init__(depth)
+        self._state: Dict[int, Tuple[int, int]] = {}
+
+    def on_fault(self, pid: int, page_number: int) -> Iterable[int]:
+        last = self._state.get(pid)
+        stride = page_number - last[0] if last else 0
+        self._state[pid] = (page_number, stride)
+        if last is None or stride == 0 or stride != last[1]:
+            return ()
+        return range(page_number + stride, page_number + stride * (self.depth + 1), stride)
+
+    def forget(self, pid: int) -> None:
+        self._state.pop(pid, None)
+
+    def export_state(self) -> Dict[str, Any]:
+        return {
+            "pids": array("q", self._state),
+            "pages": array("q", (page for page, _ in self._state.values())),
+            "strides": array("q", (stride for _, stride in self._state.values())),
+        }
+
+    def restore_state(self, state: Dict[str, Any]) -> None:
+        rows = zip(state["pids"], state["pages"], state["strides"])
+        self._state = {pid: (page, stride) for pid, page, stride in rows}
+
+
+class WorkingSetPrefetch(PrefetchStrategy):
+    """Trae las páginas del proceso expulsadas más recientemente.
+
+    Se recuerdan por PID las últimas ``4 * depth`` expulsiones; al fallar se
+    precargan, de la más reciente a la más antigua, hasta ``depth`` de ellas.
+    """
+
+    name = "working_set"
+
+    HISTORY_FACTOR = 4
+
+    def __init__(self, depth: int = 0) -> None:
+        super().__init__(depth)
+        self._evicted: Dict[int, Deque[int]] = {}
+
+    def on_fault(self, pid: int, page_number: int) -> Iterable[int]:
+        history = self._evicted.get(pid)
+        if not history:
+            return ()
+        candidates: List[int] = []
+        for evicted in reversed(history):
+            if evicted != page_number and evicted not in candidates:
+                candidates.append(evicted)
+                if len(candidates) == self.depth:
+                    break
+        return candidates
+
+    def page_evicted(self, pid: int, page_number: int) -> None:
+        history = self._evicted.get(pid)
+        if history is None:
+            history = self._evicted[pid] = deque(maxlen=self.HISTORY_FACTOR * max(1, self.depth))
+        history.append(page_number)
+
+    def forget(self, pid: int) -> None:
+        self._evicted.pop(pid, None)
+
+    def export_state(self) -> Dict[str, Any]:
+        # Historias concatenadas; ``lengths`` indica cuántas son de cada PID
+        pages = array("q")
+        for history in self._evicted.values():
+            pages.extend(history)
+        return {
+            "pids": array("q", self._evicted),
+            "lengths": array("q", (len(history) for history in self._evicted.values())),
+            "pages": pages,
+        }
+
+    def restore_state(self, state: Dict[str, Any]) -> None:
+        self._evicted = {}
+        pages = list(state["pages"])
+        start = 0
+        for pid, length in zip(state["pids"], state["lengths"]):
+            for page_number in pages[start:start + length]:
+                self.page_evicted(pid, page_number)
+            start += length
+
+
+PREFETCH_STRATEGIES = {
+    "none": PrefetchStrategy,
+    "sequential": SequentialPrefetch,
+    "stride": StridePrefetch,
+    "working_set": WorkingSetPrefetch,
+}
+
+
+def create_prefetcher(name: str, depth: int) -> PrefetchStrategy:
+    """Crea la estrategia de prelectura indicada por nombre."""
+    try:
+        cls = PREFETCH_STRATEGIES[name.lower()]
+    except KeyError:
+        raise ValueError(f"Estrategia de prelectura desconocida: {name}") from None
+    return cls(depth)
@@ -10,7 +10,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Dict, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Union
 
 
 class ProcessState(Enum):
@@ -21,9 +21,9 @@ class ProcessState(Enum):
     TERMINATED = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class PageTableEntry:
-    """Entrada de la tabla de páginas."""
+    """Entrada de la tabla de páginas (con ``__slots__`` para ahorrar memoria)."""
 
     present: bool = False
     frame_index: Optional[int] = None
@@ -31,22 +31,130 @@ class PageTableEntry:
     referenced: bool = False
 
 
+class LazyPageTable(Dict[int, PageTableEntry]):
+    """Tabla de páginas para paginación bajo demanda.
+
+    Solo contiene las páginas que se han tocado; consultar una página nunca
+    usada devuelve None en lugar de lanzar ``KeyError``, de modo que se
+    indexa igual que la lista densa.
+    """
+
+    def __missing__(self, page_number: int) -> None:
+        return None
+
+
+class RadixPageTable:
+    """Tabla de páginas jerárquica de ``levels`` niveles.
+
+    Cada nivel usa ``BITS_PER_LEVEL`` bits del número de página (nodos de
+    512 entradas, como en x86-64) y los nodos se crean al asignar la primera
+    entrada de su región, por lo que el tamaño es proporcional a las
+    regiones tocadas. Se indexa igual que la lista densa y consultar una
+    página sin entrada devuelve None.
+    """
+
+    BITS_PER_LEVEL = 9
+    ENTRY_BYTES = 8
+
+    __slots__ = ("levels", "root", "nodes")
+
+    def __init__(self, levels: int) -> None:
+        self.levels = levels
+        self.root: Dict[int, object] = {}
+        self.nodes = 1
+
+    def __getitem__(self, page_number: int) -> Optional[PageTableEntry]:
+        bits = self.BITS_PER_LEVEL
+        mask = (1 << bits) - 1
+        shift = bits * (self.levels - 1)
+        # La raíz no se enmascara: absorbe los bits altos del número de página
+        node = self.root.get(page_number >> shift)
+        while node is not None and shift:
+            shift -= bits
+            node = node.get((page_number >> shift) & mask)
+        return node
+
+    def __setitem__(self, page_number: int, entry: PageTableEntry) -> None:
+        bits = self.BITS_PER_LEVEL
+        mask = (1 << bits) - 1
+        shift = bits * (self.levels - 1)
+        node = self.root
+        index = page_number >> shift
+        while shift:
+            child = node.get(index)
+            if child is None:
+                child = node[index] = {}
+                self.nodes += 1
+            node = child
+            shift -= bits
+            index = (page_number >> shift) & mask
+        node[index] = entry
+
+    def items(self) -> Iterator[Tuple[int, PageTableEntry]]:
+        """Recorre las entradas existentes como pares (página, entrada)."""
+        bits = self.BITS_PER_LEVEL
+        stack = [(node, index, 0) for index, node in self.root.items()]
+        while stack:
+            node, prefix, depth = stack.pop()
+            if depth == self.levels - 1:
+                yield prefix, node
+                continue
+            for index, child in node.items():
+                stack.append((child, (prefix << bits) | index, depth + 1))
+
+    @property
+    def nbytes(self) -> int:
+        """Memoria que ocuparía la tabla con nodos de 512 entradas de 8 bytes."""
+        return self.nodes * (1 << self.BITS_PER_LEVEL) * self.ENTRY_BYTES
+
+
 class Process:
     """Representa un proceso con tamaño y tabla de páginas."""
 
     _next_pid = 1
 
-    def __init__(self, size_kb: int, page_size_kb: int) -> None:
+    def __init__(
+        self,
+        size_kb: int,
+        page_size_kb: int,
+        build_page_table: bool = True,
+        lazy_page_table: bool = False,
+        page_table_levels: int = 1,
+    ) -> None:
         self.pid: int = Process._next_pid
         Process._next_pid += 1
         self.size_kb: int = size_kb
         self.page_size_kb: int = page_size_kb
         self.pages_needed: int = (size_kb + page_size_kb - 1) // page_size_kb
-        # Inicialmente la tabla de páginas está vacía; se rellena al asignar marcos
-        self.page_table: Dict[int, PageTableEntry] = {
-            i: PageTableEntry() for i in range(self.pages_needed)
-        }
+        # Tabla de páginas densa indexada por número de página; las entradas
+        # se rellenan al asignar marcos. Los motores que guardan la tabla en
+        # columnas propias no la necesitan. Con paginación bajo demanda la
+        # tabla empieza vacía y crear el proceso cuesta O(1). Con varios
+        # niveles la tabla es jerárquica.
+        self.page_table: Union[List[PageTableEntry], LazyPageTable, RadixPageTable]
+        if page_table_levels > 1:
+            self.page_table = RadixPageTable(page_table_levels)
+            if not lazy_page_table:
+                for page_number in range(self.pages_needed):
+                    self.page_table[page_number] = PageTableEntry()
+        elif lazy_page_table:
+            self.page_table = LazyPageTable()
+        elif build_page_table:
+            self.page_table = [PageTableEntry() for _ in range(self.pages_needed)]
+        else:
+            self.page_table = []
         self.state: ProcessState = ProcessState.ACTIVE
+        # Contadores mantenidos por el gestor de memoria
+        self.resident_pages: int = 0
+        self.swapped_pages: int = 0
+        # Índices de páginas en RAM y en Swap, para que la terminación solo
+        # recorra las páginas que ocupan algún marco
+        self.resident: Set[int] = set()
+        self.swapped: Set[int] = set()
+        # Páginas enormes: si el proceso puede usarlas (lo decide el gestor
+        # al cargarlo) y regiones de páginas base mapeadas como una sola
+        self.huge_pages: bool = False
+        self.huge_regions: Set[int] = set()
 
     def __repr__(self) -> str:
         return f"Process(pid={self.pid}, size_kb={self.size_kb}, pages={self.pages_needed}, state={self.state})"
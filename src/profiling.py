@@ -0,0 +1,112 @@
+"""
+Perfilado opcional de las rutas críticas del gestor de memoria.
+
+``Profiler`` sustituye en la instancia del gestor (y de su TLB y su
+algoritmo de reemplazo) los métodos de ``PROFILED_OPERATIONS`` por
+envoltorios que cuentan las llamadas y registran su duración en un
+``HdrHistogram``. Sin perfilador no hay ningún coste adicional y
+``detach`` restaura los métodos que había al instalarlo. Si otro código ha
+sustituido después alguno de esos métodos, ``detach`` no lo toca: el
+envoltorio del perfilador que queda debajo deja de medir y solo llama al
+método original.
+
+Los tiempos son inclusivos: ``access_page`` incluye ``access``, que a su
+vez incluye la consulta a la TLB, ``_update_tlb`` y, en un fallo,
+``_swap_and_assign``, ``select_victim`` y ``_move_to_swap``. Si se cambia el
+algoritmo de reemplazo con el perfilador activo, ``select_victim`` del
+nuevo algoritmo deja de medirse.
+"""
+
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+from histogram import HdrHistogram
+from memory_manager import MemoryManager
+
+# (atributo del gestor que contiene el método o "" para el propio gestor, método)
+PROFILED_OPERATIONS: Tuple[Tuple[str, str], ...] = (
+    ("", "access_page"),
+    ("", "access"),
+    ("tlb", "lookup"),
+    ("", "_update_tlb"),
+    ("", "_swap_and_assign"),
+    ("replacement", "select_victim"),
+    ("", "_move_to_swap"),
+    ("", "_swap_in"),
+    ("", "remove_process"),
+)
+
+
+class Profiler:
+    """Cuenta llamadas y latencias por operación."""
+
+    def __init__(self, manager: MemoryManager, operations=PROFILED_OPERATIONS) -> None:
+        self.manager = manager
+        self.histograms: Dict[str, HdrHistogram] = {}
+        # (objeto, método, envoltorio previo en la instancia o None, envoltorio instalado)
+        self._installed: List[Tuple[Any, str, Any, Callable]] = []
+        self.active = True
+        for owner_name, method in operations:
+            owner = getattr(manager, owner_name) if owner_name else manager
+            label = f"{owner_name}.{method}" if owner_name else method
+            histogram = self.histograms[label] = HdrHistogram()
+            previous = vars(owner).get(method)
+            wrapper = self._timed(getattr(owner, method), histogram)
+            setattr(owner, method, wrapper)
+            self._installed.append((owner, method, previous, wrapper))
+        self.started = time.perf_counter()
+
+    def _timed(self, func: Callable, histogram: HdrHistogram) -> Callable:
+        clock = time.perf_counter_ns
+        record = histogram.record_ns
+
+        def timed(*args, **kwargs):
+            if not self.active:
+                return func(*args, **kwargs)
+            start = clock()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record(clock() - start)
+
+        return timed
+
+    def detach(self) -> None:
+        """Restaura los métodos que había antes de instalar el perfilador,
+        salvo los que otro código haya sustituido después."""
+        self.active = False
+        for owner, method, previous, wrapper in reversed(self._installed):
+            if vars(owner).get(method) is not wrapper:
+                continue
+            if previous is not None:
+                setattr(owner, method, previous)
+            else:
+                delattr(owner, method)
+        self._installed = []
+
+    def reset(self) -> None:
+        for label in self.histograms:
+            self.histograms[label].__init__()
+        self.started = time.perf_counter()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {label: histogram.to_dict() for label, histogram in self.histograms.items()}
+
+    def report(self) -> str:
+        """Tabla de llamadas, tiempo total y percentiles por operación."""
+        elapsed = time.perf_counter() - self.started
+        lines = [
+            f"Perfil de {elapsed:.3f} s (tiempos inclusivos en ns)",
+            f"{'operación':28s} {'llamadas':>10s} {'total ms':>10s} {'media':>8s} "
+            f"{'p50':>8s} {'p90':>8s} {'p99':>8s} {'p99.9':>8s} {'máx':>10s}",
+        ]
+        for label, h in self.histograms.items():
+            if not h.count:
+                lines.append(f"{label:28s} {0:>10d}")
+                continue
+            lines.append(
+                f"{label:28s} {h.count:>10d} {h.total_ns / 1e6:>10.2f} {h.mean_ns:>8.0f} "
+                f"{h.percentile_ns(0.5):>8d} {h.percentile_ns(0.9):>8d} {h.percentile_ns(0.99):>8d} "
+                f"{h.percentile_ns(0.999):>8d} {h.max_ns:>10d}"
+            )
+        return "\n".join(lines)
@@ -1,28 +1,464 @@
 """
-Módulo que define algoritmos de reemplazo de páginas. Por ahora solo se
-implementa FIFO, pero la arquitectura permite incorporar otros algoritmos
-como LRU o Clock.
+Módulo que define algoritmos de reemplazo de páginas.
+
+El gestor de memoria notifica al algoritmo cada vez que una página se carga
+en RAM (``page_loaded``), se referencia estando residente
+(``page_accessed``) o sale de la RAM sin haber sido elegida como víctima
+(``page_removed``/``remove_process``). Cuando no quedan marcos libres pide
+una víctima con ``select_victim``. Todas las implementaciones realizan cada
+operación en O(1) (amortizado en el caso de FIFO, Clock y Second-Chance).
+
+Algoritmos disponibles: FIFO, LRU, Clock, Second-Chance, LFU y Random.
+
+Para las instantáneas, ``export_state`` devuelve el orden interno de las
+páginas en arrays de enteros y ``restore_state`` lo reconstruye; recibe
+además una función que da la entrada de la tabla de páginas de cada
+página, porque Clock y Second-Chance guardan referencias a ellas.
 """
 
-from collections import deque
-from typing import Deque, Tuple, Dict, Optional, Callable
+import random
+from array import array
+from collections import OrderedDict, deque
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Tuple
+
+PageKey = Tuple[int, int]
+EntryLookup = Callable[[int, int], Any]
+
+
+def _pack_keys(keys: Iterable[PageKey]) -> Dict[str, array]:
+    """Separa una secuencia de claves (pid, página) en dos arrays."""
+    pids = array("q")
+    pages = array("q")
+    for pid, page_number in keys:
+        pids.append(pid)
+        pages.append(page_number)
+    return {"pids": pids, "pages": pages}
+
+
+def _unpack_keys(state: Dict[str, Any]) -> Iterable[PageKey]:
+    return zip(state["pids"], state["pages"])
 
 
 class ReplacementAlgorithm:
-    """Interfaz base para algoritmos de reemplazo de páginas."""
+    """Interfaz base para algoritmos de reemplazo de páginas.
+
+    ``entry`` es la ``PageTableEntry`` de la página (o cualquier objeto con
+    atributo ``referenced``); los algoritmos que usan el bit de referencia
+    (Clock, Second-Chance) lo leen y lo limpian directamente sobre ella. Si
+    ``uses_reference_bit`` es falso el gestor puede pasar ``None``. Los
+    algoritmos con ``uses_seed`` reciben en el constructor la semilla de
+    ``[Replacement] SEED`` para que las ejecuciones sean reproducibles.
+    """
+
+    name = "base"
+    uses_reference_bit = False
+    uses_seed = False
+
+    def page_loaded(self, pid: int, page_number: int, entry) -> None:
+        """La página acaba de ocupar un marco de RAM."""
+        raise NotImplementedError
 
-    def select_victim(self, page_queue: Deque[Tuple[int, int]], is_valid: Callable[[Tuple[int, int]], bool]) -> Tuple[int, int]:
-        """Devuelve la tupla (pid, page_number) de la página víctima."""
+    def page_accessed(self, pid: int, page_number: int, entry) -> None:
+        """La página residente ha sido referenciada."""
+
+    def page_removed(self, pid: int, page_number: int) -> None:
+        """La página ha dejado la RAM sin pasar por ``select_victim``."""
+        raise NotImplementedError
+
+    def remove_process(self, pid: int, pages: Iterable[int]) -> None:
+        """Olvida todas las páginas residentes de un proceso que termina."""
+        for page_number in pages:
+            self.page_removed(pid, page_number)
+
+    def select_victim(self) -> PageKey:
+        """Elige, olvida y devuelve la tupla (pid, page_number) víctima."""
+        raise NotImplementedError
+
+    def export_state(self) -> Dict[str, Any]:
+        """Páginas en el orden en que el algoritmo elegiría víctima."""
+        raise NotImplementedError
+
+    def restore_state(self, state: Dict[str, Any], entries: EntryLookup) -> None:
+        """Reconstruye el estado en un algoritmo vacío."""
+        for pid, page_number in _unpack_keys(state):
+            self.page_loaded(pid, page_number, entries(pid, page_number))
+
+    def __len__(self) -> int:
         raise NotImplementedError
 
 
 class FIFOReplacement(ReplacementAlgorithm):
-    """Implementa la política FIFO (First-In, First-Out)."""
-
-    def select_victim(self, page_queue: Deque[Tuple[int, int]], is_valid: Callable[[Tuple[int, int]], bool]) -> Tuple[int, int]:
-        # Avanza hasta encontrar una entrada válida
-        while page_queue:
-            candidate = page_queue.popleft()
-            if is_valid(candidate):
-                return candidate
-        raise RuntimeError("No hay páginas válidas para reemplazar.")
\ No newline at end of file
+    """Implementa la política FIFO (First-In, First-Out) con borrado perezoso.
+
+    Cada carga se encola con un número de generación y ``_live`` guarda la
+    generación vigente de cada página residente. Retirar una página solo la
+    borra de ``_live``; su entrada en la cola queda como lápida y se descarta
+    al llegar al frente en ``select_victim``. Cuando las lápidas superan a las
+    entradas vivas la cola se compacta, de modo que su tamaño sigue acotado.
+    """
+
+    name = "FIFO"
+
+    # Lápidas toleradas antes de compactar (además de una por entrada viva)
+    COMPACT_SLACK = 64
+
+    def __init__(self) -> None:
+        self.queue: Deque[Tuple[int, int, int]] = deque()
+        self._live: Dict[PageKey, int] = {}
+        self._generation = 0
+
+    def page_loaded(self, pid: int, page_number: int, entry) -> None:
+        self._generation += 1
+        self._live[(pid, page_number)] = self._generation
+        self.queue.append((pid, page_number, self._generation))
+
+    def page_removed(self, pid: int, page_number: int) -> None:
+        self._live.pop((pid, page_number), None)
+        self._maybe_compact()
+
+    def remove_process(self, pid: int, pages: Iterable[int]) -> None:
+        live = self._live
+        for page_number in pages:
+            live.pop((pid, page_number), None)
+        self._maybe_compact()
+
+    def _maybe_compact(self) -> None:
+        live = self._live
+        if len(self.queue) > 2 * len(live) + self.COMPACT_SLACK:
+            self.queue = deque(item for item in self.queue if live.get((item[0], item[1])) == item[2])
+
+    def select_victim(self) -> PageKey:
+        queue = self.queue
+        live = self._live
+        while queue:
+            pid, page_number, generation = queue.popleft()
+            key = (pid, page_number)
+            if live.get(key) == generation:
+                del live[key]
+                return key
+        raise RuntimeError("No hay páginas válidas para reemplazar.")
+
+    def export_state(self) -> Dict[str, Any]:
+        # Las lápidas no se guardan; al restaurar se renumeran las generaciones
+        live = self._live
+        return _pack_keys((pid, page_number) for pid, page_number, generation in self.queue
+                          if live.get((pid, page_number)) == generation)
+
+    def __len__(self) -> int:
+        return len(self._live)
+
+
+class LRUReplacement(ReplacementAlgorithm):
+    """LRU exacto: tabla hash + lista doblemente enlazada (OrderedDict)."""
+
+    name = "LRU"
+
+    def __init__(self) -> None:
+        self._pages: "OrderedDict[PageKey, None]" = OrderedDict()
+
+    def page_loaded(self, pid: int, page_number: int, entry) -> None:
+        self._pages[(pid, page_number)] = None
+
+    def page_accessed(self, pid: int, page_number: int, entry) -> None:
+        self._pages.move_to_end((pid, page_number))
+
+    def page_removed(self, pid: int, page_number: int) -> None:
+        self._pages.pop((pid, page_number), None)
+
+    def select_victim(self) -> PageKey:
+        if not self._pages:
+            raise RuntimeError("No hay páginas válidas para reemplazar.")
+        key, _ = self._pages.popitem(last=False)
+        return key
+
+    def export_state(self) -> Dict[str, Any]:
+        return _pack_keys(self._pages)
+
+    def __len__(self) -> int:
+        return len(self._pages)
+
+
+class SecondChanceReplacement(ReplacementAlgorithm):
+    """FIFO con segunda oportunidad según el bit ``referenced``.
+
+    Una página referenciada que llega al frente de la cola pierde su bit y
+    vuelve al final en lugar de ser expulsada.
+    """
+
+    name = "Second-Chance"
+    uses_reference_bit = True
+
+    def __init__(self) -> None:
+        self._pages: "OrderedDict[PageKey, object]" = OrderedDict()
+
+    def page_loaded(self, pid: int, page_number: int, entry) -> None:
+        self._pages[(pid, page_number)] = entry
+
+    def page_removed(self, pid: int, page_number: int) -> None:
+        self._pages.pop((pid, page_number), None)
+
+    def select_victim(self) -> PageKey:
+        pages = self._pages
+        if not pages:
+            raise RuntimeError("No hay páginas válidas para reemplazar.")
+        while True:
+            key, entry = pages.popitem(last=False)
+            if not entry.referenced:
+                return key
+            entry.referenced = False
+            pages[key] = entry
+
+    def export_state(self) -> Dict[str, Any]:
+        return _pack_keys(self._pages)
+
+    def __len__(self) -> int:
+        return len(self._pages)
+
+
+class ClockReplacement(ReplacementAlgorithm):
+    """Algoritmo del reloj sobre un búfer circular de ranuras.
+
+    Las ranuras liberadas se reutilizan, de modo que el reloj nunca crece
+    por encima del número máximo de páginas residentes.
+    """
+
+    name = "Clock"
+    uses_reference_bit = True
+
+    def __init__(self) -> None:
+        self._slots: List[Optional[Tuple[PageKey, object]]] = []
+        self._positions: Dict[PageKey, int] = {}
+        self._free_slots: List[int] = []
+        self._hand = 0
+
+    def page_loaded(self, pid: int, page_number: int, entry) -> None:
+        key = (pid, page_number)
+        if self._free_slots:
+            slot = self._free_slots.pop()
+            self._slots[slot] = (key, entry)
+        else:
+            slot = len(self._slots)
+            self._slots.append((key, entry))
+        self._positions[key] = slot
+
+    def page_removed(self, pid: int, page_number: int) -> None:
+        slot = self._positions.pop((pid, page_number), None)
+        if slot is not None:
+            self._slots[slot] = None
+            self._free_slots.append(slot)
+
+    def select_victim(self) -> PageKey:
+        if not self._positions:
+            raise RuntimeError("No hay páginas válidas para reemplazar.")
+        slots = self._slots
+        size = len(slots)
+        hand = self._hand
+        while True:
+            if hand >= size:
+                hand = 0
+            item = slots[hand]
+            if item is not None:
+                key, entry = item
+                if not entry.referenced:
+                    slots[hand] = None
+                    self._free_slots.append(hand)
+                    del self._positions[key]
+                    self._hand = hand + 1
+                    return key
+                entry.referenced = False
+            hand += 1
+
+    def export_state(self) -> Dict[str, Any]:
+        # Las ranuras vacías se guardan como (-1, -1) para conservar la
+        # posición de la manecilla
+        state: Dict[str, Any] = _pack_keys(item[0] if item is not None else (-1, -1) for item in self._slots)
+        state["free_slots"] = array("q", self._free_slots)
+        state["hand"] = self._hand
+        return state
+
+    def restore_state(self, state: Dict[str, Any], entries: EntryLookup) -> None:
+        for slot, (pid, page_number) in enumerate(_unpack_keys(state)):
+            if pid < 0:
+                self._slots.append(None)
+                continue
+            key = (pid, page_number)
+            self._slots.append((key, entries(pid, page_number)))
+            self._positions[key] = slot
+        self._free_slots = list(state["free_slots"])
+        self._hand = state["hand"]
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+
+class _FrequencyNode:
+    """Nodo de la lista de frecuencias del LFU."""
+
+    __slots__ = ("frequency", "pages", "prev", "next")
+
+    def __init__(self, frequency: int) -> None:
+        self.frequency = frequency
+        self.pages: "OrderedDict[PageKey, None]" = OrderedDict()
+        self.prev: Optional["_FrequencyNode"] = None
+        self.next: Optional["_FrequencyNode"] = None
+
+
+class LFUReplacement(ReplacementAlgorithm):
+    """LFU en O(1) con cubetas de frecuencia enlazadas.
+
+    Las cubetas forman una lista doblemente enlazada ordenada por frecuencia;
+    dentro de cada cubeta se desempata por antigüedad (LRU).
+    """
+
+    name = "LFU"
+
+    def __init__(self) -> None:
+        # Nodo centinela: head.next es la cubeta de menor frecuencia
+        self._head = _FrequencyNode(0)
+        self._head.next = self._head
+        self._head.prev = self._head
+        self._nodes: Dict[PageKey, _FrequencyNode] = {}
+
+    def _insert_after(self, node: _FrequencyNode, frequency: int) -> _FrequencyNode:
+        new = _FrequencyNode(frequency)
+        new.prev = node
+        new.next = node.next
+        node.next.prev = new
+        node.next = new
+        return new
+
+    def _unlink_if_empty(self, node: _FrequencyNode) -> None:
+        if not node.pages and node is not self._head:
+            node.prev.next = node.next
+            node.next.prev = node.prev
+
+    def page_loaded(self, pid: int, page_number: int, entry) -> None:
+        key = (pid, page_number)
+        first = self._head.next
+        if first is self._head or first.frequency != 1:
+            first = self._insert_after(self._head, 1)
+        first.pages[key] = None
+        self._nodes[key] = first
+
+    def page_accessed(self, pid: int, page_number: int, entry) -> None:
+        key = (pid, page_number)
+        node = self._nodes.get(key)
+        if node is None:
+            return
+        target = node.next
+        if target is self._head or target.frequency != node.frequency + 1:
+            target = self._insert_after(node, node.frequency + 1)
+        del node.pages[key]
+        target.pages[key] = None
+        self._nodes[key] = target
+        self._unlink_if_empty(node)
+
+    def page_removed(self, pid: int, page_number: int) -> None:
+        key = (pid, page_number)
+        node = self._nodes.pop(key, None)
+        if node is not None:
+            del node.pages[key]
+            self._unlink_if_empty(node)
+
+    def select_victim(self) -> PageKey:
+        node = self._head.next
+        if node is self._head:
+            raise RuntimeError("No hay páginas válidas para reemplazar.")
+        key, _ = node.pages.popitem(last=False)
+        del self._nodes[key]
+        self._unlink_if_empty(node)
+        return key
+
+    def export_state(self) -> Dict[str, Any]:
+        keys: List[PageKey] = []
+        frequencies = array("q")
+        node = self._head.next
+        while node is not self._head:
+            keys.extend(node.pages)
+            frequencies.extend([node.frequency] * len(node.pages))
+            node = node.next
+        state: Dict[str, Any] = _pack_keys(keys)
+        state["frequencies"] = frequencies
+        return state
+
+    def restore_state(self, state: Dict[str, Any], entries: EntryLookup) -> None:
+        # Las claves llegan agrupadas por cubeta en orden de frecuencia
+        node = self._head
+        for (pid, page_number), frequency in zip(_unpack_keys(state), state["frequencies"]):
+            if node.frequency != frequency:
+                node = self._insert_after(self._head.prev, frequency)
+            key = (pid, page_number)
+            node.pages[key] = None
+            self._nodes[key] = node
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+
+class RandomReplacement(ReplacementAlgorithm):
+    """Expulsa una página residente elegida al azar."""
+
+    name = "Random"
+    uses_seed = True
+
+    def __init__(self, seed: Optional[int] = None) -> None:
+        self._keys: List[PageKey] = []
+        self._positions: Dict[PageKey, int] = {}
+        self._rng = random.Random(seed)
+
+    def page_loaded(self, pid: int, page_number: int, entry) -> None:
+        key = (pid, page_number)
+        self._positions[key] = len(self._keys)
+        self._keys.append(key)
+
+    def page_removed(self, pid: int, page_number: int) -> None:
+        pos = self._positions.pop((pid, page_number), None)
+        if pos is None:
+            return
+        last = self._keys.pop()
+        if pos < len(self._keys):
+            self._keys[pos] = last
+            self._positions[last] = pos
+
+    def select_victim(self) -> PageKey:
+        if not self._keys:
+            raise RuntimeError("No hay páginas válidas para reemplazar.")
+        key = self._keys[self._rng.randrange(len(self._keys))]
+        self.page_removed(*key)
+        return key
+
+    def export_state(self) -> Dict[str, Any]:
+        state: Dict[str, Any] = _pack_keys(self._keys)
+        state["rng"] = self._rng.getstate()
+        return state
+
+    def restore_state(self, state: Dict[str, Any], entries: EntryLookup) -> None:
+        super().restore_state(state, entries)
+        version, internal, gauss = state["rng"]
+        self._rng.setstate((version, tuple(internal), gauss))
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+REPLACEMENT_ALGORITHMS = {
+    "fifo": FIFOReplacement,
+    "lru": LRUReplacement,
+    "clock": ClockReplacement,
+    "second_chance": SecondChanceReplacement,
+    "lfu": LFUReplacement,
+    "random": RandomReplacement,
+}
+
+
+def create_replacement(name: str, seed: Optional[int] = None) -> ReplacementAlgorithm:
+    """Crea un algoritmo de reemplazo a partir de su nombre en config.ini.
+
+    ``seed`` solo se usa en los algoritmos aleatorios; con ``None`` la
+    secuencia de víctimas cambia en cada ejecución.
+    """
+    try:
+        cls = REPLACEMENT_ALGORITHMS[name.lower()]
+    except KeyError:
+        raise ValueError(f"Algoritmo de reemplazo desconocido: {name}") from None
+    return cls(seed) if cls.uses_seed else cls()
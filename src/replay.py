@@ -0,0 +1,158 @@
+"""
+Reproducción por lotes de trazas sobre el gestor de memoria.
+
+El bucle principal llama a la ruta rápida ``MemoryManager.access`` y no
+construye mensajes; el registro de eventos solo interviene si se exporta
+(``EXPORT`` en ``[Logging]``). Al terminar se informan las métricas
+agregadas y el rendimiento de la reproducción.
+
+Con el modo multi-CPU (``COUNT`` > 1 en ``[CPU]``), ``replay_concurrent``
+reproduce una traza por CPU, cada una en su propio hilo.
+"""
+
+import threading
+import time
+from contextlib import nullcontext
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from memory_manager import MemoryManager
+from trace_reader import OP_ACCESS, OP_CREATE, OP_TERMINATE, Event
+
+
+@dataclass
+class ReplayStats:
+    """Resumen de una reproducción."""
+
+    events: int = 0
+    accesses: int = 0
+    creates: int = 0
+    terminates: int = 0
+    invalid_events: int = 0
+    elapsed_s: float = 0.0
+
+    @property
+    def accesses_per_second(self) -> float:
+        return self.accesses / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"Eventos procesados: {self.events}\n"
+            f"Accesos: {self.accesses}\n"
+            f"Procesos creados: {self.creates}\n"
+            f"Procesos terminados: {self.terminates}\n"
+            f"Eventos inválidos: {self.invalid_events}\n"
+            f"Tiempo: {self.elapsed_s:.3f} s\n"
+            f"Accesos por segundo: {self.accesses_per_second:,.0f}"
+        )
+
+
+def replay(
+    manager: MemoryManager,
+    events: Iterable[Event],
+    pids: Optional[Dict[int, int]] = None,
+    lock: Optional[threading.Lock] = None,
+) -> ReplayStats:
+    """Aplica una secuencia de eventos al gestor y devuelve estadísticas.
+
+    ``pids`` traduce los PID de la traza a los PID reales de los procesos;
+    si se pasa (por ejemplo, al continuar desde una instantánea) se usa y
+    se actualiza en su lugar.
+    Un acceso a un PID desconocido se cuenta igualmente como acceso (el
+    gestor lo registra como proceso no encontrado). Una creación que no
+    cabe en RAM + Swap se descarta y se cuenta como evento inválido.
+    Si varios hilos comparten ``pids``, ``lock`` hace atómicas la
+    comprobación y la creación de cada proceso.
+    """
+    stats = ReplayStats()
+    if pids is None:
+        pids = {}
+    access = manager.access
+    get_pid = pids.get
+    accesses = creates = terminates = invalid = total = 0
+    start = time.perf_counter()
+    for op, trace_pid, arg in events:
+        total += 1
+        if op == OP_ACCESS:
+            access(get_pid(trace_pid, -1), arg)
+            accesses += 1
+        elif op == OP_CREATE:
+            with lock if lock is not None else nullcontext():
+                if trace_pid in pids or arg <= 0:
+                    invalid += 1
+                    continue
+                process = manager.new_process(arg)
+                try:
+                    manager.load_process(process)
+                except MemoryError:
+                    # Swap lleno: el proceso no cabe y se descarta
+                    manager.remove_process(process.pid)
+                    invalid += 1
+                    continue
+                pids[trace_pid] = process.pid
+            creates += 1
+        elif op == OP_TERMINATE:
+            pid = pids.pop(trace_pid, None)
+            if pid is None:
+                invalid += 1
+                continue
+            manager.remove_process(pid)
+            terminates += 1
+        else:
+            invalid += 1
+    stats.elapsed_s = time.perf_counter() - start
+    stats.events = total
+    stats.accesses = accesses
+    stats.creates = creates
+    stats.terminates = terminates
+    stats.invalid_events = invalid
+    return stats
+
+
+def replay_concurrent(
+    manager: MemoryManager, traces: Sequence[Iterable[Event]], pids: Optional[Dict[int, int]] = None
+) -> ReplayStats:
+    """Reproduce cada traza en un hilo ligado a su propia CPU (la traza
+    ``i`` en la CPU ``i``) y devuelve las estadísticas sumadas.
+
+    Los PID de las trazas son comunes: un proceso creado en la traza de una
+    CPU puede accederse desde las demás en cuanto existe, y si varias trazas
+    crean el mismo PID solo la primera lo crea (las demás cuentan un evento
+    inválido). El intercalado
+    entre hilos no es determinista. ``elapsed_s`` es el tiempo real total.
+    """
+    if len(traces) > len(manager.cpus):
+        raise ValueError(f"Hay {len(traces)} trazas y solo {len(manager.cpus)} CPU ([CPU] COUNT).")
+    if pids is None:
+        pids = {}
+    results: List[Optional[ReplayStats]] = [None] * len(traces)
+    errors: List[BaseException] = []
+    create_lock = threading.Lock()
+
+    def run(index: int, events: Iterable[Event]) -> None:
+        manager.bind_cpu(index)
+        try:
+            results[index] = replay(manager, events, pids, create_lock)
+        except BaseException as exc:
+            errors.append(exc)
+
+    threads = [
+        threading.Thread(target=run, args=(index, events), name=f"cpu{index}")
+        for index, events in enumerate(traces)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    if errors:
+        raise errors[0]
+    stats = ReplayStats(elapsed_s=elapsed)
+    for result in results:
+        stats.events += result.events
+        stats.accesses += result.accesses
+        stats.creates += result.creates
+        stats.terminates += result.terminates
+        stats.invalid_events += result.invalid_events
+    return stats
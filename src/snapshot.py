@@ -0,0 +1,368 @@
+"""
+Instantáneas binarias del estado completo del gestor de memoria.
+
+Permiten guardar un gestor ya calentado (tras reproducir una traza larga) y
+restaurarlo en milisegundos para lanzar desde él varias simulaciones
+alternativas. Se guardan los procesos y sus tablas de páginas, los marcos
+de RAM y Swap (que se reconstruyen a partir de las tablas), los
+asignadores, el estado interno del algoritmo de reemplazo, la TLB, la
+prelectura, el modelo de recorrido de la tabla de páginas y todas las
+métricas.
+
+Formato (versión ``SNAPSHOT_VERSION``)::
+
+    HEADER    "MSNP", versión (uint32) y longitud de los metadatos (uint64)
+    metadatos JSON en UTF-8, rellenos con espacios hasta múltiplo de 8
+    secciones: arrays de enteros (``array.array``) alineados a 8 bytes
+
+Los metadatos guardan la configuración, los valores escalares de cada
+componente y, por sección, su tipo, su desplazamiento desde el final de
+los metadatos y su número de elementos. Como las secciones están alineadas
+y en el orden de bytes de la máquina, ``load_snapshot(..., use_mmap=True)``
+las lee con ``mmap`` y ``memoryview.cast`` sin copiar el archivo.
+
+La instantánea puede restaurarse con otra configuración siempre que la
+geometría de la memoria coincida (marcos, tamaño de página, asignador,
+paginación, estructura de la tabla y páginas enormes). Si cambia el
+algoritmo de reemplazo, las páginas residentes se registran en el nuevo
+en orden de marco (como ``set_replacement``); si cambian la TLB o la
+prelectura, empiezan vacías. No se admiten el motor ``arrays``, la Swap
+respaldada por archivo ni el control de carga.
+"""
+
+import json
+import mmap
+import struct
+import sys
+from array import array
+from dataclasses import asdict, fields
+from typing import Any, Dict, List, Optional, Tuple
+
+from config import Config, ConfigValues
+from memory_manager import MemoryManager, create_memory_manager
+from process import PageTableEntry, Process, ProcessState
+
+SNAPSHOT_MAGIC = b"MSNP"
+SNAPSHOT_VERSION = 1
+# Firma, versión y longitud de los metadatos JSON
+HEADER = struct.Struct("<4sIQ")
+ALIGNMENT = 8
+
+# Contadores del gestor que se guardan tal cual
+MANAGER_COUNTERS = (
+    "total_accesses",
+    "page_faults",
+    "swaps_in",
+    "swaps_out",
+    "tlb_hits",
+    "tlb_misses",
+    "minor_faults",
+    "huge_pages_mapped",
+    "huge_allocations",
+    "promotions",
+    "demotions",
+    "huge_fallbacks",
+    "promotion_swaps_in",
+    "migrated_pages",
+    "prefetched_pages",
+    "prefetch_hits",
+    "useless_prefetches",
+)
+
+# Bits de ``flags`` por entrada de la tabla de páginas
+FLAG_PRESENT = 1
+FLAG_REFERENCED = 2
+
+
+def _check_supported(config: Config) -> None:
+    values = config.values
+    if values.engine != "objects":
+        raise ValueError("Las instantáneas solo admiten ENGINE = objects.")
+    if values.swap_backend != "memory":
+        raise ValueError("Las instantáneas solo admiten BACKEND = memory en [Swap].")
+    if values.load_control != "none":
+        raise ValueError("Las instantáneas no admiten control de carga (POLICY = none en [LoadControl]).")
+    if values.cpus > 1:
+        raise ValueError("Las instantáneas no admiten varias CPU (COUNT = 1 en [CPU]).")
+
+
+def _geometry(config: Config) -> Dict[str, Any]:
+    """Parámetros que deben coincidir para restaurar una instantánea."""
+    values = config.values
+    return {
+        "ram_frames": config.ram_frames,
+        "swap_frames": config.swap_frames,
+        "page_size_kb": values.page_size_kb,
+        "frame_allocator": values.frame_allocator,
+        "paging": values.paging,
+        "page_table": values.page_table,
+        "page_table_levels": values.page_table_levels if values.page_table == "radix" else 1,
+        "huge_page_size_kb": values.huge_page_size_kb if values.huge_pages != "none" else 0,
+    }
+
+
+def _export_manager(manager: MemoryManager) -> Dict[str, Any]:
+    """Procesos, tablas de páginas, páginas precargadas y contadores.
+
+    Las entradas de todos los procesos se concatenan; ``entries`` indica
+    cuántas son de cada proceso (solo se guardan las que existen, así que
+    las tablas dispersas ocupan lo que ocupan en memoria).
+    """
+    pids, sizes, states, huge_flags = array("q"), array("q"), array("q"), array("B")
+    entry_counts, region_counts, regions = array("q"), array("q"), array("q")
+    pages, frames, swaps, flags = array("q"), array("q"), array("q"), array("B")
+    for process in manager.processes.values():
+        table = process.page_table
+        items = enumerate(table) if isinstance(table, list) else table.items()
+        count = 0
+        for page_number, entry in items:
+            pages.append(page_number)
+            frames.append(-1 if entry.frame_index is None else entry.frame_index)
+            swaps.append(-1 if entry.swap_index is None else entry.swap_index)
+            flags.append((FLAG_PRESENT if entry.present else 0) | (FLAG_REFERENCED if entry.referenced else 0))
+            count += 1
+        pids.append(process.pid)
+        sizes.append(process.size_kb)
+        states.append(process.state.value)
+        huge_flags.append(process.huge_pages)
+        entry_counts.append(count)
+        region_counts.append(len(process.huge_regions))
+        regions.extend(sorted(process.huge_regions))
+    prefetched = sorted(manager._prefetched)
+    state: Dict[str, Any] = {name: getattr(manager, name) for name in MANAGER_COUNTERS}
+    state.update(
+        next_pid=Process._next_pid,
+        pids=pids,
+        sizes=sizes,
+        states=states,
+        huge_flags=huge_flags,
+        entries=entry_counts,
+        region_counts=region_counts,
+        regions=regions,
+        pages=pages,
+        frames=frames,
+        swaps=swaps,
+        flags=flags,
+        pending_prefetch_pids=array("q", (pid for pid, _ in prefetched)),
+        pending_prefetch_pages=array("q", (page for _, page in prefetched)),
+    )
+    return state
+
+
+def _restore_manager(manager: MemoryManager, state: Dict[str, Any]) -> None:
+    """Reconstruye procesos, tablas y marcos en un gestor recién creado."""
+    ram = manager.ram
+    swap = manager.swap
+    pages, frames, swaps, flags = state["pages"], state["frames"], state["swaps"], state["flags"]
+    regions = state["regions"]
+    position = region_position = 0
+    rows = zip(
+        state["pids"], state["sizes"], state["states"], state["huge_flags"], state["entries"], state["region_counts"]
+    )
+    page_size_kb = manager.config.values.page_size_kb
+    for pid, size_kb, process_state, huge, count, region_count in rows:
+        # La tabla densa no se construye: se rellena con las entradas guardadas
+        process = Process(
+            size_kb,
+            page_size_kb,
+            build_page_table=False,
+            lazy_page_table=manager.demand_paging,
+            page_table_levels=manager.page_table_levels,
+        )
+        process.pid = pid
+        process.state = ProcessState(process_state)
+        process.huge_pages = bool(huge)
+        table = process.page_table
+        # Las entradas de una tabla densa se guardaron en orden de página
+        dense = isinstance(table, list)
+        resident = process.resident
+        swapped = process.swapped
+        end = position + count
+        for page_number, frame_index, swap_index, flag in zip(
+            pages[position:end], frames[position:end], swaps[position:end], flags[position:end]
+        ):
+            entry = PageTableEntry(
+                bool(flag & FLAG_PRESENT),
+                frame_index if frame_index >= 0 else None,
+                swap_index if swap_index >= 0 else None,
+                bool(flag & FLAG_REFERENCED),
+            )
+            if dense:
+                table.append(entry)
+            else:
+                table[page_number] = entry
+            if frame_index >= 0:
+                frame = ram[frame_index]
+                frame.process_id = pid
+                frame.page_number = page_number
+                resident.add(page_number)
+            if swap_index >= 0:
+                frame = swap[swap_index]
+                frame.process_id = pid
+                frame.page_number = page_number
+                swapped.add(page_number)
+        position = end
+        process.resident_pages = len(resident)
+        process.swapped_pages = len(swapped)
+        process.huge_regions.update(regions[region_position:region_position + region_count])
+        region_position += region_count
+        manager.processes[pid] = process
+    Process._next_pid = state["next_pid"]
+    manager._prefetched = set(zip(state["pending_prefetch_pids"], state["pending_prefetch_pages"]))
+    for name in MANAGER_COUNTERS:
+        setattr(manager, name, state[name])
+
+
+def save_snapshot(manager: MemoryManager, path: str, metadata: Optional[Dict[str, Any]] = None) -> int:
+    """Guarda el estado del gestor en ``path`` y devuelve los bytes escritos.
+
+    ``metadata`` (serializable en JSON) se guarda junto al estado; la
+    reproducción lo usa para recordar la traducción de PID de la traza.
+    """
+    config = manager.config
+    _check_supported(config)
+    components = {
+        "manager": _export_manager(manager),
+        "ram_allocator": manager.ram_allocator.export_state(),
+        "swap_allocator": manager.swap_allocator.export_state(),
+        "replacement": manager.replacement.export_state(),
+        "tlb": manager.tlb.export_state(),
+        "prefetcher": manager.prefetcher.export_state(),
+    }
+    if manager.page_walker is not None:
+        components["page_walker"] = manager.page_walker.export_state()
+    # Los arrays van a secciones binarias y el resto a los metadatos
+    scalars: Dict[str, Dict[str, Any]] = {}
+    sections: List[Tuple[str, array]] = []
+    for component, state in components.items():
+        scalars[component] = {}
+        for key, value in state.items():
+            if isinstance(value, array):
+                sections.append((f"{component}.{key}", value))
+            else:
+                scalars[component][key] = value
+    tlb = manager.tlb
+    meta: Dict[str, Any] = {
+        "byteorder": sys.byteorder,
+        "geometry": _geometry(config),
+        "config": asdict(config.values),
+        "replacement": manager.replacement.name,
+        "tlb": [tlb.capacity, tlb.policy, tlb.ways],
+        "prefetcher": [manager.prefetcher.name, manager.prefetcher.depth],
+        "state": scalars,
+        "sections": {},
+        "metadata": metadata or {},
+    }
+    offset = 0
+    for name, values in sections:
+        meta["sections"][name] = [values.typecode, offset, len(values)]
+        size = len(values) * values.itemsize
+        offset += size + -size % ALIGNMENT
+    blob = json.dumps(meta).encode("utf-8")
+    blob += b" " * (-len(blob) % ALIGNMENT)
+    with open(path, "wb") as fh:
+        fh.write(HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(blob)))
+        fh.write(blob)
+        for _, values in sections:
+            data = values.tobytes()
+            fh.write(data)
+            fh.write(b"\0" * (-len(data) % ALIGNMENT))
+    return HEADER.size + len(blob) + offset
+
+
+def _section(buffer: memoryview, start: int, typecode: str, count: int, swap_bytes: bool):
+    """Vista (o copia, si hay que invertir el orden de bytes) de una sección."""
+    itemsize = array(typecode).itemsize
+    view = buffer[start:start + count * itemsize]
+    if len(view) != count * itemsize:
+        raise ValueError("Instantánea truncada.")
+    if not swap_bytes or itemsize == 1:
+        return view.cast(typecode)
+    values = array(typecode)
+    values.frombytes(view)
+    values.byteswap()
+    view.release()
+    return values
+
+
+def load_snapshot(
+    path: str, config: Optional[Config] = None, use_mmap: bool = False
+) -> Tuple[MemoryManager, Dict[str, Any]]:
+    """Restaura un gestor desde ``path`` y devuelve ``(gestor, metadata)``.
+
+    Sin ``config`` se usa la configuración guardada; con ella, el gestor se
+    crea con esa configuración y se comprueba que la geometría coincide.
+    Con ``use_mmap`` las secciones se leen proyectando el archivo en
+    memoria en lugar de copiarlo.
+    """
+    with open(path, "rb") as fh:
+        header = fh.read(HEADER.size)
+        if len(header) != HEADER.size or header[:4] != SNAPSHOT_MAGIC:
+            raise ValueError(f"{path} no es una instantánea del simulador.")
+        _, version, meta_length = HEADER.unpack(header)
+        if version != SNAPSHOT_VERSION:
+            raise ValueError(f"Versión de instantánea no soportada: {version} (se admite la {SNAPSHOT_VERSION}).")
+        meta = json.loads(fh.read(meta_length))
+        base = HEADER.size + meta_length
+        mapped = None
+        if use_mmap:
+            mapped = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+            buffer = memoryview(mapped)
+        else:
+            fh.seek(0)
+            buffer = memoryview(fh.read())
+    sections: Dict[str, Any] = {}
+    try:
+        swap_bytes = meta["byteorder"] != sys.byteorder
+        for name, (typecode, offset, count) in meta["sections"].items():
+            sections[name] = _section(buffer, base + offset, typecode, count, swap_bytes)
+        manager = _restore(meta, sections, config)
+    finally:
+        # Las vistas deben liberarse antes de cerrar la proyección
+        for values in sections.values():
+            if isinstance(values, memoryview):
+                values.release()
+        buffer.release()
+        if mapped is not None:
+            mapped.close()
+    return manager, meta["metadata"]
+
+
+def _restore(meta: Dict[str, Any], sections: Dict[str, Any], config: Optional[Config]) -> MemoryManager:
+    state: Dict[str, Dict[str, Any]] = {component: dict(scalars) for component, scalars in meta["state"].items()}
+    for name, values in sections.items():
+        component, key = name.split(".", 1)
+        state[component][key] = values
+    if config is None:
+        # Configuración guardada; los parámetros que no existían al crear la
+        # instantánea toman su valor por defecto
+        config = Config("")
+        known = {f.name for f in fields(ConfigValues)}
+        config.values = ConfigValues(**{name: value for name, value in meta["config"].items() if name in known})
+    _check_supported(config)
+    geometry = _geometry(config)
+    for key, saved in meta["geometry"].items():
+        if geometry.get(key) != saved:
+            raise ValueError(
+                f"La instantánea no es compatible con la configuración: {key} = {saved} "
+                f"(configuración actual: {geometry.get(key)})."
+            )
+    manager = create_memory_manager(config)
+    _restore_manager(manager, state["manager"])
+    manager.ram_allocator.restore_state(state["ram_allocator"])
+    manager.swap_allocator.restore_state(state["swap_allocator"])
+    if meta["replacement"] == manager.replacement.name:
+        processes = manager.processes
+        manager.replacement.restore_state(
+            state["replacement"], lambda pid, page_number: processes[pid].page_table[page_number]
+        )
+    else:
+        manager.set_replacement(manager.replacement)
+    tlb = manager.tlb
+    if meta["tlb"] == [tlb.capacity, tlb.policy, tlb.ways]:
+        tlb.restore_state(state["tlb"])
+    if meta["prefetcher"] == [manager.prefetcher.name, manager.prefetcher.depth]:
+        manager.prefetcher.restore_state(state["prefetcher"])
+    if manager.page_walker is not None and "page_walker" in state:
+        manager.page_walker.restore_state(state["page_walker"])
+    return manager
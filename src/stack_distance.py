@@ -0,0 +1,227 @@
+"""
+Análisis de capacidad en una sola pasada mediante distancias de pila LRU
+(algoritmo de Mattson).
+
+Para LRU, una referencia a una página acierta en una memoria de ``C``
+marcos si y solo si su distancia de pila (número de páginas distintas
+referenciadas desde su último uso, contándose a sí misma) es como mucho
+``C``. Basta, por tanto, un histograma de distancias para obtener la tasa
+de fallos de todos los tamaños de RAM a la vez, y el mismo histograma da la
+tasa de aciertos de una TLB LRU totalmente asociativa para todos los
+tamaños de TLB.
+
+La distancia se calcula con un árbol de Fenwick indexado por tiempo lógico
+en el que solo está marcada la última referencia de cada página, de modo
+que cada acceso cuesta O(log n). Las marcas se renumeran periódicamente
+para que la memoria sea proporcional a las páginas distintas y no a la
+longitud de la traza.
+
+El modelo reproduce la semántica del simulador: al crear un proceso sus
+páginas (``Config.page_size_kb`` determina cuántas) se cargan en orden y
+cuentan como referencias sin ser accesos. Al terminar, cada página deja en
+la pila un hueco que representa el marco liberado: el siguiente fallo
+ocupa el hueco más cercano a la cima en lugar de expulsar una página, igual
+que el simulador usa primero los marcos libres. La curva de RAM coincide
+con la de ``MemoryManager`` usando LRU mientras la Swap no se llene; la de
+TLB supone que las traducciones no se invalidan por expulsiones de páginas
+(RAM suficiente).
+"""
+
+import csv
+import heapq
+from dataclasses import asdict, dataclass, fields
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from trace_reader import OP_ACCESS, OP_CREATE, OP_TERMINATE, Event
+
+PageKey = Tuple[int, int]
+
+MIN_TREE_SIZE = 1024
+
+
+@dataclass
+class CurvePoint:
+    """Un punto de las curvas de capacidad."""
+
+    frames: int
+    ram_size_kb: int
+    page_faults: int
+    page_fault_rate: float
+    tlb_hit_ratio: float
+
+
+class StackDistanceAnalyzer:
+    """Acumula el histograma de distancias de pila LRU de una traza."""
+
+    def __init__(self, page_size_kb: int, demand_paging: bool = False) -> None:
+        self.page_size_kb = page_size_kb
+        # Con paginación bajo demanda la creación no referencia páginas y el
+        # primer acceso a cada una es un fallo menor (cold_misses)
+        self.demand_paging = demand_paging
+        # Histograma: histogram[d] = referencias con distancia d (d >= 1)
+        self.histogram: List[int] = [0]
+        self.accesses = 0
+        self.valid_accesses = 0
+        self.cold_misses = 0
+        self.invalid_events = 0
+        self._pages: Dict[int, int] = {}
+        self._positions: Dict[PageKey, int] = {}
+        # Huecos de páginas retiradas: montículo de posiciones negadas para
+        # obtener primero el hueco más cercano a la cima
+        self._holes: List[int] = []
+        self._time = 0
+        self._tree: List[int] = [0] * (MIN_TREE_SIZE + 1)
+
+    # Árbol de Fenwick (índices 1..len-1)
+    def _add(self, index: int, delta: int) -> None:
+        tree = self._tree
+        size = len(tree)
+        while index < size:
+            tree[index] += delta
+            index += index & -index
+
+    def _prefix(self, index: int) -> int:
+        tree = self._tree
+        total = 0
+        while index > 0:
+            total += tree[index]
+            index -= index & -index
+        return total
+
+    def _compact(self) -> None:
+        """Renumera las marcas vivas (páginas y huecos) como 1..n y
+        reconstruye el árbol."""
+        marks = [(pos, key) for key, pos in self._positions.items()]
+        marks.extend((-neg_pos, None) for neg_pos in self._holes)
+        marks.sort(key=lambda item: item[0])
+        size = max(MIN_TREE_SIZE, 2 * len(marks))
+        tree = [0] * (size + 1)
+        holes: List[int] = []
+        for new_pos, (_, key) in enumerate(marks, start=1):
+            if key is None:
+                holes.append(-new_pos)
+            else:
+                self._positions[key] = new_pos
+            tree[new_pos] = 1
+        # Construcción lineal del árbol de Fenwick
+        for index in range(1, size + 1):
+            parent = index + (index & -index)
+            if parent <= size:
+                tree[parent] += tree[index]
+        heapq.heapify(holes)
+        self._tree = tree
+        self._holes = holes
+        self._time = len(marks)
+
+    def reference(self, key: PageKey) -> Optional[int]:
+        """Registra una referencia y devuelve su distancia (None si es la
+        primera). Los huecos cuentan para la distancia porque ocupan un marco
+        en la pila."""
+        if self._time + 1 >= len(self._tree):
+            self._compact()
+        positions = self._positions
+        holes = self._holes
+        last = positions.get(key)
+        distance = None
+        if last is not None:
+            distance = len(positions) + len(holes) - self._prefix(last) + 1
+            if holes and -holes[0] > last:
+                # Las memorias que fallan ocupan el hueco; en las que aciertan
+                # el hueco pasa a la posición que deja la página.
+                self._add(-heapq.heapreplace(holes, -last), -1)
+            else:
+                self._add(last, -1)
+        elif holes:
+            self._add(-heapq.heappop(holes), -1)
+        self._time += 1
+        positions[key] = self._time
+        self._add(self._time, 1)
+        return distance
+
+    def remove(self, key: PageKey) -> None:
+        """Retira una página dejando un hueco en su posición de la pila."""
+        last = self._positions.pop(key, None)
+        if last is not None:
+            heapq.heappush(self._holes, -last)
+
+    def _record(self, distance: Optional[int]) -> None:
+        if distance is None:
+            self.cold_misses += 1
+            return
+        histogram = self.histogram
+        if distance >= len(histogram):
+            histogram.extend([0] * (distance + 1 - len(histogram)))
+        histogram[distance] += 1
+
+    def process(self, events: Iterable[Event]) -> None:
+        """Consume una traza de eventos ``(op, pid, arg)``."""
+        pages = self._pages
+        reference = self.reference
+        for op, pid, arg in events:
+            if op == OP_ACCESS:
+                self.accesses += 1
+                count = pages.get(pid)
+                if count is None or not (0 <= arg < count):
+                    continue
+                self.valid_accesses += 1
+                self._record(reference((pid, arg)))
+            elif op == OP_CREATE:
+                if pid in pages or arg <= 0:
+                    self.invalid_events += 1
+                    continue
+                count = (arg + self.page_size_kb - 1) // self.page_size_kb
+                pages[pid] = count
+                if self.demand_paging:
+                    continue
+                for page_number in range(count):
+                    reference((pid, page_number))
+            elif op == OP_TERMINATE:
+                count = pages.pop(pid, None)
+                if count is None:
+                    self.invalid_events += 1
+                    continue
+                for page_number in range(count):
+                    self.remove((pid, page_number))
+            else:
+                self.invalid_events += 1
+
+    @property
+    def max_distance(self) -> int:
+        return len(self.histogram) - 1
+
+    def curve(self, sizes: Optional[Sequence[int]] = None) -> Iterator[CurvePoint]:
+        """Genera la curva para los tamaños dados (en marcos) o, por defecto,
+        para todos los tamaños de 1 a la distancia máxima observada."""
+        histogram = self.histogram
+        if sizes is None:
+            sizes = range(1, max(1, self.max_distance) + 1)
+        # hits[c] = referencias con distancia <= c
+        hits = [0] * len(histogram)
+        running = 0
+        for distance in range(1, len(histogram)):
+            running += histogram[distance]
+            hits[distance] = running
+        total_hits = running
+        for frames in sizes:
+            hit = hits[min(frames, len(hits) - 1)] if frames > 0 else 0
+            # Las primeras referencias son fallos menores, no swaps de entrada
+            faults = total_hits - hit
+            yield CurvePoint(
+                frames=frames,
+                ram_size_kb=frames * self.page_size_kb,
+                page_faults=faults,
+                page_fault_rate=faults / self.accesses * 100 if self.accesses else 0.0,
+                tlb_hit_ratio=hit / self.valid_accesses * 100 if self.valid_accesses else 0.0,
+            )
+
+
+def write_curve(points: Iterable[CurvePoint], path: str) -> int:
+    """Escribe la curva en CSV y devuelve el número de filas."""
+    count = 0
+    with open(path, "w", encoding="utf-8", newline="") as fh:
+        writer = csv.DictWriter(fh, fieldnames=[field.name for field in fields(CurvePoint)])
+        writer.writeheader()
+        for point in points:
+            writer.writerow(asdict(point))
+            count += 1
+    return count
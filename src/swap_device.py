@@ -0,0 +1,187 @@
+"""
+Dispositivo de Swap respaldado por un archivo proyectado en memoria.
+
+Por defecto la Swap solo guarda metadatos (qué página ocupa cada ranura) y
+el contenido de las páginas no existe. Con ``BACKEND = mmap`` en la sección
+``[Swap]`` de config.ini el gestor mantiene el contenido de cada marco de
+RAM y lo mueve a un archivo de ``SWAP_SIZE_KB`` bytes, de modo que se puede
+medir el coste de E/S del intercambio.
+
+Las escrituras (swap-out) no bloquean: se acumulan en una cola y se envían
+en lotes de ``WRITEBACK_BATCH`` páginas (como mucho la mitad de las
+ranuras) a un hilo de E/S, por lo que la expulsión se solapa con los accesos
+siguientes. Un único hilo escribe los
+lotes en orden, así que una ranura reutilizada nunca recibe datos antiguos.
+Las lecturas (swap-in) se sirven desde la cola si la página aún no se ha
+escrito; si sigue en la cola sin enviar, la escritura se cancela. Todas cuentan como
+lecturas del dispositivo; las servidas desde la cola se cuentan además
+aparte.
+"""
+
+import mmap
+import tempfile
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import IO, Any, Dict, List, Optional
+
+from config import Config
+from histogram import LatencyHistogram
+
+
+class MmapSwapDevice:
+    """Ranuras de Swap de tamaño de página sobre un archivo ``mmap``."""
+
+    def __init__(self, path: Optional[str], slots: int, page_size: int, writeback_batch: int = 32) -> None:
+        self.path = path or None
+        self.slots = slots
+        self.page_size = page_size
+        # La cola nunca tiene más páginas que ranuras ocupadas: con un lote
+        # mayor que la mitad de la Swap casi nunca se llenaría y las
+        # escrituras solo se harían al cerrar
+        self.writeback_batch = max(1, min(writeback_batch, slots // 2))
+        size = max(1, slots * page_size)
+        # Sin ruta se usa un archivo temporal que desaparece al cerrarlo
+        self._file: IO[bytes] = open(path, "w+b") if path else tempfile.TemporaryFile()
+        self._file.truncate(size)
+        self._mm = mmap.mmap(self._file.fileno(), size)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="swap-io")
+        self._lock = threading.Lock()
+        # Escrituras aún no enviadas (solo las toca el hilo del gestor)
+        self._queued: Dict[int, bytes] = {}
+        # Escrituras enviadas al hilo de E/S y todavía no completadas
+        self._in_flight: Dict[int, bytes] = {}
+        self._futures: List[Future] = []
+        self._closed = False
+
+        # Métricas
+        self.bytes_written = 0
+        self.bytes_read = 0
+        self.pages_written = 0
+        self.pages_read = 0
+        self.batches = 0
+        self.pending_reads = 0
+        self.cancelled_writes = 0
+        self.write_latency = LatencyHistogram()
+        self.read_latency = LatencyHistogram()
+
+    def write(self, slot: int, data: bytes) -> None:
+        """Encola el contenido de una página para la ranura ``slot``."""
+        self._queued[slot] = data
+        if len(self._queued) >= self.writeback_batch:
+            self._submit()
+
+    def read(self, slot: int) -> bytes:
+        """Devuelve el contenido de la ranura, esperando solo si hay que ir
+        al archivo."""
+        data = self._queued.pop(slot, None)
+        if data is not None:
+            self.cancelled_writes += 1
+            self.pending_reads += 1
+        else:
+            with self._lock:
+                data = self._in_flight.get(slot)
+            if data is not None:
+                self.pending_reads += 1
+            else:
+                start = time.perf_counter()
+                offset = slot * self.page_size
+                data = self._mm[offset:offset + self.page_size]
+                self.read_latency.record(time.perf_counter() - start)
+        self.pages_read += 1
+        self.bytes_read += len(data)
+        return data
+
+    def discard(self, slot: int) -> None:
+        """Olvida la ranura liberada: si su escritura no se ha enviado, se cancela."""
+        if self._queued.pop(slot, None) is not None:
+            self.cancelled_writes += 1
+
+    def _submit(self) -> None:
+        batch, self._queued = self._queued, {}
+        with self._lock:
+            self._in_flight.update(batch)
+        self._futures = [future for future in self._futures if not future.done()]
+        self._futures.append(self._executor.submit(self._write_batch, batch))
+
+    def _write_batch(self, batch: Dict[int, bytes]) -> None:
+        """Escribe un lote en el archivo (se ejecuta en el hilo de E/S)."""
+        start = time.perf_counter()
+        mm = self._mm
+        page_size = self.page_size
+        written = 0
+        for slot in sorted(batch):
+            data = batch[slot]
+            offset = slot * page_size
+            mm[offset:offset + len(data)] = data
+            written += len(data)
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            for slot, data in batch.items():
+                # La ranura pudo reescribirse en un lote posterior
+                if self._in_flight.get(slot) is data:
+                    del self._in_flight[slot]
+            self.write_latency.record(elapsed)
+            self.batches += 1
+            self.pages_written += len(batch)
+            self.bytes_written += written
+
+    @property
+    def pending_writes(self) -> int:
+        with self._lock:
+            return len(self._queued) + len(self._in_flight)
+
+    def flush(self) -> None:
+        """Envía la cola y espera a que todas las escrituras terminen."""
+        if self._queued:
+            self._submit()
+        for future in self._futures:
+            future.result()
+        self._futures = []
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self.flush()
+        self._executor.shutdown(wait=True)
+        self._mm.close()
+        self._file.close()
+        self._closed = True
+
+    def metrics_dict(self) -> Dict[str, Any]:
+        return {
+            "swap_bytes_written": self.bytes_written,
+            "swap_bytes_read": self.bytes_read,
+            "swap_pages_written": self.pages_written,
+            "swap_pages_read": self.pages_read,
+            "swap_write_batches": self.batches,
+            "swap_pending_reads": self.pending_reads,
+            "swap_cancelled_writes": self.cancelled_writes,
+            "swap_pending_writes": self.pending_writes,
+            "swap_write_latency": self.write_latency.to_dict(),
+            "swap_read_latency": self.read_latency.to_dict(),
+        }
+
+    def summary(self) -> str:
+        return (
+            f"Swap escrito: {self.bytes_written} bytes ({self.pages_written} páginas, {self.batches} lotes)\n"
+            f"Swap leído: {self.bytes_read} bytes ({self.pages_read} páginas)\n"
+            f"Lecturas servidas desde la cola (incluidas en las anteriores): {self.pending_reads}\n"
+            f"Escrituras canceladas: {self.cancelled_writes}\n"
+            f"Latencia de escritura por lote: {self.write_latency.summary()}\n"
+            f"Latencia de lectura: {self.read_latency.summary()}\n"
+        )
+
+
+def create_swap_device(config: Config) -> Optional[MmapSwapDevice]:
+    """Crea el dispositivo indicado por ``BACKEND`` en ``[Swap]``, o None si
+    la Swap solo guarda metadatos."""
+    values = config.values
+    if values.swap_backend != "mmap":
+        return None
+    return MmapSwapDevice(
+        values.swap_file,
+        config.swap_frames,
+        values.page_size_kb * 1024,
+        values.swap_writeback_batch,
+    )
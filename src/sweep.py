@@ -0,0 +1,130 @@
+"""
+Barrido de parámetros en paralelo sobre un conjunto de procesos.
+
+Recibe una rejilla de configuraciones (un JSON que asocia cada parámetro de
+``ConfigValues`` a una lista de valores) y una traza. Cada combinación se
+simula de forma independiente en un ``ProcessPoolExecutor`` que usa todos
+los núcleos. La traza se convierte una sola vez al formato binario y cada
+trabajador la proyecta con ``mmap``, de modo que todos comparten las mismas
+páginas de la caché del sistema operativo sin copiarla ni volver a
+interpretarla. Los resultados se escriben en CSV o JSON según la extensión
+del archivo de salida.
+
+Ejemplo de rejilla::
+
+    {
+        "ram_size_kb": [1024, 2048, 4096],
+        "tlb_size": [4, 16],
+        "replacement_algorithm": ["fifo", "lru", "clock"]
+    }
+"""
+
+import csv
+import itertools
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence
+
+from config import Config
+from memory_manager import create_memory_manager
+from replay import replay
+from trace_reader import BINARY_MAGIC, convert_text_to_binary, read_binary_trace
+
+RESULT_FIELDS = (
+    "accesses",
+    "page_faults",
+    "page_fault_rate",
+    "swaps_in",
+    "swaps_out",
+    "tlb_hit_ratio",
+    "invalid_events",
+    "wall_time_s",
+)
+
+
+def expand_grid(grid: Mapping[str, Sequence[Any]]) -> Iterator[Dict[str, Any]]:
+    """Genera todas las combinaciones de la rejilla como diccionarios."""
+    names = list(grid)
+    for values in itertools.product(*(grid[name] for name in names)):
+        yield dict(zip(names, values))
+
+
+def load_grid(path: str) -> Dict[str, List[Any]]:
+    """Lee una rejilla JSON; un valor escalar equivale a una lista de uno."""
+    with open(path, "r", encoding="utf-8") as fh:
+        grid = json.load(fh)
+    if not isinstance(grid, dict):
+        raise ValueError("La rejilla debe ser un objeto JSON.")
+    return {name: values if isinstance(values, list) else [values] for name, values in grid.items()}
+
+
+def run_point(config_path: str, overrides: Dict[str, Any], trace_path: str) -> Dict[str, Any]:
+    """Simula una combinación de parámetros (se ejecuta en un trabajador)."""
+    config = Config(config_path, overrides)
+    manager = create_memory_manager(config)
+    start = time.perf_counter()
+    stats = replay(manager, read_binary_trace(trace_path))
+    elapsed = time.perf_counter() - start
+    manager.close()
+    metrics = manager.get_metrics_dict()
+    row = dict(overrides)
+    row.update(
+        accesses=stats.accesses,
+        page_faults=metrics["page_faults"],
+        page_fault_rate=metrics["page_fault_rate"],
+        swaps_in=metrics["swaps_in"],
+        swaps_out=metrics["swaps_out"],
+        tlb_hit_ratio=metrics["tlb_hit_ratio"],
+        invalid_events=stats.invalid_events,
+        wall_time_s=elapsed,
+    )
+    return row
+
+
+def _is_binary(path: str) -> bool:
+    with open(path, "rb") as fh:
+        return fh.read(len(BINARY_MAGIC)) == BINARY_MAGIC
+
+
+def sweep(
+    config_path: str,
+    grid: Mapping[str, Sequence[Any]],
+    trace_path: str,
+    workers: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """Ejecuta todas las combinaciones y devuelve una fila por combinación,
+    en el orden de la rejilla."""
+    points = list(expand_grid(grid))
+    # Validar todas las combinaciones antes de lanzar trabajo
+    for overrides in points:
+        Config(config_path, overrides)
+
+    with tempfile.TemporaryDirectory(prefix="sweep-") as tmp:
+        if not _is_binary(trace_path):
+            binary_path = os.path.join(tmp, "trace.bin")
+            convert_text_to_binary(trace_path, binary_path)
+            trace_path = binary_path
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+            futures = [pool.submit(run_point, config_path, overrides, trace_path) for overrides in points]
+            return [future.result() for future in futures]
+
+
+def write_results(rows: List[Dict[str, Any]], path: str) -> None:
+    """Escribe los resultados en JSON si la extensión es .json, o en CSV."""
+    if path.lower().endswith(".json"):
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump(rows, fh, indent=2)
+        return
+    columns: List[str] = []
+    for row in rows:
+        for name in row:
+            if name not in columns and name not in RESULT_FIELDS:
+                columns.append(name)
+    columns.extend(RESULT_FIELDS)
+    with open(path, "w", encoding="utf-8", newline="") as fh:
+        writer = csv.DictWriter(fh, fieldnames=columns)
+        writer.writeheader()
+        writer.writerows(rows)
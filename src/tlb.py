@@ -0,0 +1,229 @@
+"""
+TLB (Translation Lookaside Buffer) de capacidad fija para el simulador.
+
+Cada entrada traduce ``(pid, página)`` a un índice de marco de RAM. La TLB
+puede ser totalmente asociativa (un único conjunto) o asociativa por
+conjuntos de N vías; el conjunto se elige con el número de página virtual,
+como en el hardware. Dentro de cada conjunto la política de reemplazo puede
+ser LRU, FIFO o aleatoria. Todas las operaciones son O(1) y el vaciado por
+PID solo toca las entradas de ese proceso.
+"""
+
+import random
+from array import array
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+TLBKey = Tuple[int, int]
+
+
+class _OrderedSet:
+    """Conjunto de la TLB respaldado por un OrderedDict (LRU o FIFO)."""
+
+    __slots__ = ("capacity", "entries", "promote")
+
+    def __init__(self, capacity: int, promote: bool) -> None:
+        self.capacity = capacity
+        self.entries: "OrderedDict[TLBKey, int]" = OrderedDict()
+        # En LRU un acierto mueve la entrada al final; en FIFO no
+        self.promote = promote
+
+    def lookup(self, key: TLBKey) -> Optional[int]:
+        frame = self.entries.get(key)
+        if frame is not None and self.promote:
+            self.entries.move_to_end(key)
+        return frame
+
+    def insert(self, key: TLBKey, frame: int) -> Optional[TLBKey]:
+        """Inserta la entrada y devuelve la clave expulsada, si la hay."""
+        entries = self.entries
+        if key in entries:
+            del entries[key]
+            entries[key] = frame
+            return None
+        evicted = None
+        if len(entries) >= self.capacity:
+            evicted, _ = entries.popitem(last=False)
+        entries[key] = frame
+        return evicted
+
+    def remove(self, key: TLBKey) -> bool:
+        return self.entries.pop(key, None) is not None
+
+    def items(self):
+        return self.entries.items()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+class _RandomSet:
+    """Conjunto de la TLB con expulsión aleatoria en O(1)."""
+
+    __slots__ = ("capacity", "frames", "keys", "positions", "rng")
+
+    def __init__(self, capacity: int, rng: random.Random) -> None:
+        self.capacity = capacity
+        self.frames: Dict[TLBKey, int] = {}
+        # Lista densa de claves para elegir víctima al azar; positions guarda
+        # el índice de cada clave para poder borrarla intercambiándola con
+        # la última.
+        self.keys: List[TLBKey] = []
+        self.positions: Dict[TLBKey, int] = {}
+        self.rng = rng
+
+    def lookup(self, key: TLBKey) -> Optional[int]:
+        return self.frames.get(key)
+
+    def insert(self, key: TLBKey, frame: int) -> Optional[TLBKey]:
+        if key in self.frames:
+            self.frames[key] = frame
+            return None
+        evicted = None
+        if len(self.keys) >= self.capacity:
+            evicted = self.keys[self.rng.randrange(len(self.keys))]
+            self.remove(evicted)
+        self.positions[key] = len(self.keys)
+        self.keys.append(key)
+        self.frames[key] = frame
+        return evicted
+
+    def remove(self, key: TLBKey) -> bool:
+        pos = self.positions.pop(key, None)
+        if pos is None:
+            return False
+        del self.frames[key]
+        last = self.keys.pop()
+        if last != key:
+            self.keys[pos] = last
+            self.positions[last] = pos
+        return True
+
+    def items(self):
+        return self.frames.items()
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+
+class TLB:
+    """TLB de capacidad fija con política y asociatividad configurables."""
+
+    POLICIES = ("lru", "fifo", "random")
+
+    def __init__(self, capacity: int = 4, policy: str = "lru", ways: int = 0, seed: Optional[int] = None) -> None:
+        policy = policy.lower()
+        if policy not in self.POLICIES:
+            raise ValueError(f"Política de TLB desconocida: {policy}")
+        if capacity <= 0:
+            raise ValueError("La capacidad de la TLB debe ser positiva.")
+        # ways == 0 o ways >= capacity -> totalmente asociativa
+        if ways <= 0 or ways >= capacity:
+            ways = capacity
+        if capacity % ways:
+            raise ValueError(f"La capacidad de la TLB ({capacity}) debe ser múltiplo de las vías ({ways}).")
+        self.capacity = capacity
+        self.policy = policy
+        self.ways = ways
+        self.num_sets = self.capacity // ways
+        rng = random.Random(seed)
+        if policy == "random":
+            self._sets = [_RandomSet(ways, rng) for _ in range(self.num_sets)]
+        else:
+            self._sets = [_OrderedSet(ways, promote=policy == "lru") for _ in range(self.num_sets)]
+        # Índice por proceso para vaciar sus entradas sin recorrer la TLB
+        self._by_pid: Dict[int, Set[int]] = {}
+
+    def _set_for(self, page_number: int):
+        return self._sets[page_number % self.num_sets]
+
+    def lookup(self, pid: int, page_number: int) -> Optional[int]:
+        """Devuelve el marco asociado o None si no está en la TLB."""
+        return self._sets[page_number % self.num_sets].lookup((pid, page_number))
+
+    def insert(self, pid: int, page_number: int, frame_index: int) -> None:
+        """Inserta o actualiza una traducción, expulsando si hace falta."""
+        evicted = self._set_for(page_number).insert((pid, page_number), frame_index)
+        if evicted is not None:
+            self._forget(evicted)
+        pages = self._by_pid.get(pid)
+        if pages is None:
+            pages = self._by_pid[pid] = set()
+        pages.add(page_number)
+
+    def insert_many(self, pid: int, pages: List[int], frames: List[int]) -> None:
+        """Inserta en orden traducciones de páginas distintas de un proceso.
+
+        Equivale a llamar a ``insert`` por cada página. En una TLB totalmente
+        asociativa LRU o FIFO, insertar más claves distintas que su capacidad
+        deja solo las últimas, así que se omiten las demás.
+        """
+        if self.num_sets == 1 and self.policy != "random" and len(pages) > self.capacity:
+            self.flush()
+            pages = pages[-self.capacity:]
+            frames = frames[-self.capacity:]
+        for page_number, frame_index in zip(pages, frames):
+            self.insert(pid, page_number, frame_index)
+
+    def invalidate(self, pid: int, page_number: int) -> bool:
+        """Elimina la traducción de una página concreta si existe. Devuelve
+        si estaba en la TLB."""
+        if self._set_for(page_number).remove((pid, page_number)):
+            self._forget((pid, page_number))
+            return True
+        return False
+
+    def flush_pid(self, pid: int) -> int:
+        """Elimina todas las traducciones de un proceso y devuelve cuántas había."""
+        pages = self._by_pid.pop(pid, ())
+        for page_number in pages:
+            self._set_for(page_number).remove((pid, page_number))
+        return len(pages)
+
+    def flush(self) -> None:
+        """Vacía la TLB completa."""
+        for pid in list(self._by_pid):
+            self.flush_pid(pid)
+
+    def _forget(self, key: TLBKey) -> None:
+        pid, page_number = key
+        pages = self._by_pid.get(pid)
+        if pages is not None:
+            pages.discard(page_number)
+            if not pages:
+                del self._by_pid[pid]
+
+    def export_state(self) -> Dict[str, Any]:
+        """Entradas de cada conjunto en su orden de reemplazo (y estado del
+        generador aleatorio) para las instantáneas."""
+        pids, pages, frames = array("q"), array("q"), array("q")
+        for tlb_set in self._sets:
+            if self.policy == "random":
+                items = [(key, tlb_set.frames[key]) for key in tlb_set.keys]
+            else:
+                items = tlb_set.items()
+            for (pid, page_number), frame_index in items:
+                pids.append(pid)
+                pages.append(page_number)
+                frames.append(frame_index)
+        state: Dict[str, Any] = {"pids": pids, "pages": pages, "frames": frames}
+        if self.policy == "random":
+            state["rng"] = self._sets[0].rng.getstate()
+        return state
+
+    def restore_state(self, state: Dict[str, Any]) -> None:
+        """Sustituye el contenido por el de ``export_state`` (misma geometría)."""
+        self.flush()
+        # Cada conjunto recibe como mucho sus vías, así que no hay expulsiones
+        for pid, page_number, frame_index in zip(state["pids"], state["pages"], state["frames"]):
+            self.insert(pid, page_number, frame_index)
+        if "rng" in state:
+            version, internal, gauss = state["rng"]
+            self._sets[0].rng.setstate((version, tuple(internal), gauss))
+
+    def entries(self) -> List[Tuple[int, int, int]]:
+        """Lista de entradas ``(pid, página, marco)`` para depuración."""
+        return [(pid, page, frame) for tlb_set in self._sets for (pid, page), frame in tlb_set.items()]
+
+    def __len__(self) -> int:
+        return sum(len(tlb_set) for tlb_set in self._sets)
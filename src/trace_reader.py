@@ -0,0 +1,176 @@
+"""
+Lectura de trazas de eventos para la reproducción por lotes.
+
+Una traza de texto tiene un evento por línea:
+
+    C <pid> <tamaño_kb>   crear proceso
+    A <pid> <página>      acceder a una página
+    T <pid>               terminar proceso
+    <pid> <página>        forma corta de un acceso
+
+Las líneas vacías y las que empiezan por ``#`` se ignoran. La traza de texto
+puede estar comprimida con gzip. Los PID son etiquetas propias de la traza;
+el reproductor los traduce a los PID reales que asigna ``Process``.
+
+También existe un formato binario compacto: una cabecera ``BINARY_MAGIC``
+seguida de registros de ancho fijo de tres enteros sin signo de 32 bits en
+little-endian ``(operación, pid, argumento)``. Se lee con ``mmap`` por
+bloques, de modo que la memoria usada no depende del tamaño de la traza, y
+evita volver a interpretar texto en cada reproducción.
+
+Todos los lectores son generadores y producen eventos ``(op, pid, arg)`` o
+lotes de eventos.
+"""
+
+import gzip
+import mmap
+import os
+import sys
+import tempfile
+from array import array
+from itertools import chain, islice
+from typing import IO, Iterable, Iterator, List, Tuple
+
+OP_CREATE = 0
+OP_ACCESS = 1
+OP_TERMINATE = 2
+
+Event = Tuple[int, int, int]
+
+_OPCODES = {"C": OP_CREATE, "A": OP_ACCESS, "T": OP_TERMINATE}
+
+GZIP_MAGIC = b"\x1f\x8b"
+BINARY_MAGIC = b"MTRB\x01\x00\x00\x00"
+RECORD_FIELDS = 3
+RECORD_SIZE = 4 * RECORD_FIELDS
+DEFAULT_BATCH_SIZE = 65536
+
+_BIG_ENDIAN = sys.byteorder == "big"
+# Tipo de ``array`` de 32 bits sin signo en esta plataforma
+RECORD_TYPECODE = next(code for code in ("I", "L") if array(code).itemsize == 4)
+
+
+class TraceFormatError(ValueError):
+    """Línea o archivo de traza mal formado."""
+
+
+def parse_line(line: str) -> Event:
+    """Convierte una línea de texto en un evento ``(op, pid, arg)``."""
+    fields = line.split()
+    try:
+        if len(fields) == 2 and fields[0].lstrip("-").isdigit():
+            return OP_ACCESS, int(fields[0]), int(fields[1])
+        op = _OPCODES[fields[0].upper()]
+        pid = int(fields[1])
+        if op == OP_TERMINATE:
+            return op, pid, 0
+        return op, pid, int(fields[2])
+    except (KeyError, IndexError, ValueError):
+        raise TraceFormatError(f"Línea de traza inválida: {line.strip()!r}") from None
+
+
+def _read_magic(path: str) -> bytes:
+    with open(path, "rb") as fh:
+        return fh.read(len(BINARY_MAGIC))
+
+
+def _open_text(path: str) -> IO[str]:
+    """Abre una traza de texto, descomprimiendo gzip si hace falta."""
+    if _read_magic(path).startswith(GZIP_MAGIC):
+        return gzip.open(path, "rt", encoding="utf-8")
+    return open(path, "r", encoding="utf-8")
+
+
+def read_text_trace(path: str) -> Iterator[Event]:
+    """Genera los eventos de una traza de texto (plana o gzip), línea a línea."""
+    with _open_text(path) as fh:
+        for line in fh:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            yield parse_line(line)
+
+
+def read_binary_batches(path: str, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[array]:
+    """Genera bloques de una traza binaria como ``array`` planos de 32 bits.
+
+    Cada bloque contiene hasta ``batch_size`` registros consecutivos
+    ``op, pid, arg, op, pid, arg, ...``. Solo se copia a memoria el bloque
+    actual del archivo proyectado con ``mmap``.
+    """
+    with open(path, "rb") as fh:
+        if fh.read(len(BINARY_MAGIC)) != BINARY_MAGIC:
+            raise TraceFormatError(f"{path} no es una traza binaria.")
+        size = fh.seek(0, 2)
+        body = size - len(BINARY_MAGIC)
+        if body % RECORD_SIZE:
+            raise TraceFormatError(f"{path} está truncado: {body % RECORD_SIZE} bytes sobrantes.")
+        if body == 0:
+            return
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            chunk = batch_size * RECORD_SIZE
+            for offset in range(len(BINARY_MAGIC), size, chunk):
+                batch = array(RECORD_TYPECODE)
+                batch.frombytes(mm[offset:offset + chunk])
+                if _BIG_ENDIAN:
+                    batch.byteswap()
+                yield batch
+
+
+def read_binary_trace(path: str) -> Iterator[Event]:
+    """Genera los eventos de una traza binaria."""
+    for batch in read_binary_batches(path):
+        fields = iter(batch)
+        yield from zip(fields, fields, fields)
+
+
+def read_trace(path: str) -> Iterator[Event]:
+    """Genera eventos detectando el formato (binario, gzip o texto)."""
+    if _read_magic(path) == BINARY_MAGIC:
+        return read_binary_trace(path)
+    return read_text_trace(path)
+
+
+def batched(events: Iterable[Event], batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[List[Event]]:
+    """Agrupa un flujo de eventos en listas de como máximo ``batch_size``."""
+    it = iter(events)
+    while True:
+        batch = list(islice(it, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def write_binary_trace(events: Iterable[Event], path: str, batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+    """Escribe eventos en formato binario y devuelve cuántos se escribieron.
+
+    Los PID y argumentos deben ser enteros no negativos de 32 bits. Se
+    escribe en un archivo temporal junto a ``path`` que solo sustituye a
+    ``path`` al terminar, así que un error no deja una traza a medias.
+    """
+    count = 0
+    fd, tmp_path = tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".tmp",
+                                    dir=os.path.dirname(os.path.abspath(path)))
+    try:
+        with os.fdopen(fd, "wb") as out:
+            out.write(BINARY_MAGIC)
+            for batch in batched(events, batch_size):
+                records = array(RECORD_TYPECODE)
+                try:
+                    records.extend(chain.from_iterable(batch))
+                except OverflowError:
+                    raise TraceFormatError("La traza binaria solo admite enteros de 32 bits sin signo.") from None
+                if _BIG_ENDIAN:
+                    records.byteswap()
+                records.tofile(out)
+                count += len(batch)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return count
+
+
+def convert_text_to_binary(src: str, dst: str) -> int:
+    """Convierte una traza de texto (plana o gzip) al formato binario."""
+    return write_binary_trace(read_text_trace(src), dst)
@@ -0,0 +1,20 @@
+"""Configuración común de las pruebas: los módulos viven en ``src``."""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from config import Config  # noqa: E402
+
+
+@pytest.fixture
+def make_config():
+    """Crea una configuración con los valores por defecto y las sustituciones dadas."""
+
+    def make(**overrides):
+        return Config("", overrides)
+
+    return make
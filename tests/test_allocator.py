@@ -0,0 +1,88 @@
+import random
+
+import pytest
+
+from allocator import ALLOCATORS, LowestIndexAllocator, create_allocator
+
+
+def lowest_free_run(used, capacity, size):
+    for start in range(0, capacity - size + 1, size):
+        if not used.intersection(range(start, start + size)):
+            return start
+    return None
+
+
+@pytest.mark.parametrize("name", list(ALLOCATORS))
+def test_allocate_run_entrega_el_tramo_alineado_libre_mas_bajo(name):
+    capacity, size = 70, 8
+    rng = random.Random(5)
+    allocator = create_allocator(name, capacity)
+    used = set()
+    for step in range(3000):
+        op = rng.random()
+        if op < 0.45:
+            index = allocator.allocate()
+            if index is None:
+                assert len(used) == capacity
+            else:
+                assert index not in used
+                used.add(index)
+        elif op < 0.55:
+            expected = lowest_free_run(used, capacity, size)
+            start = allocator.allocate_run(size)
+            assert start == expected
+            if start is not None:
+                assert start % size == 0
+                used.update(range(start, start + size))
+        elif used:
+            if op < 0.9:
+                index = rng.choice(sorted(used))
+                allocator.release(index)
+                used.discard(index)
+            else:
+                indices = rng.sample(sorted(used), min(len(used), rng.randint(1, 12)))
+                allocator.release_many(indices)
+                used.difference_update(indices)
+        assert allocator.used == len(used)
+
+
+def test_el_estado_exportado_entrega_los_mismos_marcos():
+    allocator = LowestIndexAllocator(32)
+    allocator.allocate_many(12)
+    allocator.release_many([1, 2, 3, 5])
+    assert allocator.allocate_run(4) == 12
+    allocator.release_many([0, 4, 6, 7])
+    copy = LowestIndexAllocator(32)
+    copy.restore_state(allocator.export_state())
+    assert copy.allocate_run(4) == allocator.allocate_run(4) == 0
+    assert copy.allocate_many(10) == allocator.allocate_many(10)
+
+
+def test_lowest_index_coincide_con_el_recorrido_lineal():
+    capacity = 50
+    rng = random.Random(1)
+    allocator = LowestIndexAllocator(capacity)
+    used = set()
+    for _ in range(2000):
+        if rng.random() < 0.55:
+            expected = next((i for i in range(capacity) if i not in used), None)
+            assert allocator.allocate() == expected
+            if expected is not None:
+                used.add(expected)
+        elif used:
+            index = rng.choice(sorted(used))
+            allocator.release(index)
+            used.discard(index)
+    assert allocator.free_count == capacity - len(used)
+
+
+@pytest.mark.parametrize("name", list(ALLOCATORS))
+def test_allocate_many_no_repite_marcos_y_respeta_la_capacidad(name):
+    allocator = create_allocator(name, 16)
+    first = allocator.allocate_many(10)
+    second = allocator.allocate_many(10)
+    assert len(first) == 10 and len(second) == 6
+    assert sorted(first + second) == list(range(16))
+    assert allocator.allocate() is None and not allocator.has_free()
+    allocator.release_many(first[:3])
+    assert sorted(allocator.allocate_many(5)) == sorted(first[:3])
@@ -0,0 +1,75 @@
+import random
+
+import pytest
+
+from config import Config
+from logger import EventLog
+from replacement import create_replacement
+
+pytest.importorskip("numpy")
+
+from memory_manager import create_memory_manager  # noqa: E402
+from process import Process  # noqa: E402
+
+GEOMETRY = {"page_size_kb": 4, "ram_size_kb": 4 * 48, "swap_size_kb": 4 * 256}
+
+
+def drive(manager, seed=11, steps=3000, switch_to=None):
+    """Aplica una carga con creaciones, accesos y terminaciones y devuelve
+    el resultado de cada acceso."""
+    rng = random.Random(seed)
+    live = []
+    results = []
+    for step in range(steps):
+        if switch_to is not None and step == steps // 2:
+            manager.set_replacement(create_replacement(switch_to, seed=5))
+        if not live or rng.random() < 0.02:
+            process = manager.new_process(4 * rng.randint(8, 64))
+            manager.load_process(process)
+            live.append(process)
+            if len(live) > 5:
+                manager.remove_process(live.pop(rng.randrange(len(live))).pid)
+        process = rng.choice(live)
+        results.append(manager.access(process.pid, rng.randrange(process.pages_needed + 1)))
+    return results
+
+
+def state(manager):
+    tables = {pid: manager.get_page_table(pid) for pid in sorted(manager.processes)}
+    return manager.get_ram_map(), manager.get_swap_map(), tables
+
+
+def run_both(make_config, overrides, **kwargs):
+    runs = []
+    for engine in Config.ENGINES:
+        manager = create_memory_manager(make_config(engine=engine, **GEOMETRY, **overrides))
+        log = EventLog()
+        log.attach(manager)
+        # Los PID salen de un contador global: cada motor empieza igual
+        Process._next_pid = 1
+        results = drive(manager, **kwargs)
+        events = [event[1:] for event in log.events()]
+        runs.append((results, state(manager), manager.get_metrics_dict(), events))
+    return runs
+
+
+@pytest.mark.parametrize("algorithm", Config.REPLACEMENT_ALGORITHMS)
+def test_los_dos_motores_dan_el_mismo_resultado(make_config, algorithm):
+    objects, arrays = run_both(make_config, {"replacement_algorithm": algorithm})
+    assert arrays[0] == objects[0]
+    assert arrays[1] == objects[1]
+    assert arrays[2] == objects[2]
+    assert arrays[3] == objects[3]
+
+
+@pytest.mark.parametrize("switch_to", ["lru", "clock", "lfu"])
+def test_cambiar_el_reemplazo_a_mitad_coincide(make_config, switch_to):
+    objects, arrays = run_both(make_config, {}, switch_to=switch_to)
+    assert arrays == objects
+
+
+def test_la_carga_ejercita_expulsiones_swaps_y_terminaciones(make_config):
+    (_, _, metrics, events), _ = run_both(make_config, {})
+    kinds = {event[0].name for event in events}
+    assert {"EVICT", "SWAP_IN", "TERMINATE"} <= kinds
+    assert metrics["swaps_in"] > 0 and metrics["swaps_out"] > 0
@@ -0,0 +1,50 @@
+import pytest
+
+from memory_manager import (
+    ACCESS_HIT, ACCESS_MINOR_FAULT, ACCESS_NO_MEMORY, ACCESS_TLB_HIT, create_memory_manager,
+)
+
+
+def test_las_paginas_reciben_marco_en_el_primer_acceso(make_config):
+    manager = create_memory_manager(make_config(
+        paging="demand", page_size_kb=4, ram_size_kb=4 * 8, swap_size_kb=4 * 8,
+    ))
+    process = manager.new_process(4 * 100)
+    manager.load_process(process)
+    assert manager.get_metrics_dict()["ram_used"] == 0
+
+    assert manager.access(process.pid, 42) == ACCESS_MINOR_FAULT
+    assert manager.access(process.pid, 42) in (ACCESS_HIT, ACCESS_TLB_HIT)
+    metrics = manager.get_metrics_dict()
+    assert (metrics["minor_faults"], metrics["page_faults"], metrics["ram_used"]) == (1, 0, 1)
+
+
+def test_sin_marcos_ni_ranuras_el_acceso_falla(make_config):
+    manager = create_memory_manager(make_config(
+        paging="demand", page_size_kb=4, ram_size_kb=4 * 4, swap_size_kb=4 * 4,
+    ))
+    process = manager.new_process(4 * 20)
+    manager.load_process(process)
+    results = [manager.access(process.pid, page) for page in range(9)]
+    assert results[:8] == [ACCESS_MINOR_FAULT] * 8
+    assert results[8] == ACCESS_NO_MEMORY
+    metrics = manager.get_metrics_dict()
+    assert (metrics["ram_used"], metrics["swap_used"], metrics["minor_faults"]) == (4, 4, 8)
+
+
+def test_terminar_libera_solo_las_paginas_tocadas(make_config):
+    manager = create_memory_manager(make_config(
+        paging="demand", page_size_kb=4, ram_size_kb=4 * 8, swap_size_kb=4 * 8,
+    ))
+    process = manager.new_process(4 * 1000)
+    manager.load_process(process)
+    for page in (0, 500, 999):
+        manager.access(process.pid, page)
+    manager.remove_process(process.pid)
+    metrics = manager.get_metrics_dict()
+    assert metrics["ram_used"] == metrics["swap_used"] == 0
+
+
+def test_el_motor_de_arrays_rechaza_la_paginacion_bajo_demanda(make_config):
+    with pytest.raises(ValueError):
+        create_memory_manager(make_config(engine="arrays", paging="demand"))
@@ -0,0 +1,51 @@
+import random
+
+from memory_manager import ACCESS_SUSPENDED, create_memory_manager
+from process import ProcessState
+
+
+def make_manager(make_config):
+    manager = create_memory_manager(make_config(
+        load_control="pff", pff_window=200, working_set_window=100,
+        ram_size_kb=2048, swap_size_kb=8192, page_size_kb=256,
+    ))
+    processes = [manager.new_process(1536) for _ in range(4)]
+    for process in processes:
+        manager.load_process(process)
+    return manager, processes
+
+
+def test_el_controlador_no_sustituye_metodos_del_gestor(make_config):
+    manager, _ = make_manager(make_config)
+    assert manager.load_controller is not None
+    assert "access" not in vars(manager)
+    assert "remove_process" not in vars(manager)
+
+
+def test_suspender_y_reanudar_cuentan_swaps(make_config):
+    manager, processes = make_manager(make_config)
+    pid = processes[0].pid
+    manager.access(pid, 0)
+    resident = processes[0].resident_pages
+    swaps_out, swaps_in = manager.swaps_out, manager.swaps_in
+    assert manager.load_controller.suspend(pid)
+    assert manager.processes[pid].state is ProcessState.SWAPPED
+    assert manager.swaps_out == swaps_out + resident
+    assert manager.access(pid, 0) == ACCESS_SUSPENDED
+    manager.load_controller.resume(pid)
+    assert manager.swaps_in == swaps_in + 1
+    assert manager.processes[pid].page_table[0].present
+
+
+def test_hiperpaginacion_suspende_procesos(make_config):
+    manager, processes = make_manager(make_config)
+    rng = random.Random(2)
+    for _ in range(5000):
+        manager.access(rng.choice(processes).pid, rng.randrange(6))
+    metrics = manager.get_metrics_dict()
+    assert metrics["suspensions"] > 0
+    assert metrics["blocked_accesses"] > 0
+    pid = processes[0].pid
+    manager.remove_process(pid)
+    assert pid not in manager.load_controller.loads
+    assert pid not in manager.load_controller.suspended
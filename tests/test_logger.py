@@ -0,0 +1,66 @@
+from logger import EventLog, EventType, Level, Logger, read_events
+from memory_manager import create_memory_manager
+
+
+def run(manager, log=None):
+    if log is not None:
+        log.attach(manager)
+    process = manager.new_process(2048)
+    manager.load_process(process)
+    for page in (0, 1, 7, 0, 50):
+        manager.access(process.pid, page)
+    manager.remove_process(process.pid)
+    return process.pid
+
+
+def test_el_gestor_notifica_sus_eventos(make_config):
+    manager = create_memory_manager(make_config(ram_size_kb=1024, swap_size_kb=4096))
+    log = EventLog()
+    pid = run(manager, log)
+    kinds = [event.kind for event in log.events()]
+    assert kinds[0] is EventType.CREATE
+    assert kinds[-1] is EventType.TERMINATE
+    assert EventType.EVICT in kinds
+    assert EventType.FAULT in kinds
+    assert EventType.SWAP_IN in kinds
+    errors = [event for event in log.events() if event.kind is EventType.ERROR]
+    assert [(event.pid, event.page) for event in errors] == [(pid, 50)]
+    assert not {"access", "load_process", "remove_process", "_move_to_swap", "_swap_in"} & set(vars(manager))
+
+
+def test_detach_deja_de_registrar(make_config):
+    manager = create_memory_manager(make_config())
+    log = EventLog()
+    log.attach(manager)
+    log.detach()
+    assert manager.event_log is None
+    run(manager)
+    assert log.recorded == 0
+
+
+def test_nivel_y_muestreo(make_config):
+    manager = create_memory_manager(make_config())
+    log = EventLog(level=Level.INFO)
+    run(manager, log)
+    assert all(event.kind not in (EventType.TLB_HIT, EventType.HIT, EventType.SWAP_IN) for event in log.events())
+    assert log.filtered > 0
+
+
+def test_exportacion_y_lectura(tmp_path, make_config):
+    manager = create_memory_manager(make_config())
+    log = EventLog(capacity=4)
+    run(manager, log)
+    assert len(log.events()) == 4
+    for fmt in ("jsonl", "binary"):
+        path = tmp_path / f"eventos.{fmt}"
+        assert log.export(str(path), fmt) == 4
+        assert list(read_events(str(path))) == log.events()
+
+
+def test_logger_conserva_la_interfaz_anterior():
+    log = Logger()
+    log.log("uno")
+    log.log("dos")
+    assert log.get_events() == ["uno", "dos"]
+    log.clear()
+    assert log.get_events() == []
@@ -0,0 +1,134 @@
+import io
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from main import main
+
+MAIN = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src", "main.py")
+TRACE = "C 1 1024\n" + "".join(f"A 1 {page % 4}\n" for page in range(20)) + "T 1\n"
+
+
+@pytest.fixture
+def files(tmp_path):
+    """config.ini vacío (valores por defecto) y una traza mínima."""
+    config = tmp_path / "config.ini"
+    config.write_text("", encoding="utf-8")
+    trace = tmp_path / "traza.txt"
+    trace.write_text(TRACE, encoding="utf-8")
+    return str(config), str(trace)
+
+
+def run_json(capsys, argv):
+    main(argv)
+    return json.loads(capsys.readouterr().out)
+
+
+def test_replay_json_con_sustituciones_antes_y_despues_del_subcomando(capsys, files):
+    config, trace = files
+    report = run_json(capsys, [
+        "--config", config, "--ram-size-kb", "512",
+        "replay", trace, "--replacement-algorithm", "lru", "--tlb-size", "2", "--json",
+    ])
+    assert report["config"]["ram_size_kb"] == 512
+    assert report["config"]["replacement_algorithm"] == "lru"
+    assert report["config"]["tlb_size"] == 2
+    assert report["replay"]["accesses"] == 20
+    assert (report["replay"]["creates"], report["replay"]["terminates"]) == (1, 1)
+    assert report["metrics"]["total_accesses"] == 20
+
+
+def test_config_options_genera_una_opcion_por_campo():
+    from dataclasses import fields
+
+    from config import ConfigValues
+    from main import config_options
+
+    options = {action.dest for action in config_options()._actions}
+    assert {field.name for field in fields(ConfigValues)} <= options
+
+
+@pytest.mark.parametrize("option", [
+    ["--ram-size-kb", "mucho"],
+    ["--ram-size-kb", "0"],
+    ["--replacement-algorithm", "optimo"],
+    ["--tlb-size", "6", "--tlb-ways", "4"],
+    # Valores válidos por separado que el gestor no admite juntos
+    ["--engine", "arrays", "--cpus", "2"],
+    ["--huge-pages", "always", "--huge-page-size-kb", "300"],
+])
+def test_sustituciones_invalidas_terminan_con_error(capsys, files, option):
+    config, trace = files
+    with pytest.raises(SystemExit) as exc:
+        main(["--config", config, "replay", trace, *option])
+    assert str(exc.value.code).startswith("Configuración inválida")
+    assert capsys.readouterr().out == ""
+
+
+def test_el_menu_rechaza_combinaciones_invalidas(capsys, files, tmp_path):
+    config, _ = files
+    script = tmp_path / "guion.txt"
+    script.write_text("0\n", encoding="utf-8")
+    with pytest.raises(SystemExit) as exc:
+        main(["--config", config, "--script", str(script), "--engine", "arrays", "--paging", "demand"])
+    assert str(exc.value.code).startswith("Configuración inválida")
+
+
+def test_opcion_desconocida_y_config_inexistente(capsys, files, tmp_path):
+    config, trace = files
+    with pytest.raises(SystemExit) as exc:
+        main(["--config", config, "replay", trace, "--no-existe", "1"])
+    assert exc.value.code == 2
+    with pytest.raises(SystemExit) as exc:
+        main(["--config", str(tmp_path / "otro.ini"), "replay", trace])
+    assert "No existe el archivo de configuración" in str(exc.value.code)
+
+
+def test_script_ejecuta_el_menu_sin_preguntar(capsys, files, tmp_path):
+    config, _ = files
+    script = tmp_path / "guion.txt"
+    # Crear un proceso de 1024 KB, mostrar métricas y salir
+    script.write_text("# sesión de prueba\n1\n1024\n6\n0\n", encoding="utf-8")
+    main(["--config", config, "--script", str(script)])
+    out = capsys.readouterr().out
+    assert "Tamaño del proceso en KB (o 'r' para aleatorio): 1024" in out
+    assert "--- Métricas ---" in out
+    assert out.rstrip().endswith("Saliendo del simulador.")
+
+
+def test_script_json_separa_la_sesion_del_resultado(capsys, files, monkeypatch):
+    config, _ = files
+    # Sin opción 0: el fin de la entrada equivale a salir
+    monkeypatch.setattr(sys, "stdin", io.StringIO("1\n1024\n"))
+    main(["--config", config, "--script", "-", "--json", "--page-size-kb", "128"])
+    captured = capsys.readouterr()
+    report = json.loads(captured.out)
+    assert report["config"]["page_size_kb"] == 128
+    assert report["metrics"]["ram_used"] == 8
+    assert "Saliendo del simulador." in captured.err
+
+
+def test_convert_y_curve_en_json(capsys, files, tmp_path):
+    config, trace = files
+    binary = str(tmp_path / "traza.bin")
+    assert run_json(capsys, ["convert", trace, binary, "--json"]) == {"events": 22, "output": binary}
+    curve = str(tmp_path / "curva.csv")
+    report = run_json(capsys, ["--config", config, "curve", binary, "-o", curve, "--sizes", "1", "2", "4", "--json"])
+    assert report == {"accesses": 20, "sizes": 3, "output": curve}
+
+
+def test_codigos_de_salida_del_proceso(files):
+    config, trace = files
+    ok = subprocess.run(
+        [sys.executable, MAIN, "--config", config, "replay", trace, "--json"], capture_output=True, text=True,
+    )
+    assert ok.returncode == 0
+    assert json.loads(ok.stdout)["replay"]["accesses"] == 20
+    bad = subprocess.run(
+        [sys.executable, MAIN, "--config", config, "replay", trace, "--ram-size-kb", "-1"], capture_output=True, text=True,
+    )
+    assert bad.returncode == 1
+    assert bad.stdout == "" and "Configuración inválida" in bad.stderr
@@ -0,0 +1,94 @@
+import random
+import threading
+
+import pytest
+
+from memory_manager import ACCESS_FAULT, ACCESS_TLB_HIT, create_memory_manager
+from multicpu import ConcurrentMemoryManager
+
+GEOMETRY = {"page_size_kb": 4, "ram_size_kb": 4 * 16, "swap_size_kb": 4 * 256, "tlb_size": 8}
+
+
+def test_terminar_un_proceso_vacia_las_tlb_de_todas_las_cpu(make_config):
+    manager = create_memory_manager(make_config(cpus=4, **GEOMETRY))
+    assert isinstance(manager, ConcurrentMemoryManager)
+    process = manager.new_process(4 * 8)
+    manager.load_process(process)
+    for index in range(4):
+        manager.bind_cpu(index)
+        for page in range(4):
+            manager.access(process.pid, page)
+        assert len(manager.cpus[index].tlb) >= 4
+
+    manager.bind_cpu(0)
+    manager.remove_process(process.pid)
+    assert all(len(cpu.tlb) == 0 for cpu in manager.cpus)
+    metrics = manager.get_metrics_dict()
+    assert (metrics["tlb_shootdowns"], metrics["shootdown_ipis"]) == (1, 3)
+
+
+def test_expulsar_una_pagina_la_invalida_en_las_demas_cpu(make_config):
+    manager = create_memory_manager(make_config(cpus=2, replacement_algorithm="fifo", **GEOMETRY))
+    first = manager.new_process(4 * 16)
+    manager.load_process(first)
+    manager.bind_cpu(1)
+    manager.access(first.pid, 0)
+    assert manager.access(first.pid, 0) == ACCESS_TLB_HIT
+
+    # Un proceso nuevo en la CPU 0 expulsa la página 0 (la primera en entrar)
+    manager.bind_cpu(0)
+    second = manager.new_process(4 * 1)
+    manager.load_process(second)
+    assert not first.page_table[0].present
+    assert manager.cpus[1].tlb.lookup(first.pid, 0) is None
+    assert manager.get_metrics_dict()["shootdown_ipis"] >= 1
+    manager.bind_cpu(1)
+    assert manager.access(first.pid, 0) == ACCESS_FAULT
+
+
+@pytest.mark.parametrize("algorithm", ["fifo", "lru", "clock"])
+def test_hilos_concurrentes_dejan_el_estado_coherente(make_config, algorithm):
+    cpus = 4
+    manager = create_memory_manager(make_config(cpus=cpus, replacement_algorithm=algorithm, **GEOMETRY))
+    processes = [manager.new_process(4 * 12) for _ in range(cpus + 1)]
+    for process in processes:
+        manager.load_process(process)
+    shared = processes[0]
+
+    def worker(index):
+        manager.bind_cpu(index)
+        rng = random.Random(index)
+        private = processes[index + 1]
+        for _ in range(2000):
+            process = shared if rng.random() < 0.3 else private
+            manager.access(process.pid, rng.randrange(12))
+
+    threads = [threading.Thread(target=worker, args=(index,)) for index in range(cpus)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    metrics = manager.get_metrics_dict()
+    assert metrics["total_accesses"] == cpus * 2000
+    assert metrics["ram_used"] == 16
+    assert metrics["ram_used"] + metrics["swap_used"] == 12 * (cpus + 1)
+    for index, frame in enumerate(manager.ram):
+        entry = manager.processes[frame.process_id].page_table[frame.page_number]
+        assert entry.present and entry.frame_index == index
+    # Ninguna TLB conserva una traducción obsoleta
+    for cpu in manager.cpus:
+        for pid, page_number, frame_index in cpu.tlb.entries():
+            entry = manager.processes[pid].page_table[page_number]
+            assert entry.present and entry.frame_index == frame_index
+
+
+def test_los_contadores_agregados_no_se_asignan(make_config):
+    manager = create_memory_manager(make_config(cpus=2, **GEOMETRY))
+    process = manager.new_process(4 * 8)
+    manager.load_process(process)
+    manager.bind_cpu(1)
+    manager.access(process.pid, 0)
+    with pytest.raises(AttributeError):
+        manager.page_faults += 1
+    assert manager.total_accesses == manager.cpus[1].total_accesses == 1
@@ -0,0 +1,65 @@
+import random
+
+import pytest
+
+from memory_manager import create_memory_manager
+
+
+def churn(manager, steps=3000, seed=4):
+    rng = random.Random(seed)
+    live = []
+    for _ in range(steps):
+        if not live or rng.random() < 0.03:
+            process = manager.new_process(4 * rng.randint(8, 96))
+            manager.load_process(process)
+            live.append(process)
+            if len(live) > 6:
+                manager.remove_process(live.pop(rng.randrange(len(live))).pid)
+        process = rng.choice(live)
+        manager.access(process.pid, rng.randrange(process.pages_needed))
+
+
+@pytest.mark.parametrize("overrides", [
+    {},
+    {"paging": "demand"},
+    {"huge_pages": "always", "huge_page_size_kb": 32},
+])
+def test_la_tabla_invertida_refleja_los_marcos_de_ram(make_config, overrides):
+    manager = create_memory_manager(make_config(
+        page_table="inverted", page_size_kb=4, ram_size_kb=4 * 64, swap_size_kb=4 * 1024, **overrides,
+    ))
+    churn(manager)
+    walker = manager.page_walker
+    for index, frame in enumerate(manager.ram):
+        if frame.free:
+            assert walker.pids[index] == -1
+        else:
+            assert (walker.pids[index], walker.pages[index]) == (frame.process_id, frame.page_number)
+            assert walker.lookup(frame.process_id, frame.page_number) == index
+    for process in manager.processes.values():
+        for page_number in process.swapped:
+            assert walker.lookup(process.pid, page_number) is None
+
+
+def test_el_recorrido_cuenta_anclas_y_entradas(make_config):
+    manager = create_memory_manager(make_config(page_table="inverted", tlb_size=1))
+    process = manager.new_process(1024)
+    manager.load_process(process)
+    walker = manager.page_walker
+    before = list(walker.level_accesses)
+    assert walker.walk(process.pid, 0) == process.page_table[0].frame_index
+    assert walker.level_accesses[0] == before[0] + 1
+    assert walker.level_accesses[1] >= before[1] + 1
+
+
+def test_radix_cachea_los_niveles_superiores(make_config):
+    manager = create_memory_manager(make_config(page_table="radix", page_table_levels=4, tlb_size=1))
+    process = manager.new_process(1024)
+    manager.load_process(process)
+    for page in range(4):
+        manager.access(process.pid, page)
+    metrics = manager.get_metrics_dict()
+    assert metrics["walk_cache_hits"] > 0
+    # Con la caché, los niveles superiores se leen menos que la hoja
+    levels = manager.page_walker.level_accesses
+    assert levels[0] < levels[-1]
@@ -0,0 +1,80 @@
+from memory_manager import create_memory_manager
+
+COUNTERS = ("page_faults", "swaps_in", "prefetched_pages", "prefetch_hits", "useless_prefetches")
+
+
+def load(make_config, strategy):
+    """Proceso de 32 páginas con 8 marcos de RAM: tras la carga (FIFO) las
+    páginas 24-31 están en RAM y las 0-23 en Swap."""
+    manager = create_memory_manager(make_config(
+        prefetch=strategy, prefetch_depth=2, page_size_kb=4, ram_size_kb=4 * 8, swap_size_kb=4 * 64, tlb_size=1,
+    ))
+    process = manager.new_process(4 * 32)
+    manager.load_process(process)
+    return manager, process
+
+
+def resident(process):
+    return sorted(page for page, entry in enumerate(process.page_table) if entry.present)
+
+
+def counters(manager):
+    metrics = manager.get_metrics_dict()
+    return tuple(metrics[name] for name in COUNTERS)
+
+
+def test_las_paginas_precargadas_cuentan_como_swaps_in(make_config):
+    manager = create_memory_manager(make_config(
+        prefetch="sequential", prefetch_depth=2, ram_size_kb=1024, swap_size_kb=4096, page_size_kb=256,
+    ))
+    process = manager.new_process(2048)
+    manager.load_process(process)
+    for page in list(range(8)) * 3:
+        manager.access(process.pid, page)
+    m = manager.get_metrics_dict()
+    assert m["prefetched_pages"] > 0
+    assert m["swaps_in"] == m["page_faults"] + m["prefetched_pages"]
+    assert m["swaps_in"] <= m["swaps_out"]
+
+
+def test_secuencial_trae_las_paginas_siguientes(make_config):
+    manager, process = load(make_config, "sequential")
+    manager.access(process.pid, 0)
+    assert resident(process) == [0, 1, 2, 27, 28, 29, 30, 31]
+    assert counters(manager) == (1, 3, 2, 0, 0)
+    manager.access(process.pid, 1)
+    assert counters(manager) == (1, 3, 2, 1, 0)
+    for page in (10, 14, 18):
+        manager.access(process.pid, page)
+    # Se expulsan sin usar la 2 (del fallo en 0) y la 11 (del fallo en 10)
+    assert resident(process) == [10, 12, 14, 15, 16, 18, 19, 20]
+    assert counters(manager) == (4, 12, 8, 1, 2)
+
+
+def test_stride_espera_a_que_se_repita_el_paso(make_config):
+    manager, process = load(make_config, "stride")
+    manager.access(process.pid, 0)
+    manager.access(process.pid, 3)
+    assert counters(manager) == (2, 2, 0, 0, 0)
+    manager.access(process.pid, 6)
+    assert resident(process) == [0, 3, 6, 9, 12, 29, 30, 31]
+    assert counters(manager) == (3, 5, 2, 0, 0)
+    manager.access(process.pid, 9)
+    manager.access(process.pid, 12)
+    assert counters(manager) == (3, 5, 2, 2, 0)
+
+
+def test_working_set_trae_las_ultimas_expulsadas(make_config):
+    manager, process = load(make_config, "working_set")
+    # La carga expulsó las páginas 0-23 en orden: las más recientes son 23 y 22
+    manager.access(process.pid, 0)
+    assert resident(process) == [0, 22, 23, 27, 28, 29, 30, 31]
+    assert counters(manager) == (1, 3, 2, 0, 0)
+    manager.access(process.pid, 23)
+    # El fallo en 0 expulsó 24, 25 y 26: se precargan 26 y 25
+    manager.access(process.pid, 5)
+    assert resident(process) == [0, 5, 22, 23, 25, 26, 30, 31]
+    assert counters(manager) == (2, 6, 4, 1, 0)
+    # Al terminar, las precargadas sin usar (22, 25 y 26) cuentan como inútiles
+    manager.remove_process(process.pid)
+    assert counters(manager) == (2, 6, 4, 1, 3)
@@ -0,0 +1,42 @@
+from memory_manager import create_memory_manager
+from profiling import PROFILED_OPERATIONS, Profiler
+
+
+def workload(manager):
+    process = manager.new_process(2048)
+    manager.load_process(process)
+    for page in range(process.pages_needed):
+        manager.access(process.pid, page)
+    manager.remove_process(process.pid)
+
+
+def test_cuenta_llamadas_y_detach_restaura(make_config):
+    manager = create_memory_manager(make_config())
+    profiler = Profiler(manager)
+    workload(manager)
+    assert profiler.histograms["access"].count == 8
+    assert profiler.histograms["remove_process"].count == 1
+    profiler.detach()
+    for owner_name, method in PROFILED_OPERATIONS:
+        owner = getattr(manager, owner_name) if owner_name else manager
+        assert method not in vars(owner)
+    workload(manager)
+    assert profiler.histograms["access"].count == 8
+
+
+def test_detach_no_deshace_sustituciones_posteriores(make_config):
+    manager = create_memory_manager(make_config())
+    profiler = Profiler(manager)
+    calls = []
+    profiled_access = manager.access
+
+    def traced_access(pid, page_number):
+        calls.append(page_number)
+        return profiled_access(pid, page_number)
+
+    manager.access = traced_access
+    profiler.detach()
+    assert manager.access is traced_access
+    workload(manager)
+    assert len(calls) == 8
+    assert profiler.histograms["access"].count == 0
@@ -0,0 +1,85 @@
+from types import SimpleNamespace
+
+import pytest
+
+from memory_manager import ACCESS_FAULT, create_memory_manager
+from replacement import REPLACEMENT_ALGORITHMS, create_replacement
+
+
+def load(algorithm, pages, pid=1):
+    entries = {}
+    for page in pages:
+        entries[page] = SimpleNamespace(referenced=False)
+        algorithm.page_loaded(pid, page, entries[page])
+    return entries
+
+
+def test_fifo_ignora_los_accesos():
+    fifo = create_replacement("fifo")
+    load(fifo, [0, 1, 2])
+    fifo.page_accessed(1, 0, None)
+    assert fifo.select_victim() == (1, 0)
+
+
+def test_lru_expulsa_la_menos_reciente():
+    lru = create_replacement("lru")
+    load(lru, [0, 1, 2])
+    lru.page_accessed(1, 0, None)
+    assert lru.select_victim() == (1, 1)
+
+
+@pytest.mark.parametrize("name", ["clock", "second_chance"])
+def test_bit_de_referencia_da_segunda_oportunidad(name):
+    algorithm = create_replacement(name)
+    entries = load(algorithm, [0, 1, 2])
+    entries[0].referenced = True
+    algorithm.page_accessed(1, 0, entries[0])
+    assert algorithm.select_victim() == (1, 1)
+    assert not entries[0].referenced
+
+
+def test_lfu_expulsa_la_menos_frecuente():
+    lfu = create_replacement("lfu")
+    load(lfu, [0, 1, 2])
+    for page in (0, 0, 2):
+        lfu.page_accessed(1, page, None)
+    assert lfu.select_victim() == (1, 1)
+
+
+@pytest.mark.parametrize("name", list(REPLACEMENT_ALGORITHMS))
+def test_page_removed_saca_la_pagina_de_las_candidatas(name):
+    algorithm = create_replacement(name, seed=0)
+    load(algorithm, [0, 1, 2])
+    algorithm.page_removed(1, 0)
+    assert len(algorithm) == 2
+    victims = {algorithm.select_victim(), algorithm.select_victim()}
+    assert victims == {(1, 1), (1, 2)}
+    with pytest.raises(RuntimeError):
+        algorithm.select_victim()
+
+
+def test_random_con_la_misma_semilla_es_reproducible():
+    first, second = create_replacement("random", 7), create_replacement("random", 7)
+    load(first, range(50))
+    load(second, range(50))
+    assert [first.select_victim() for _ in range(50)] == [second.select_victim() for _ in range(50)]
+
+
+def run_random(make_config, engine):
+    manager = create_memory_manager(make_config(
+        engine=engine, replacement_algorithm="random", replacement_seed=3,
+        ram_size_kb=1024, swap_size_kb=4096, page_size_kb=256,
+    ))
+    process = manager.new_process(2048)
+    manager.load_process(process)
+    pid = process.pid
+    results = [manager.access(pid, page % 8) for page in range(0, 200, 3)]
+    manager.close()
+    return results
+
+
+def test_random_coincide_entre_ejecuciones_y_motores(make_config):
+    objects = run_random(make_config, "objects")
+    assert ACCESS_FAULT in objects
+    assert objects == run_random(make_config, "objects")
+    assert objects == run_random(make_config, "arrays")
@@ -0,0 +1,70 @@
+import random
+
+from memory_manager import create_memory_manager
+from replay import replay, replay_concurrent
+from trace_reader import OP_ACCESS, OP_CREATE, OP_TERMINATE
+
+
+def test_replay_equivale_a_llamar_al_gestor(make_config):
+    config = make_config(ram_size_kb=4 * 32, swap_size_kb=4 * 256, page_size_kb=4)
+    rng = random.Random(2)
+    events = [(OP_CREATE, 7, 4 * 40), (OP_CREATE, 9, 4 * 30)]
+    events += [(OP_ACCESS, rng.choice((7, 9)), rng.randrange(30)) for _ in range(2000)]
+    events.append((OP_TERMINATE, 9, 0))
+    events += [(OP_ACCESS, 7, rng.randrange(40)) for _ in range(500)]
+
+    replayed = create_memory_manager(config)
+    stats = replay(replayed, events)
+
+    manual = create_memory_manager(config)
+    pids = {}
+    for op, trace_pid, arg in events:
+        if op == OP_CREATE:
+            process = manual.new_process(arg)
+            manual.load_process(process)
+            pids[trace_pid] = process.pid
+        elif op == OP_ACCESS:
+            manual.access(pids[trace_pid], arg)
+        else:
+            manual.remove_process(pids.pop(trace_pid))
+
+    assert (stats.events, stats.accesses, stats.creates, stats.terminates) == (len(events), 2500, 2, 1)
+    assert stats.invalid_events == 0
+    assert replayed.get_metrics_dict() == manual.get_metrics_dict()
+
+
+def test_replay_cuenta_los_eventos_invalidos(make_config):
+    manager = create_memory_manager(make_config())
+    events = [
+        (OP_CREATE, 1, 64),
+        (OP_CREATE, 1, 64),   # PID repetido
+        (OP_CREATE, 2, 0),    # tamaño nulo
+        (OP_TERMINATE, 3, 0),  # PID desconocido
+        (OP_ACCESS, 5, 0),    # acceso a un PID desconocido: cuenta como acceso
+        (9, 1, 0),            # operación desconocida
+    ]
+    stats = replay(manager, events)
+    assert stats.creates == 1
+    assert stats.accesses == 1
+    assert stats.invalid_events == 4
+    assert len(manager.processes) == 1
+
+
+def test_replay_continua_con_la_tabla_de_pids(make_config):
+    manager = create_memory_manager(make_config())
+    pids = {}
+    replay(manager, [(OP_CREATE, 1, 64)], pids)
+    stats = replay(manager, [(OP_ACCESS, 1, 0), (OP_TERMINATE, 1, 0)], pids)
+    assert (stats.accesses, stats.terminates, stats.invalid_events) == (1, 1, 0)
+    assert pids == {} and not manager.processes
+
+
+def test_replay_concurrente_crea_cada_pid_una_sola_vez(make_config):
+    manager = create_memory_manager(make_config(cpus=4, ram_size_kb=4 * 256, swap_size_kb=4 * 4096, page_size_kb=4))
+    trace = [(OP_CREATE, pid, 4 * 8) for pid in range(50)] + [(OP_ACCESS, pid, 0) for pid in range(50)]
+    pids = {}
+    stats = replay_concurrent(manager, [list(trace) for _ in range(4)], pids)
+    assert stats.creates == 50
+    assert stats.invalid_events == 3 * 50
+    assert len(manager.processes) == 50
+    assert sorted(pids.values()) == sorted(manager.processes)
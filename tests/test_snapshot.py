@@ -0,0 +1,73 @@
+import random
+
+import pytest
+
+from config import Config
+from memory_manager import create_memory_manager
+from snapshot import load_snapshot, save_snapshot
+
+GEOMETRY = {"page_size_kb": 4, "ram_size_kb": 4 * 64, "swap_size_kb": 4 * 512}
+
+
+def run(manager, rng, steps, live):
+    results = []
+    for _ in range(steps):
+        if not live or rng.random() < 0.02:
+            process = manager.new_process(4 * rng.randint(16, 80))
+            manager.load_process(process)
+            live.append((process.pid, process.pages_needed))
+            if len(live) > 5:
+                manager.remove_process(live.pop(rng.randrange(len(live)))[0])
+        pid, pages = rng.choice(live)
+        results.append(manager.access(pid, rng.randrange(pages)))
+    return results
+
+
+@pytest.mark.parametrize("overrides", [
+    {"replacement_algorithm": name} for name in Config.REPLACEMENT_ALGORITHMS
+] + [
+    {"paging": "demand", "page_table": "radix"},
+    {"page_table": "inverted", "prefetch": "sequential"},
+    {"huge_pages": "always", "huge_page_size_kb": 32},
+])
+@pytest.mark.parametrize("use_mmap", [False, True])
+def test_la_instantanea_restaurada_responde_igual(tmp_path, make_config, overrides, use_mmap):
+    manager = create_memory_manager(make_config(**GEOMETRY, **overrides))
+    rng = random.Random(8)
+    live = []
+    run(manager, rng, 2000, live)
+    path = tmp_path / "estado.snap"
+    save_snapshot(manager, str(path), {"live": live})
+
+    saved_metrics = manager.get_metrics_dict()
+    state = rng.getstate()
+    expected = run(manager, rng, 2000, list(live))
+
+    # La restauración devuelve también el contador de PID, así que el
+    # gestor restaurado asigna los mismos PID que el original
+    restored, metadata = load_snapshot(str(path), use_mmap=use_mmap)
+    assert [tuple(item) for item in metadata["live"]] == live
+    assert restored.get_metrics_dict() == saved_metrics
+    rng.setstate(state)
+    assert run(restored, rng, 2000, list(live)) == expected
+    assert restored.get_metrics_dict() == manager.get_metrics_dict()
+
+
+def test_restaurar_con_otro_reemplazo(tmp_path, make_config):
+    manager = create_memory_manager(make_config(**GEOMETRY))
+    run(manager, random.Random(1), 500, [])
+    path = tmp_path / "estado.snap"
+    save_snapshot(manager, str(path))
+    restored, _ = load_snapshot(str(path), make_config(**GEOMETRY, replacement_algorithm="lru"))
+    assert restored.replacement.name == "LRU"
+    assert restored.get_metrics_dict()["ram_used"] == manager.get_metrics_dict()["ram_used"]
+
+
+def test_geometria_incompatible_o_no_soportada(tmp_path, make_config):
+    manager = create_memory_manager(make_config(**GEOMETRY))
+    path = tmp_path / "estado.snap"
+    save_snapshot(manager, str(path))
+    with pytest.raises(ValueError):
+        load_snapshot(str(path), make_config(**dict(GEOMETRY, ram_size_kb=4 * 32)))
+    with pytest.raises(ValueError):
+        save_snapshot(create_memory_manager(make_config(engine="arrays")), str(path))
@@ -0,0 +1,57 @@
+import random
+
+import pytest
+
+from memory_manager import create_memory_manager
+from replay import replay
+from stack_distance import StackDistanceAnalyzer
+from trace_reader import OP_ACCESS, OP_CREATE, OP_TERMINATE
+
+PAGE_SIZE_KB = 4
+
+
+def make_trace(seed=6):
+    rng = random.Random(seed)
+    events = [(OP_CREATE, 1, PAGE_SIZE_KB * 30), (OP_CREATE, 2, PAGE_SIZE_KB * 20)]
+    for step in range(3000):
+        if step == 1500:
+            events.append((OP_TERMINATE, 2, 0))
+            events.append((OP_CREATE, 3, PAGE_SIZE_KB * 25))
+        pid = rng.choice((1, 3) if step >= 1500 else (1, 2))
+        # Localidad: la mitad de los accesos van a unas pocas páginas
+        page = rng.randrange(6) if rng.random() < 0.5 else rng.randrange(20)
+        events.append((OP_ACCESS, pid, page))
+    return events
+
+
+@pytest.mark.parametrize("paging", ["eager", "demand"])
+def test_la_curva_coincide_con_la_simulacion_lru(make_config, paging):
+    events = make_trace()
+    analyzer = StackDistanceAnalyzer(PAGE_SIZE_KB, demand_paging=paging == "demand")
+    analyzer.process(events)
+    sizes = [4, 8, 16, 32, 48]
+    curve = {point.frames: point for point in analyzer.curve(sizes)}
+    for frames in sizes:
+        manager = create_memory_manager(make_config(
+            replacement_algorithm="lru", paging=paging, page_size_kb=PAGE_SIZE_KB,
+            ram_size_kb=frames * PAGE_SIZE_KB, swap_size_kb=PAGE_SIZE_KB * 256,
+        ))
+        replay(manager, events)
+        metrics = manager.get_metrics_dict()
+        assert curve[frames].page_faults == metrics["page_faults"], frames
+        if paging == "demand":
+            assert analyzer.cold_misses == metrics["minor_faults"]
+
+
+def test_la_curva_de_tlb_coincide_con_una_tlb_lru(make_config):
+    events = make_trace()
+    analyzer = StackDistanceAnalyzer(PAGE_SIZE_KB)
+    analyzer.process(events)
+    for size in (2, 4, 8):
+        manager = create_memory_manager(make_config(
+            tlb_size=size, tlb_policy="lru", page_size_kb=PAGE_SIZE_KB,
+            ram_size_kb=PAGE_SIZE_KB * 128, swap_size_kb=PAGE_SIZE_KB * 128,
+        ))
+        replay(manager, events)
+        point = next(analyzer.curve([size]))
+        assert point.tlb_hit_ratio == pytest.approx(manager.get_metrics_dict()["tlb_hit_ratio"])
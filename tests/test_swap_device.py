@@ -0,0 +1,32 @@
+from swap_device import MmapSwapDevice
+
+
+def page(value, size=64):
+    return bytes([value]) * size
+
+
+def test_el_lote_no_supera_la_mitad_de_las_ranuras():
+    device = MmapSwapDevice(None, 16, 64, writeback_batch=32)
+    try:
+        assert device.writeback_batch == 8
+        for slot in range(8):
+            device.write(slot, page(slot))
+        device.flush()
+        assert device.batches == 1
+        assert device.pages_written == 8
+        assert device.read(3) == page(3)
+    finally:
+        device.close()
+
+
+def test_las_lecturas_desde_la_cola_cuentan_como_leidas():
+    device = MmapSwapDevice(None, 16, 64, writeback_batch=8)
+    try:
+        device.write(0, page(1))
+        assert device.read(0) == page(1)
+        assert device.pending_reads == 1
+        assert device.cancelled_writes == 1
+        assert device.pages_read == 1
+        assert device.bytes_read == 64
+    finally:
+        device.close()
@@ -0,0 +1,31 @@
+import pytest
+
+from config import Config
+from memory_manager import create_memory_manager
+
+
+@pytest.mark.parametrize("engine", Config.ENGINES)
+@pytest.mark.parametrize("algorithm", ["fifo", "lru", "clock", "lfu"])
+def test_un_proceso_que_no_cabe_no_deja_paginas_fuera_del_reemplazo(make_config, engine, algorithm):
+    manager = create_memory_manager(make_config(
+        engine=engine, replacement_algorithm=algorithm, page_size_kb=4, ram_size_kb=4 * 4, swap_size_kb=4 * 4,
+    ))
+    first = manager.new_process(4 * 6)
+    manager.load_process(first)
+    # El segundo proceso llena la Swap con dos páginas del primero y su
+    # tercera página ya no cabe
+    second = manager.new_process(4 * 8)
+    with pytest.raises(MemoryError):
+        manager.load_process(second)
+    manager.remove_process(second.pid)
+    metrics = manager.get_metrics_dict()
+    assert (metrics["ram_used"], metrics["swap_used"]) == (2, 4)
+
+    # Todas las páginas residentes siguen siendo candidatas: los fallos
+    # siguientes encuentran víctima sin errores
+    for page in list(range(6)) * 3:
+        manager.access(first.pid, page)
+    third = manager.new_process(4 * 2)
+    manager.load_process(third)
+    metrics = manager.get_metrics_dict()
+    assert (metrics["ram_used"], metrics["swap_used"]) == (4, 4)
@@ -0,0 +1,60 @@
+import csv
+import json
+
+import sweep as sweep_module
+from memory_manager import create_memory_manager
+from replay import replay
+from sweep import RESULT_FIELDS, expand_grid, sweep, write_results
+from trace_reader import BINARY_MAGIC, read_trace
+
+GRID = {"ram_size_kb": [1024, 2048], "replacement_algorithm": ["fifo", "lru"]}
+TRACE = "C 1 4096\nC 2 2048\n" + "".join(f"A {1 + i % 2} {(i * 7) % 16}\n" for i in range(400)) + "T 2\n"
+
+
+def test_barrido_pequeno_en_orden_de_rejilla(tmp_path, monkeypatch, make_config):
+    trace = tmp_path / "traza.txt"
+    trace.write_text(TRACE, encoding="utf-8")
+    converted = []
+    convert = sweep_module.convert_text_to_binary
+
+    def spy(src, dst):
+        count = convert(src, dst)
+        with open(dst, "rb") as fh:
+            converted.append((src, fh.read(len(BINARY_MAGIC))))
+        return count
+
+    monkeypatch.setattr(sweep_module, "convert_text_to_binary", spy)
+    rows = sweep("", GRID, str(trace), workers=1)
+
+    assert converted == [(str(trace), BINARY_MAGIC)]
+    points = list(expand_grid(GRID))
+    assert [{name: row[name] for name in GRID} for row in rows] == points
+    for row, point in zip(rows, points):
+        assert set(RESULT_FIELDS) <= set(row)
+        manager = create_memory_manager(make_config(**point))
+        stats = replay(manager, read_trace(str(trace)))
+        metrics = manager.get_metrics_dict()
+        assert (row["accesses"], row["invalid_events"]) == (stats.accesses, stats.invalid_events)
+        assert (row["page_faults"], row["swaps_in"], row["swaps_out"]) == (
+            metrics["page_faults"], metrics["swaps_in"], metrics["swaps_out"],
+        )
+
+
+def test_write_results_en_csv_y_json(tmp_path):
+    rows = [
+        dict(ram_size_kb=1024, **{name: index for index, name in enumerate(RESULT_FIELDS)}),
+        dict(ram_size_kb=2048, tlb_size=8, **{name: 0 for name in RESULT_FIELDS}),
+    ]
+    json_path = tmp_path / "resultados.json"
+    write_results(rows, str(json_path))
+    assert json.loads(json_path.read_text(encoding="utf-8")) == rows
+
+    csv_path = tmp_path / "resultados.csv"
+    write_results(rows, str(csv_path))
+    with open(csv_path, encoding="utf-8", newline="") as fh:
+        reader = csv.DictReader(fh)
+        assert reader.fieldnames == ["ram_size_kb", "tlb_size", *RESULT_FIELDS]
+        read = list(reader)
+    assert [row["ram_size_kb"] for row in read] == ["1024", "2048"]
+    assert read[0]["tlb_size"] == "" and read[1]["tlb_size"] == "8"
+    assert read[0]["wall_time_s"] == str(RESULT_FIELDS.index("wall_time_s"))
@@ -0,0 +1,43 @@
+import random
+
+import pytest
+
+from config import Config
+from memory_manager import create_memory_manager
+
+
+@pytest.mark.parametrize("engine", Config.ENGINES)
+@pytest.mark.parametrize("algorithm", Config.REPLACEMENT_ALGORITHMS)
+def test_terminar_un_proceso_libera_marcos_swap_y_tlb(make_config, engine, algorithm):
+    manager = create_memory_manager(make_config(
+        engine=engine, replacement_algorithm=algorithm, page_size_kb=4, ram_size_kb=4 * 16, swap_size_kb=4 * 64,
+    ))
+    rng = random.Random(3)
+    first = manager.new_process(4 * 24)
+    manager.load_process(first)
+    second = manager.new_process(4 * 24)
+    manager.load_process(second)
+    for _ in range(300):
+        process = rng.choice((first, second))
+        manager.access(process.pid, rng.randrange(24))
+
+    manager.remove_process(first.pid)
+    metrics = manager.get_metrics_dict()
+    assert metrics["ram_used"] + metrics["swap_used"] == 24
+    assert all(pid != first.pid for pid, _, _ in manager.tlb.entries())
+
+    # Las páginas del proceso terminado ya no son candidatas a la expulsión
+    third = manager.new_process(4 * 24)
+    manager.load_process(third)
+    for _ in range(300):
+        process = rng.choice((second, third))
+        manager.access(process.pid, rng.randrange(24))
+    metrics = manager.get_metrics_dict()
+    assert metrics["ram_used"] == 16
+    assert metrics["ram_used"] + metrics["swap_used"] == 48
+
+    manager.remove_process(second.pid)
+    manager.remove_process(third.pid)
+    metrics = manager.get_metrics_dict()
+    assert metrics["ram_used"] == metrics["swap_used"] == 0
+    assert len(manager.tlb) == 0
@@ -0,0 +1,112 @@
+import random
+
+import pytest
+
+from config import Config
+from memory_manager import create_memory_manager
+from tlb import TLB
+
+
+def test_lru_expulsa_la_menos_usada():
+    tlb = TLB(2, "lru")
+    tlb.insert(1, 0, 10)
+    tlb.insert(1, 1, 11)
+    assert tlb.lookup(1, 0) == 10
+    tlb.insert(1, 2, 12)
+    assert tlb.lookup(1, 1) is None
+    assert tlb.lookup(1, 0) == 10
+    assert tlb.lookup(1, 2) == 12
+
+
+def test_fifo_no_promueve_los_aciertos():
+    tlb = TLB(2, "fifo")
+    tlb.insert(1, 0, 10)
+    tlb.insert(1, 1, 11)
+    assert tlb.lookup(1, 0) == 10
+    tlb.insert(1, 2, 12)
+    assert tlb.lookup(1, 0) is None
+    assert tlb.lookup(1, 1) == 11
+
+
+def test_asociativa_por_conjuntos_reemplaza_dentro_del_conjunto():
+    tlb = TLB(4, "lru", ways=2)
+    assert tlb.num_sets == 2
+    # Las páginas pares van al conjunto 0 y las impares al 1
+    for page in (0, 2, 4):
+        tlb.insert(1, page, page)
+    tlb.insert(1, 1, 1)
+    assert tlb.lookup(1, 0) is None
+    assert tlb.lookup(1, 2) == 2
+    assert tlb.lookup(1, 4) == 4
+    assert tlb.lookup(1, 1) == 1
+
+
+def test_capacidad_no_multiplo_de_las_vias():
+    with pytest.raises(ValueError):
+        TLB(6, "lru", ways=4)
+
+
+def test_flush_pid_solo_vacia_ese_proceso():
+    tlb = TLB(8, "random", ways=2, seed=1)
+    for page in range(3):
+        tlb.insert(1, page, page)
+        tlb.insert(2, page, 10 + page)
+    assert tlb.flush_pid(1) == 3
+    assert all(tlb.lookup(1, page) is None for page in range(3))
+    assert [tlb.lookup(2, page) for page in range(3)] == [10, 11, 12]
+    assert tlb.invalidate(2, 0)
+    assert not tlb.invalidate(2, 0)
+
+
+def test_export_y_restore_conservan_el_orden():
+    tlb = TLB(4, "lru", ways=2)
+    for page in range(4):
+        tlb.insert(1, page, page)
+    tlb.lookup(1, 0)
+    copy = TLB(4, "lru", ways=2)
+    copy.restore_state(tlb.export_state())
+    tlb.insert(1, 6, 6)
+    copy.insert(1, 6, 6)
+    assert [tlb.lookup(1, p) for p in range(8)] == [copy.lookup(1, p) for p in range(8)]
+
+
+def test_config_ini_descarta_vias_que_no_dividen_el_tamano(tmp_path):
+    path = tmp_path / "config.ini"
+    path.write_text("[TLB]\nSIZE = 6\nWAYS = 4\n", encoding="utf-8")
+    values = Config(str(path)).values
+    assert values.tlb_size == 6
+    assert values.tlb_ways == 0
+
+
+def test_config_ini_acepta_los_nombres_antiguos_de_la_tlb(tmp_path):
+    path = tmp_path / "config.ini"
+    path.write_text("[TLB]\nTLB_SIZE = 8\nTLB_POLICY = fifo\nWAYS = 2\n", encoding="utf-8")
+    values = Config(str(path)).values
+    assert (values.tlb_size, values.tlb_policy, values.tlb_ways) == (8, "fifo", 2)
+
+
+def tlb_contents(manager, cpus):
+    tlbs = [cpu.tlb for cpu in manager.cpus] if cpus > 1 else [manager.tlb]
+    return [sorted((page, frame) for _, page, frame in tlb.entries()) for tlb in tlbs]
+
+
+@pytest.mark.parametrize("cpus", [1, 2])
+def test_la_tlb_random_usa_la_semilla_del_reemplazo(make_config, cpus):
+    def run(seed):
+        manager = create_memory_manager(make_config(tlb_policy="random", replacement_seed=seed, cpus=cpus))
+        process = manager.new_process(4096)
+        manager.load_process(process)
+        rng = random.Random(0)
+        for step in range(600):
+            if cpus > 1:
+                manager.bind_cpu(step % cpus)
+            manager.access(process.pid, rng.randrange(process.pages_needed))
+        return tlb_contents(manager, cpus), manager.get_metrics_dict()["tlb_hits"]
+
+    assert run(3) == run(3)
+
+
+def test_las_sustituciones_rechazan_vias_que_no_dividen_el_tamano():
+    with pytest.raises(ValueError):
+        Config("", {"tlb_size": 6, "tlb_ways": 4})
+    assert Config("", {"tlb_size": 8, "tlb_ways": 4}).values.tlb_ways == 4
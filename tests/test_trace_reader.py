@@ -0,0 +1,69 @@
+import gzip
+
+import pytest
+
+from trace_reader import (
+    BINARY_MAGIC, OP_ACCESS, OP_CREATE, OP_TERMINATE, TraceFormatError, batched, convert_text_to_binary,
+    read_binary_batches, read_trace, write_binary_trace,
+)
+
+TEXT = "# traza de prueba\nC 1 64\n\nA 1 3\n1 4\nT 1\n"
+EVENTS = [(OP_CREATE, 1, 64), (OP_ACCESS, 1, 3), (OP_ACCESS, 1, 4), (OP_TERMINATE, 1, 0)]
+
+
+def test_lee_texto_plano_y_gzip(tmp_path):
+    plain = tmp_path / "traza.txt"
+    plain.write_text(TEXT, encoding="utf-8")
+    packed = tmp_path / "traza.txt.gz"
+    with gzip.open(packed, "wt", encoding="utf-8") as fh:
+        fh.write(TEXT)
+    assert list(read_trace(str(plain))) == EVENTS
+    assert list(read_trace(str(packed))) == EVENTS
+
+
+def test_linea_invalida(tmp_path):
+    path = tmp_path / "traza.txt"
+    path.write_text("C 1\n", encoding="utf-8")
+    with pytest.raises(TraceFormatError):
+        list(read_trace(str(path)))
+
+
+def test_binario_ida_y_vuelta_por_bloques(tmp_path):
+    events = [(OP_ACCESS, pid % 3, page) for pid, page in enumerate(range(1000))]
+    path = tmp_path / "traza.bin"
+    assert write_binary_trace(events, str(path), batch_size=64) == len(events)
+    assert list(read_trace(str(path))) == events
+    sizes = [len(batch) // 3 for batch in read_binary_batches(str(path), batch_size=300)]
+    assert sizes == [300, 300, 300, 100]
+
+
+def test_convierte_texto_a_binario(tmp_path):
+    src = tmp_path / "traza.txt"
+    src.write_text(TEXT, encoding="utf-8")
+    dst = tmp_path / "traza.bin"
+    assert convert_text_to_binary(str(src), str(dst)) == len(EVENTS)
+    assert list(read_trace(str(dst))) == EVENTS
+
+
+def test_binario_truncado_o_fuera_de_rango(tmp_path):
+    path = tmp_path / "traza.bin"
+    path.write_bytes(BINARY_MAGIC + b"\x00" * 5)
+    with pytest.raises(TraceFormatError):
+        list(read_trace(str(path)))
+    with pytest.raises(TraceFormatError):
+        write_binary_trace([(OP_ACCESS, -1, 0)], str(path))
+
+
+def test_batched_respeta_el_tamano():
+    assert [len(batch) for batch in batched(range(10), 4)] == [4, 4, 2]
+
+
+def test_un_error_al_escribir_no_deja_la_traza_a_medias(tmp_path):
+    path = tmp_path / "traza.bin"
+    write_binary_trace(EVENTS, str(path))
+    original = path.read_bytes()
+    events = [(OP_ACCESS, 1, page) for page in range(100)] + [(OP_ACCESS, 1, 2 ** 32)]
+    with pytest.raises(TraceFormatError):
+        write_binary_trace(events, str(path), batch_size=10)
+    assert path.read_bytes() == original
+    assert [entry.name for entry in tmp_path.iterdir()] == ["traza.bin"]